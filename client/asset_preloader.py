@@ -0,0 +1,80 @@
+from typing import Callable, Union
+
+from panda3d.core import NodePath
+
+from common.collision.safe_space import SAFE_SPACE_MODEL_PATH
+from common.objects.bolt import BOLT_MODEL_PATH
+from common.objects.cloud_factory import CLOUD_MODEL_PATH
+from common.objects.flag import FLAG_MODEL_PATH
+from common.tiles.tile_controller import TILE_MODELS, get_tile_model_path
+from common.tiles.tile_model_cache import TileModelCache
+from common.tiles.tile_node_path_factory import PLAYERS_COUNT, get_player_model_path
+
+SEASONS = [0, 1]
+
+
+class AssetPreloader:
+    """
+    Loads every model the game may need in the background, while the player logs in and waits for
+    a room - tiles of both seasons, players and effects. Tiles go to the tile model cache, the rest
+    stays in the model pool of panda, so that later loads of the same files are only copies and
+    setting up a map does not stall a frame on the disk.
+    """
+    # requests given to the loader at once, the next one is sent when one of them is done
+    IN_FLIGHT = 4
+
+    def __init__(self, loader, tile_models: TileModelCache):
+        self.loader = loader
+        self.tile_models = tile_models
+        # (model path, tile name and season or None for models which are not tiles)
+        self.__pending: list[tuple[str, Union[tuple[str, int], None]]] = \
+            [(get_tile_model_path(name, season), (name, season)) for season in SEASONS for name in TILE_MODELS] + \
+            [(get_player_model_path(player_id), None) for player_id in range(PLAYERS_COUNT)] + \
+            [(path, None) for path in [CLOUD_MODEL_PATH, BOLT_MODEL_PATH, FLAG_MODEL_PATH, SAFE_SPACE_MODEL_PATH]]
+        self.total = len(self.__pending)
+        self.loaded = 0
+        # models which are not tiles, kept so that they stay in the model pool
+        self.models: list[NodePath] = []
+        self.__progress_handler: Callable[[int, int], None] = lambda loaded, total: None
+        self.__done_handlers: list[Callable[[], None]] = []
+
+    def start(self):
+        for _ in range(min(self.IN_FLIGHT, len(self.__pending))):
+            self.__request_next()
+
+    def is_done(self) -> bool:
+        return self.loaded == self.total
+
+    def on_progress(self, handler: Callable[[int, int], None]):
+        """ handler gets the number of loaded models and of all models after every model """
+        self.__progress_handler = handler
+        handler(self.loaded, self.total)
+
+    def when_done(self, handler: Callable[[], None]):
+        if self.is_done():
+            handler()
+        else:
+            self.__done_handlers.append(handler)
+
+    def __request_next(self):
+        path, tile = self.__pending.pop(0)
+        self.loader.load_model(path, callback=lambda model: self.__loaded(model, tile))
+
+    def __loaded(self, model: Union[NodePath, None], tile: Union[tuple[str, int], None]):
+        if model is None:
+            # loaded again when it is needed, which reports the error
+            print("[WARN] Model could not be preloaded")
+        elif tile is not None:
+            self.tile_models.add_model(*tile, model)
+        else:
+            self.models.append(model)
+
+        self.loaded += 1
+        if self.__pending:
+            self.__request_next()
+        self.__progress_handler(self.loaded, self.total)
+        if self.is_done():
+            print(f"[INFO] {self.total} models preloaded")
+            for handler in self.__done_handlers:
+                handler()
+            self.__done_handlers = []
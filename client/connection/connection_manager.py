@@ -6,9 +6,11 @@ import panda3d.core as p3d
 from direct.showbase.DirectObject import DirectObject
 from direct.task.TaskManagerGlobal import taskMgr
 
+from client.connection.map_cache import MapCache
 from common.connection.udp_connection_thread import UDPConnectionThread
 from common.state.game_config import GameConfig
 from common.state.player_state_diff import PlayerStateDiff
+from common.tiles.map_codec import decode_map
 from common.transfer.network_transfer import NetworkTransfer
 from common.transfer.network_transfer_builder import NetworkTransferBuilder
 from common.typings import Address, Messages
@@ -24,6 +26,7 @@ class ConnectionManager(DirectObject):
         # set up class fields
         self.__network_transfer_builder = NetworkTransferBuilder()
         self.__ready_handler = lambda _: False
+        self.__map_cache = MapCache()
 
         # initialize UDP thread
         self.__udp_connection = UDPConnectionThread(server_address[0], 0)
@@ -52,6 +55,8 @@ class ConnectionManager(DirectObject):
             self.__network_transfer_builder.set_destination(self.__server_address)
             self.__network_transfer_builder.add("type", Messages.FIND_ROOM)
             self.__network_transfer_builder.add("username", username)
+            # the server leaves the map out if it is one of these
+            self.__network_transfer_builder.add("map_hashes", ",".join(self.__map_cache.hashes()))
             self.__udp_connection.enqueue_transfer(self.__network_transfer_builder.encode())
             taskMgr.do_method_later(2, wait, 'wait for room')
 
@@ -164,5 +169,16 @@ class ConnectionManager(DirectObject):
             return
         game_config = GameConfig.empty()
         game_config.restore(transfer)
+        if not transfer.has("gctiles"):
+            encoded_tiles = self.__map_cache.load(game_config.map_hash)
+            if encoded_tiles is None:
+                # gone from the cache since the request, the next one goes without its hash
+                print("[INFO] Map not in cache anymore, waiting for the server to send it")
+                return
+            game_config.encoded_tiles = encoded_tiles
+            game_config.tiles = decode_map(encoded_tiles, game_config.size)
+            print("[INFO] Map taken from cache")
+        else:
+            self.__map_cache.save(game_config.map_hash, game_config.encoded_tiles)
         self.__ready_handler(game_config)
         self.__room_found = True
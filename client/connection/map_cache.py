@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+from typing import Union
+
+from common.tiles.map_codec import get_map_hash
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "map_cache"
+
+
+class MapCache:
+    """
+    Encoded maps received from servers, a file per map named by its hash. Hashes of the most
+    recently used maps go with FIND_ROOM, so that the server sends a map only when it is not here.
+    """
+    # hashes sent with FIND_ROOM, the oldest maps over it are removed
+    MAX_MAPS = 32
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = path
+
+    def hashes(self) -> list[str]:
+        """ most recently used first """
+        try:
+            entries = [(entry.stat().st_mtime, entry.stem) for entry in self.path.iterdir() if entry.suffix == ".map"]
+        except OSError:
+            return []
+        return [map_hash for _, map_hash in sorted(entries, reverse=True)[:self.MAX_MAPS]]
+
+    def load(self, map_hash: str) -> Union[bytes, None]:
+        path = self.path / f"{map_hash}.map"
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        if get_map_hash(data) != map_hash:
+            # damaged, the server will send the map again
+            path.unlink(missing_ok=True)
+            return None
+        return data
+
+    def save(self, map_hash: str, data: bytes):
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            temporary_path = self.path / f"{map_hash}.{os.getpid()}.tmp"
+            temporary_path.write_bytes(data)
+            os.replace(temporary_path, self.path / f"{map_hash}.map")
+        except OSError as e:
+            print(f"[WARN] Could not cache the map: {e}")
+            return
+        self.__evict()
+
+    def __evict(self):
+        entries = sorted((entry.stat().st_mtime, entry) for entry in self.path.iterdir() if entry.suffix == ".map")
+        for _, entry in entries[:-self.MAX_MAPS]:
+            entry.unlink(missing_ok=True)
@@ -4,7 +4,9 @@ from direct.showbase.ShowBaseGlobal import aspect2d
 import panda3d.core as p3d
 import simplepbr
 
+from common.bam_loader import BamLoader
 from common.collision.collision_builder import CollisionBuilder
+from common.tiles.tile_model_cache import TileModelCache
 from common.typings import Input, SupportsCollisionRegistration
 
 
@@ -31,12 +33,16 @@ class Game(ShowBase):
         self.render.set_light(point_light_node1)
         self.render.set_light(point_light_node2)
 
-        self.__collision_builder = CollisionBuilder(self.get_render(), self.get_loader())
+        # models are loaded from .bam files baked from the glTF ones
+        self.models_loader = BamLoader(self.loader)
+        self.tile_models = TileModelCache(self.get_loader())
+        self.__collision_builder = CollisionBuilder(self.get_render(), self.get_loader(), self.tile_models)
 
     def add_colliders_from(self, obj: SupportsCollisionRegistration):
         self.__collision_builder.add_colliders_from(obj)
 
     def setup_map(self, tiles, map_size, season):
+        self.tile_models.prefetch(season)
         self.__collision_builder.add_tile_colliders(tiles, season)
         self.__collision_builder.add_safe_spaces(map_size)
 
@@ -57,7 +63,7 @@ class Game(ShowBase):
         self.accept("space-up", bullet_handler)
 
     def get_loader(self):
-        return self.loader
+        return self.models_loader
 
     def get_render(self):
         return self.render
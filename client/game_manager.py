@@ -16,7 +16,6 @@ from common.objects.cloud_factory import CloudFactory
 from common.objects.flag import Flag
 from common.state.game_state_diff import GameStateDiff
 from common.state.player_state_diff import PlayerStateDiff
-from common.tiles.tile_controller import create_new_tile
 from common.player.player_controller import PlayerController
 from common.tiles.tile_node_path_factory import TileNodePathFactory
 from common.transfer.network_transfer import NetworkTransfer
@@ -60,10 +59,12 @@ class GameManager:
         self.__bullet_factory = BulletFactory(self.__game.get_render())
         self.__bullets: list[Bullet] = []
 
-        self.__flag = Flag(self.__game)
+        self.__flag = Flag(self.__loader, self.__game.get_render())
 
         self.__bolts_set_up = False
         self.__bolt_factory = BoltFactory(self.__loader, self.__game.get_render())
+        # clouds of all players come from one pool
+        self.__cloud_factory = CloudFactory(self.__loader, self.__game.get_render())
 
         self.__game_has_started = False
         self.__node_path_factory = node_path_factory
@@ -78,7 +79,7 @@ class GameManager:
             player_state,
         )
         player.sync_position()
-        player.set_cloud_factory(CloudFactory(self.__loader, self.__game.get_render()))
+        player.set_cloud_factory(self.__cloud_factory)
         self.__game.taskMgr.do_method_later(0.05, player.task_emit_cloud, 'emit cloud')
 
         self.__game_state.player_state[player_state.id] = player_state
@@ -211,7 +212,7 @@ class GameManager:
 
     def update_bolts(self, old_bolt_id, new_bolt):
         self.__bolt_factory.remove_bolt(old_bolt_id)
-        self.__bolt_factory.copy_bolts([new_bolt])
+        self.__bolt_factory.undump_bolts(new_bolt)
 
     def player_flag_pickup(self, player_id):
         player = self.__players[player_id]
@@ -1,8 +1,10 @@
 import time
+from typing import Union
 from direct.task.TaskManagerGlobal import taskMgr
 from direct.showbase.ShowBaseGlobal import globalClock
 from panda3d.core import ClockObject, load_prc_file_data
 
+from client.asset_preloader import AssetPreloader
 from client.game import Game
 from client.game_manager import GameManager
 from client.connection.connection_manager import ConnectionManager
@@ -41,12 +43,18 @@ class Client:
         self.__connection_manager.on(Messages.PLAYER_DROPPED_FLAG, self.__game_manager.player_flag_drop)
 
         self.__expected_players = 1
+        # players which joined before the game was set up
+        self.__pending_players: Union[list[PlayerStateDiff], None] = None
 
         # show login screen that waits for user to input username and starts the game afterward
         self.login_screen = LoginScreen(self.__loader, self.__start)
         self.waiting_screen = WaitingScreen(self.__loader)
         self.end_screen = EndScreen(self.__loader)
 
+        # models are loaded in the background while the player logs in and waits for a room
+        self.__preloader = AssetPreloader(self.__loader, self.__game.tile_models)
+        self.__preloader.start()
+
     def run_game(self):
         self.__game.run()
 
@@ -58,6 +66,13 @@ class Client:
         self.__expected_players = game_config.expected_players
         self.login_screen.hide()
         print(game_config.size)
+        if not self.__preloader.is_done():
+            self.__pending_players = []
+            self.waiting_screen.display()
+            self.__preloader.on_progress(self.waiting_screen.set_progress)
+        self.__preloader.when_done(lambda: self.__setup_game(game_config))
+
+    def __setup_game(self, game_config: GameConfig):
         self.__game_manager.setup_map(game_config.tiles, game_config.size, game_config.season)
         for state in game_config.player_states:
             player = self.__game_manager.setup_player(state)
@@ -65,16 +80,28 @@ class Client:
                 self.__game_manager.set_main_player(player)
         if self.__game_manager.get_active_players_count() < self.__expected_players:
             self.waiting_screen.display()
+            self.waiting_screen.update(self.__game_manager.get_active_players_count(), self.__expected_players)
         else:
+            self.waiting_screen.hide()
             self.__game.set_input_handler(self.__handle_input)
             self.__game.set_bullet_handler(self.__handle_bullet)
             self.__game_manager.set_game_has_started()
 
+        pending_players, self.__pending_players = self.__pending_players, None
+        for player_state in pending_players or []:
+            self.__new_player_handler(player_state)
+
     def __game_state_change(self, game_state_transfer: NetworkTransfer):
+        if self.__pending_players is not None:
+            # the game is not set up yet, the next state brings the same players
+            return
         self.__game_manager.queue_server_game_state(game_state_transfer)
 
     def __new_player_handler(self, player_state: PlayerStateDiff):
         print("[INFO] New player {}".format(player_state.username))
+        if self.__pending_players is not None:
+            self.__pending_players.append(player_state)
+            return
         self.__game_manager.setup_player(player_state)
         active_players_count = self.__game_manager.get_active_players_count()
         if active_players_count >= self.__expected_players:
@@ -15,15 +15,22 @@ class WaitingScreen:
         self.text.setAlign(TextNode.ACenter)
 
     def display(self):
+        if self.is_displayed:
+            return
         self.is_displayed = True
         self.textNodePath = aspect2d.attachNewNode(self.text)
         self.textNodePath.setScale(0.07)
         self.textNodePath.setPos(Vec3(0, 0))
 
     def hide(self):
+        if not self.is_displayed:
+            return
         self.is_displayed = False
         self.textNodePath.removeNode()
 
     def update(self, active_players, expected_players):
         player_count_text = f"{active_players}/{expected_players}"
         self.text.setText(f"Waiting for other players...\n{player_count_text}")
+
+    def set_progress(self, loaded, total):
+        self.text.setText(f"Loading models...\n{loaded}/{total}")
@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sys
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Union
+
+import panda3d.core as p3d
+from direct.task.TaskManagerGlobal import taskMgr
+from panda3d.core import NodePath
+
+MODELS_PATH = Path(__file__).parent / "assets" / "models"
+BAM_CACHE_PATH = Path(__file__).parent / "assets" / "bam_cache"
+# models are asked for by paths like ../common/assets/models/summer/full_1.glb
+MODELS_PREFIX = "assets/models/"
+
+
+class BamLoader:
+    """
+    Loads models from .bam files baked from the .glb files in common/assets/models, so that glTF is
+    parsed and converted only once per model instead of on every load. A baked model is named after
+    its source and the hash of its contents - summer/full_1.<hash>.bam. A model which is not baked yet
+    is loaded from its .glb, asynchronously too, and a copy of the loaded model is written out as its
+    .bam later - one model a frame, while no asynchronous load is running - so a load never waits for
+    baking and baking does not compete with the loader thread. The stale file of a changed model is
+    removed then. Anything else goes to the wrapped loader.
+    """
+    HASH_LENGTH = 16
+
+    def __init__(self, loader, cache_path: Path = BAM_CACHE_PATH):
+        self.loader = loader
+        self.cache_path = cache_path
+        # source file -> (mtime, size, hash), so that a file is not read again until it changes
+        self.__hashes: dict[Path, tuple[int, int, str]] = {}
+        # file every model is loaded from - decided on its first load and kept for the session,
+        # so that later loads are copies from the model pool even if the model got baked meanwhile
+        self.__files: dict[str, Union[str, p3d.Filename]] = {}
+        # baked files waiting to be written from the first load of their models
+        self.__baking: set[Path] = set()
+        self.__writes: deque[tuple[NodePath, Path, Path]] = deque()
+        self.__loading = 0
+        self.baked = 0
+        self.hits = 0
+
+    def load_model(self, model_path: str, **kwargs) -> NodePath:
+        file = self.__get_file(model_path)
+        # not baked when this session started, written from the first load
+        bam_path = self.get_bam_path(model_path) if isinstance(file, str) else None
+        if bam_path is None or bam_path in self.__baking or bam_path.exists():
+            return self.loader.load_model(file, **kwargs)
+
+        self.__baking.add(bam_path)
+        source = self.get_source_path(model_path)
+        callback = kwargs.pop("callback", None)
+        if callback is None:
+            model = self.loader.load_model(file, **kwargs)
+            self.__queue_write(model, source, bam_path)
+            return model
+
+        def loaded(model):
+            self.__loading -= 1
+            self.__queue_write(model, source, bam_path)
+            callback(model)
+        self.__loading += 1
+        return self.loader.load_model(file, callback=loaded, **kwargs)
+
+    loadModel = load_model
+
+    def get_bam_path(self, model_path: Union[str, Path]) -> Union[Path, None]:
+        """ where the source model is baked to, the file may not exist yet; None for files outside of models """
+        source = self.get_source_path(model_path)
+        if source is None or source.suffix != ".glb" or not source.exists():
+            return None
+        relative = source.relative_to(MODELS_PATH)
+        return self.cache_path / relative.parent / f"{relative.stem}.{self.__get_hash(source)}.bam"
+
+    @staticmethod
+    def get_source_path(model_path: Union[str, Path]) -> Union[Path, None]:
+        _, prefix, relative = Path(model_path).as_posix().partition(MODELS_PREFIX)
+        return MODELS_PATH / relative if prefix else None
+
+    def bake_all(self) -> int:
+        """ bakes every model which is not baked yet, returns how many were baked """
+        baked = self.baked
+        for source in sorted(MODELS_PATH.rglob("*.glb")):
+            bam_path = self.get_bam_path(source)
+            if not bam_path.exists():
+                self.__bake(source, bam_path)
+        return self.baked - baked
+
+    def __get_file(self, model_path: str) -> Union[str, p3d.Filename]:
+        file = self.__files.get(model_path)
+        if file is not None:
+            return file
+
+        bam_path = self.get_bam_path(model_path)
+        if bam_path is not None and bam_path.exists():
+            self.hits += 1
+            file = p3d.Filename.from_os_specific(str(bam_path))
+        else:
+            file = model_path
+        self.__files[model_path] = file
+        return file
+
+    def __get_hash(self, source: Path) -> str:
+        stat = source.stat()
+        known = self.__hashes.get(source)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()[:self.HASH_LENGTH]
+        self.__hashes[source] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def __bake(self, source: Path, bam_path: Path):
+        # straight from the file, the model cache of panda would only keep another copy of it
+        options = p3d.LoaderOptions(p3d.LoaderOptions.LF_search | p3d.LoaderOptions.LF_report_errors |
+                                    p3d.LoaderOptions.LF_no_cache)
+        node = p3d.Loader.get_global_ptr().load_sync(p3d.Filename.from_os_specific(str(source)), options)
+        if node is None:
+            raise IOError(f"could not load model {source}")
+        self.__write(NodePath(node), source, bam_path)
+
+    def __queue_write(self, model: Union[NodePath, None], source: Path, bam_path: Path):
+        if model is None:
+            self.__baking.discard(bam_path)
+            return
+        # the loaded model is the caller's to change, a copy of it is written
+        self.__writes.append((model.copy_to(NodePath("bake")), source, bam_path))
+        if len(self.__writes) == 1:
+            taskMgr.add(self.__write_task, "bake models")
+
+    def __write_task(self, task):
+        if self.__loading > 0:
+            return task.cont
+        model, source, bam_path = self.__writes.popleft()
+        self.__write(model, source, bam_path)
+        self.__baking.discard(bam_path)
+        return task.cont if self.__writes else task.done
+
+    def __write(self, model: NodePath, source: Path, bam_path: Path):
+        bam_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in bam_path.parent.glob(f"{source.stem}.*.bam"):
+            stale.unlink(missing_ok=True)
+        # written aside and moved in place, a client and a server may bake the same model at once
+        handle, temporary = tempfile.mkstemp(suffix=".bam", dir=bam_path.parent)
+        os.close(handle)
+        try:
+            if not model.write_bam_file(p3d.Filename.from_os_specific(temporary)):
+                raise IOError(f"could not write {bam_path}")
+            os.replace(temporary, bam_path)
+        finally:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+        self.baked += 1
+
+    def __getattr__(self, name):
+        # fonts, textures and everything else the wrapped loader does
+        return getattr(self.loader, name)
+
+
+if __name__ == "__main__":
+    # bakes all models ahead of time, so that the first game does not do it
+    baked = BamLoader(None, Path(sys.argv[1]) if len(sys.argv) > 1 else BAM_CACHE_PATH).bake_all()
+    print(f"[INFO] {baked} models baked")
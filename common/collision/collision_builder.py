@@ -1,15 +1,19 @@
+from typing import Union
+
 import panda3d.core as p3d
 from panda3d.core import NodePath
 from common.collision.collision_object import CollisionObject
 from common.collision.safe_space import SafeSpace
-from common.tiles.tile_controller import create_new_tile, get_collision_shapes
+from common.tiles.tile_controller import get_collision_shapes
+from common.tiles.tile_model_cache import TileModelCache
 from common.typings import SupportsCollisionRegistration
 
 
 class CollisionBuilder:
-    def __init__(self, render, loader):
+    def __init__(self, render, loader, tile_models: Union[TileModelCache, None] = None):
         self.render = render
         self.loader = loader
+        self.tile_models = tile_models if tile_models is not None else TileModelCache(loader)
         self.cTrav = p3d.CollisionTraverser()
         self.pusher = p3d.CollisionHandlerPusher()
         self.pusher.setHorizontal(True)
@@ -27,8 +31,8 @@ class CollisionBuilder:
     def add_tile_colliders(self, tiles, season):
         tiles_parent = NodePath("tiles")
         for tile_data in tiles:
-            tile = create_new_tile(self.loader, tile_data["node_path"], tile_data["pos"], tile_data["heading"], season)
-            tile.reparent_to(tiles_parent)
+            tile = self.tile_models.place(tiles_parent, tile_data["node_path"], tile_data["pos"],
+                                          tile_data["heading"], season)
             self.__tile_colliders.append(
                 CollisionObject(
                     tile,
@@ -1,6 +1,8 @@
 import panda3d.core as p3d
 from common.collision.collision_object import CollisionObject
 
+SAFE_SPACE_MODEL_PATH = "../common/assets/models/safe_space.glb"
+
 
 class SafeSpace(CollisionObject):
     def __init__(self, render, i, map_size, loader):
@@ -12,7 +14,7 @@ class SafeSpace(CollisionObject):
             [p3d.CollisionSphere((map_size - 3) * 2, (map_size - 3) * 2, 0, 1)]
         ]
 
-        node_path = loader.load_model("../common/assets/models/safe_space.glb")
+        node_path = loader.load_model(SAFE_SPACE_MODEL_PATH)
         node_path.reparent_to(render)
         node_path.set_pos(collision_spheres[i][0].get_center())
         collision_spheres[i][0].set_tangible(False)
@@ -1,23 +1,31 @@
+import panda3d.core as p3d
 from panda3d.core import CollisionSphere
 
 from common.collision.collision_object import CollisionObject
 
+BOLT_MODEL_PATH = "../common/assets/models/bolt.glb"
+
 
 class Bolt(CollisionObject):
-    def __init__(self, loader, render, position, id: str):
+    """ bolt of the pool, with an instance of the shared model; stashed, so neither seen nor hit, until placed """
+
+    def __init__(self, model: p3d.NodePath, render, id: str):
         self.id = id
-        self.position = position
-        self.model = loader.load_model("../common/assets/models/bolt.glb")
-        self.model.setPos(self.position)
+        self.position = p3d.Vec3(0, 0, 0)
+        self.model = render.attach_new_node("bolt")
+        model.instance_to(self.model)
         self.model.setHpr(90, 0, 0)
-        self.model.reparentTo(render)
+        self.model.stash()
 
         collision_spheres = [CollisionSphere(0, 0, 0.5, 0.2)]
         collision_spheres[0].set_tangible(False)
 
         super().__init__(self.model, "bolt" + id, collision_spheres)
 
-    def remove(self):
-        self.model.detachNode()
-        self.colliders[0].detachNode()
+    def place(self, position: p3d.Vec3):
+        self.position = position
+        self.model.setPos(self.position)
+        self.model.unstash()
 
+    def remove(self):
+        self.model.stash()
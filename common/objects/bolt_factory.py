@@ -1,17 +1,32 @@
 import random
+import struct
+from typing import Union
+
 from common.config import MAP_SIZE
 
-from common.objects.bolt import Bolt
+from common.objects.bolt import Bolt, BOLT_MODEL_PATH
 from collections import deque
 import panda3d.core as p3d
 
+# id, x, y of a bolt - positions are whole numbers
+BOLT_FORMAT = struct.Struct("<HHH")
+
 
 class BoltFactory:
+    """
+    Every bolt id has its bolt created up front with an instance of the model, which is placed when
+    the id spawns and stashed when it is picked up - a match loads the model once and never creates
+    bolts afterwards. Bolts go to clients packed by BOLT_FORMAT, one after another.
+    """
+
     def __init__(self, loader, render):
         self.loader = loader
         self.render = render
-        self.current_bolts = []
-        self.ids_set = {str(i) for i in range(0, MAP_SIZE//2)}
+        self.model = loader.load_model(BOLT_MODEL_PATH)
+        self.bolts: dict[str, Bolt] = {str(i): Bolt(self.model, render, str(i)) for i in range(0, MAP_SIZE//2)}
+        # bolts on the map by id
+        self.current_bolts: dict[str, Bolt] = {}
+        self.ids_set = set(self.bolts.keys())
         self.possible_positions = deque()
 
         for i in range(6, 2 * MAP_SIZE - 5):
@@ -20,46 +35,35 @@ class BoltFactory:
 
         random.shuffle(self.possible_positions)
 
-    def dump_bolts(self):
-        dump = ""
-        b: Bolt
-        for b in self.current_bolts:
-            dump += f"{b.id} {b.position.get_x()} {b.position.get_y()},"
-        return dump[:-1]
+    def dump_bolts(self, bolts: Union[list[Bolt], None] = None) -> bytes:
+        """ given bolts, or all on the map """
+        return b"".join(BOLT_FORMAT.pack(int(b.id), int(b.position.get_x()), int(b.position.get_y()))
+                        for b in (bolts if bolts is not None else self.current_bolts.values()))
 
     def spawn_bolts(self):
         while len(self.current_bolts) < MAP_SIZE//2:
             self.add_bolt()
 
-    def remove_bolt(self, bolt_id):
-        for bolt in self.current_bolts:
-            if bolt.id == bolt_id:
-                self.possible_positions.appendleft(bolt.position)
-                self.ids_set.add(bolt.id)
-                self.current_bolts.remove(bolt)
-                bolt.remove()
+    def remove_bolt(self, bolt_id) -> bool:
+        """ False if the bolt is not on the map, e.g. when two players picked it up at once """
+        bolt = self.current_bolts.pop(bolt_id, None)
+        if bolt is None:
+            return False
+        self.possible_positions.appendleft(bolt.position)
+        self.ids_set.add(bolt.id)
+        bolt.remove()
+        return True
 
     def add_bolt(self):
-        new_position = self.possible_positions.pop()
-        new_bolt = Bolt(self.loader, self.render, new_position, self.ids_set.pop())
-        self.current_bolts.append(new_bolt)
-        return new_bolt
+        return self.__place(self.ids_set.pop(), self.possible_positions.pop())
 
-    def copy_bolts(self, bolts):
-        for bolt in bolts:
-            self.current_bolts.append(Bolt(self.loader, self.render, bolt.position, bolt.id))
+    def undump_bolts(self, dump: bytes):
+        for id, x, y in BOLT_FORMAT.iter_unpack(dump):
+            self.__place(str(id), p3d.Vec3(x, y, 0))
 
-    def undump_bolts(self, dump):
-        if dump == "":
-            return
-        raw_data = dump.split(",")
-        for data in raw_data:
-            bullet_data = data.split(" ")
-            self.current_bolts.append(
-                Bolt(
-                    self.loader,
-                    self.render,
-                    p3d.Vec3(float(bullet_data[1]), float(bullet_data[2]), 0),
-                    bullet_data[0]
-                )
-            )
+    def __place(self, bolt_id: str, position: p3d.Vec3) -> Bolt:
+        bolt = self.bolts[bolt_id]
+        self.ids_set.discard(bolt_id)
+        bolt.place(position)
+        self.current_bolts[bolt_id] = bolt
+        return bolt
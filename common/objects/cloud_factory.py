@@ -1,16 +1,66 @@
+from collections import deque
+
 import panda3d.core as p3d
+from direct.showbase.ShowBaseGlobal import globalClock
+from direct.task.TaskManagerGlobal import taskMgr
+
+from common.objects.cloud import CLOUD_LIFETIME, CLOUD_SPEED, get_cloud_scale, get_cloud_start
 
-from common.objects.cloud import Cloud
+CLOUD_MODEL_PATH = "../common/assets/models/cloud.glb"
 
 
 class CloudFactory:
-    def __init__(self, loader, render):
-        self.loader = loader
+    """
+    Fixed number of cloud nodes shared by all players, with the model loaded once and instanced
+    under each of them. A spawned cloud takes a free node, or the oldest live one when there is none,
+    and a single task animates all live clouds from the t and max_scale of their slots. A finished
+    cloud is stashed and its node waits for the next one.
+    """
+    CAPACITY = 64
+
+    def __init__(self, loader, render, capacity: int = CAPACITY):
         self.render = render
+        self.model = loader.load_model(CLOUD_MODEL_PATH)
+        self.root = render.attach_new_node("clouds")
+        self.nodes: list[p3d.NodePath] = []
+        for _ in range(capacity):
+            node = self.root.attach_new_node("cloud")
+            self.model.instance_to(node)
+            node.stash()
+            self.nodes.append(node)
+        self.t = [0.0] * capacity
+        self.max_scale = [0.0] * capacity
+        self.free = list(range(capacity))
+        # all clouds live equally long, so they finish in the order they were spawned
+        self.live: deque[int] = deque()
+        self.task = taskMgr.add(self.update_task, "animate clouds")
 
     def spawn_cloud(self, pos: p3d.Vec3, max_scale: float, color: p3d.LColor):
-        node_path = self.loader.load_model("../common/assets/models/cloud.glb")
-        node_path.set_color(color)
-        node_path.set_pos(pos)
-        node_path.reparent_to(self.render)
-        return Cloud(node_path, max_scale)
+        slot = self.free.pop() if self.free else self.live.popleft()
+        self.t[slot] = get_cloud_start(max_scale)
+        self.max_scale[slot] = max_scale
+        node = self.nodes[slot]
+        node.set_color(color)
+        node.set_pos(pos)
+        node.set_scale(self.t[slot])
+        node.unstash()
+        self.live.append(slot)
+
+    def update_task(self, task):
+        step = globalClock.get_dt() * CLOUD_SPEED
+        t, max_scale, nodes = self.t, self.max_scale, self.nodes
+        for slot in self.live:
+            t[slot] += step
+            if t[slot] < CLOUD_LIFETIME:
+                nodes[slot].set_scale(get_cloud_scale(t[slot], max_scale[slot]))
+
+        live = self.live
+        while live and t[live[0]] >= CLOUD_LIFETIME:
+            slot = live.popleft()
+            nodes[slot].stash()
+            self.free.append(slot)
+        return task.cont
+
+    def destroy(self):
+        taskMgr.remove(self.task)
+        self.root.remove_node()
@@ -1,20 +1,21 @@
 from typing import Union
 from panda3d.core import Vec3, CollisionSphere
 
-from direct.showbase.ShowBase import ShowBase
 from common.collision.collision_object import CollisionObject
 from common.config import MAP_SIZE
 from common.player.player_controller import PlayerController
 from common.typings import SupportsCollisionRegistration
 
+FLAG_MODEL_PATH = "../common/assets/models/flag.glb"
+
 
 class Flag(CollisionObject, SupportsCollisionRegistration):
-    def __init__(self, game: ShowBase, player=None):
+    def __init__(self, loader, render, player=None):
         self.player: Union[PlayerController, None] = player
         self.position = Vec3(MAP_SIZE - 2, MAP_SIZE - 2, 0)
-        self.model = game.loader.load_model("../common/assets/models/flag.glb")
+        self.model = loader.load_model(FLAG_MODEL_PATH)
         self.model.setPos(self.position)
-        self.model.reparentTo(game.render)
+        self.model.reparentTo(render)
 
         collision_spheres = [CollisionSphere(0, 0, 0.5, 0.2)]
         collision_spheres[0].set_tangible(False)
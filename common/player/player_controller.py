@@ -107,9 +107,7 @@ class PlayerController(CollisionObject, SupportsCollisionRegistration):
                     0.15
                 )
                 position = self.get_state().get_position() + position_offset
-                self.cloud_factory \
-                    .spawn_cloud(position, scale, self.cloud_color) \
-                    .inflate()
+                self.cloud_factory.spawn_cloud(position, scale, self.cloud_color)
         return task.again
 
     def task_update_position(self, task):
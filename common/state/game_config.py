@@ -1,13 +1,18 @@
-import pickle
-import zlib
+from typing import Union
 
 from common.state.player_state_diff import PlayerStateDiff
+from common.tiles.map_codec import encode_map, decode_map, get_map_hash
 from common.typings import SupportsNetworkTransfer, SupportsBuildingNetworkTransfer
 
 
 class GameConfig(SupportsNetworkTransfer):
-    def __init__(self, tiles, expected_players, id: str, states: list[PlayerStateDiff], size: int, season: int):
+    def __init__(self, tiles, expected_players, id: str, states: list[PlayerStateDiff], size: int, season: int,
+                 encoded_tiles: Union[bytes, None] = None, map_hash: Union[str, None] = None):
         self.tiles = tiles
+        # tiles as they are sent and their hash, the server encodes and hashes every map once
+        # and passes both to all configs
+        self.encoded_tiles = encoded_tiles
+        self.map_hash = map_hash
         self.id = id
         self.expected_players = expected_players
         self.all_ids = []
@@ -15,8 +20,15 @@ class GameConfig(SupportsNetworkTransfer):
         self.size = size
         self.season = season
 
-    def transfer(self, builder: SupportsBuildingNetworkTransfer):
-        builder.add("gctiles", zlib.compress(pickle.dumps(self.tiles)).hex())
+    def transfer(self, builder: SupportsBuildingNetworkTransfer, with_tiles: bool = True):
+        """ without tiles only the map hash is sent, for clients which have the map cached """
+        if self.encoded_tiles is None:
+            self.encoded_tiles = encode_map(self.tiles, self.size)
+        if self.map_hash is None:
+            self.map_hash = get_map_hash(self.encoded_tiles)
+        builder.add("map_hash", self.map_hash)
+        if with_tiles:
+            builder.add("gctiles", self.encoded_tiles)
         builder.add("id", self.id)
         builder.add("size", self.size)
         builder.add("expected_players", self.expected_players)
@@ -26,10 +38,14 @@ class GameConfig(SupportsNetworkTransfer):
             state.transfer(builder)
 
     def restore(self, transfer):
-        self.tiles = pickle.loads(zlib.decompress(bytes.fromhex(transfer.get("gctiles"))))
         self.all_ids = transfer.get("ids").split(",")
         self.id = transfer.get("id")
         self.size = transfer.get("size")
+        self.map_hash = transfer.get("map_hash")
+        # without tiles the client has to take them from its cache
+        if transfer.has("gctiles"):
+            self.encoded_tiles = transfer.get("gctiles")
+            self.tiles = decode_map(self.encoded_tiles, self.size)
         self.expected_players = transfer.get("expected_players")
         self.season = transfer.get("season")
         for id in self.all_ids:
@@ -0,0 +1,37 @@
+import hashlib
+
+from common.tiles.tile_controller import TILE_MODELS
+
+# a cell is sent as the index of its model in TILE_MODELS
+TILE_MODEL_INDEX: dict[str, int] = {model: i for i, model in enumerate(TILE_MODELS)}
+# headings of rotations _1 to _4, in the low two bits of a cell
+HEADINGS: list[int] = [0, -90, 180, 90]
+ROTATION_INDEX: dict[int, int] = {heading: i for i, heading in enumerate(HEADINGS)}
+
+
+def encode_map(tiles: [dict], size: int) -> bytes:
+    """
+    one byte per cell - index of the model shifted left by two with the rotation in the low bits;
+    tiles are in the order of WFCMap.to_image_grid, which gives their positions back
+    """
+    if len(tiles) != size * size:
+        raise ValueError(f"map of size {size} has {len(tiles)} tiles")
+    return bytes(TILE_MODEL_INDEX[tile["node_path"]] << 2 | ROTATION_INDEX[tile["heading"]] for tile in tiles)
+
+
+def get_map_hash(data: bytes) -> str:
+    """ content hash of an encoded map, clients cache maps under it """
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def decode_map(data: bytes, size: int) -> [dict]:
+    """ tiles in the form CollisionBuilder.add_tile_colliders takes them, ValueError for a damaged map """
+    if len(data) != size * size:
+        raise ValueError(f"map of size {size} has {len(data)} bytes")
+    tiles = []
+    for i, cell in enumerate(data):
+        if cell >> 2 >= len(TILE_MODELS):
+            raise ValueError(f"unknown tile {cell >> 2}")
+        x, y = divmod(i, size)
+        tiles.append({"node_path": TILE_MODELS[cell >> 2], "pos": (x * 2, y * 2, 0), "heading": HEADINGS[cell & 3]})
+    return tiles
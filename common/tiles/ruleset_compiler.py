@@ -0,0 +1,228 @@
+import csv
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from common.typings import Direction
+
+DIRECTIONS: tuple[Direction, ...] = ("n", "e", "s", "w")
+
+SLOTS_CSV_PATH = Path(__file__).parent / "slots.csv"
+RULESET_PATH = Path(__file__).parent / "ruleset.bin"
+
+
+def read_tiles_map(csv_path: Path) -> dict:
+    """ tiles with their weights, slots and neighbours, from the adjacency table of tiles in first rotation """
+    tiles_map = {}
+    with open(csv_path, 'r') as file:
+        reader = csv.reader(file)
+        first_row = next(reader)
+
+        for tile in first_row:
+            if len(tile) > 1:
+                tiles_map[tile.lstrip()] = {
+                    "weight": 0,
+                    "slots": {
+                        "n": set(),
+                        "e": set(),
+                        "s": set(),
+                        "w": set()
+                    },
+                    "neighbours": []
+                }
+
+        for row in reader:
+            for i in range(1, len(row)):
+                if row[i] == "1":
+                    tiles_map[row[0].lstrip()[:-2]]["slots"][row[0][-1]].add(first_row[i].lstrip())
+
+    for tile in tiles_map:
+        if "empty" in tile:
+            tiles_map[tile]["weight"] = 20
+        elif "water" in tile:
+            tiles_map[tile]["weight"] = 10
+        elif "slim" in tile:
+            tiles_map[tile]["weight"] = 3
+        elif "full" in tile:
+            tiles_map[tile]["weight"] = 0.01
+        else:
+            tiles_map[tile]["weight"] = 5
+
+        match tile:
+            case "empty_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case "plants_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case "wall_concave_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case "wall_convex_1":
+                tiles_map[tile]["neighbours"].extend(["e", "s"])
+            case "wall_slim_extend_1":
+                tiles_map[tile]["neighbours"].extend(["e", "s", "w"])
+            case "wall_slim_single_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case "wall_slim_tip_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case "wall_straight_1_1":
+                tiles_map[tile]["neighbours"].extend(["e", "s", "w"])
+            case "wall_straight_2_1":
+                tiles_map[tile]["neighbours"].extend(["e", "s", "w"])
+            case "water_concave_1":
+                tiles_map[tile]["neighbours"].extend(["n", "w"])
+            case "water_convex_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case "water_extend_1":
+                tiles_map[tile]["neighbours"].extend(["n", "e", "s", "w"])
+            case _:
+                tiles_map[tile]["neighbours"].extend([])
+
+    def rotate_tile_slots(tile_name: str, alignment: int):
+        digit = int(tile_name[-1])
+        digit = digit + alignment
+        if digit > 4:
+            digit %= 4
+        return tile_name[:-1] + str(digit)
+
+    tile_rotation_map = {
+        "n": ["n", "e", "s", "w"],
+        "e": ["e", "s", "w", "n"],
+        "s": ["s", "w", "n", "e"],
+        "w": ["w", "n", "e", "s"],
+    }
+
+    for tile in tiles_map:
+        if tile[-1] != "1":
+            continue
+
+        # for all rotated tile variants, assign slots with correct rotations/alignments
+        # relative to them
+        for rot in [1, 2, 3]:
+            for alignment in ["n", "e", "s", "w"]:
+                new_alignment = tile_rotation_map[alignment][rot]
+                tiles_map[tile[:-1] + str(rot+1)]["slots"][new_alignment] \
+                    = [rotate_tile_slots(neighbour, rot) for neighbour in tiles_map[tile]["slots"][alignment]]
+
+        if tiles_map[tile]["neighbours"] == ["n", "e", "s", "w"]:
+            tiles_map[tile[:-1] + "2"]["neighbours"] = ["n", "e", "s", "w"]
+            tiles_map[tile[:-1] + "3"]["neighbours"] = ["n", "e", "s", "w"]
+            tiles_map[tile[:-1] + "4"]["neighbours"] = ["n", "e", "s", "w"]
+        if tiles_map[tile]["neighbours"] == ["e", "s"]:
+            tiles_map[tile[:-1] + "2"]["neighbours"] = ["s", "w"]
+            tiles_map[tile[:-1] + "3"]["neighbours"] = ["w", "n"]
+            tiles_map[tile[:-1] + "4"]["neighbours"] = ["n", "e"]
+        if tiles_map[tile]["neighbours"] == ["e", "s", "w"]:
+            tiles_map[tile[:-1] + "2"]["neighbours"] = ["s", "w", "n"]
+            tiles_map[tile[:-1] + "3"]["neighbours"] = ["w", "n", "s"]
+            tiles_map[tile[:-1] + "4"]["neighbours"] = ["n", "e", "s"]
+        if tiles_map[tile]["neighbours"] == ["n", "w"]:
+            tiles_map[tile[:-1] + "2"]["neighbours"] = ["e", "n"]
+            tiles_map[tile[:-1] + "3"]["neighbours"] = ["s", "e"]
+            tiles_map[tile[:-1] + "4"]["neighbours"] = ["w", "n"]
+
+    return tiles_map
+
+
+class CompiledRuleset:
+    """
+    Tiles map in a binary file, read through a memory map - tile names, weights, and for every
+    direction and tile its slots as a bitmask split into bytes, bit i stands for tiles[i].
+    Files of another version, or compiled from another slots.csv, are compiled again.
+    """
+    MAGIC = b"WFCR"
+    VERSION = 1
+    # magic, version, tiles count, bytes of a bitmask, length of tile names, sha256 of slots.csv
+    HEADER = struct.Struct("<4sHHHI32s")
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, tiles_count, chunks, names_length, self.source_hash = \
+            self.HEADER.unpack_from(self.__buffer)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{path} is not a ruleset of version {self.VERSION}")
+
+        offset = self.HEADER.size
+        self.tiles: list[str] = self.__buffer[offset:offset + names_length].decode().split("\n")
+        self.index: dict[str, int] = {tile: i for i, tile in enumerate(self.tiles)}
+        offset += names_length
+        self.weights = np.frombuffer(self.__buffer, dtype="<f8", count=tiles_count, offset=offset)
+        offset += self.weights.nbytes
+        # (direction, tile, chunk)
+        self.slots = np.frombuffer(self.__buffer, dtype=np.uint8, count=len(DIRECTIONS) * tiles_count * chunks,
+                                   offset=offset).reshape(len(DIRECTIONS), tiles_count, chunks)
+        offset += self.slots.nbytes
+        # bit d is set for every direction DIRECTIONS[d] the tile lets the player through
+        self.neighbours = np.frombuffer(self.__buffer, dtype=np.uint8, count=tiles_count, offset=offset)
+
+    def slot_mask(self, direction: Direction, tile: int) -> int:
+        return int.from_bytes(self.slots[DIRECTIONS.index(direction), tile].tobytes(), "little")
+
+    def neighbour_directions(self, tile: int) -> list[Direction]:
+        return [direction for d, direction in enumerate(DIRECTIONS) if self.neighbours[tile] >> d & 1]
+
+
+def source_hash(csv_path: Path) -> bytes:
+    return hashlib.sha256(csv_path.read_bytes()).digest()
+
+
+def compile_ruleset(csv_path: Path, ruleset_path: Path):
+    tiles_map = read_tiles_map(csv_path)
+    tiles = list(tiles_map.keys())
+    index = {tile: i for i, tile in enumerate(tiles)}
+    chunks = (len(tiles) + 7) // 8
+
+    adjacency = np.zeros((len(DIRECTIONS), len(tiles), len(tiles)), dtype=np.uint8)
+    neighbours = np.zeros(len(tiles), dtype=np.uint8)
+    for i, tile in enumerate(tiles):
+        for d, direction in enumerate(DIRECTIONS):
+            for slot in tiles_map[tile]["slots"][direction]:
+                adjacency[d, i, index[slot]] = 1
+            if direction in tiles_map[tile]["neighbours"]:
+                neighbours[i] |= 1 << d
+    slots = np.packbits(adjacency, axis=-1, bitorder="little")
+    weights = np.array([tiles_map[tile]["weight"] for tile in tiles], dtype="<f8")
+
+    names = "\n".join(tiles).encode()
+    header = CompiledRuleset.HEADER.pack(CompiledRuleset.MAGIC, CompiledRuleset.VERSION, len(tiles), chunks,
+                                         len(names), source_hash(csv_path))
+    # written under a temporary name of its own first, other processes may be loading the ruleset or
+    # compiling it at the same time - each of them moves a whole file in place and the last one stays
+    handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=ruleset_path.parent)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(header + names + weights.tobytes() + slots.tobytes() + neighbours.tobytes())
+        os.replace(temporary, ruleset_path)
+    finally:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+
+
+def load_compiled_ruleset(csv_path: Path = SLOTS_CSV_PATH, ruleset_path: Path = RULESET_PATH) -> CompiledRuleset:
+    """ compiles the ruleset first if it is missing or outdated """
+    try:
+        ruleset = CompiledRuleset(ruleset_path)
+        if not csv_path.exists() or ruleset.source_hash == source_hash(csv_path):
+            return ruleset
+    except (OSError, ValueError, struct.error):
+        pass
+    print("[INFO] Compiling tiles ruleset")
+    compile_ruleset(csv_path, ruleset_path)
+    return CompiledRuleset(ruleset_path)
+
+
+@lru_cache(maxsize=None)
+def get_compiled_ruleset() -> CompiledRuleset:
+    return load_compiled_ruleset()
+
+
+if __name__ == "__main__":
+    # python -m common.tiles.ruleset_compiler [slots.csv] [ruleset.bin]
+    compile_ruleset(Path(sys.argv[1]) if len(sys.argv) > 1 else SLOTS_CSV_PATH,
+                    Path(sys.argv[2]) if len(sys.argv) > 2 else RULESET_PATH)
@@ -1,18 +1,11 @@
 from copy import copy
 
-import panda3d.core as p3d
 from panda3d.core import CollisionBox, Point3, CollisionSphere, CollisionCapsule
 
 
-def create_new_tile(loader: p3d.Loader, name: str, position: tuple, heading: int, season: int):
+def get_tile_model_path(name: str, season: int) -> str:
     season_folder = "summer" if season == 0 else "winter"
-    node_path = loader.load_model(
-        f"../common/assets/models/{season_folder}/{name if name[-3:] == 'glb' else (name + '.glb')}"
-    )
-    node_path.set_pos(*position)
-    node_path.set_h(heading)
-
-    return node_path
+    return f"../common/assets/models/{season_folder}/{name if name[-3:] == 'glb' else (name + '.glb')}"
 
 
 def get_collision_shapes(key: str):
@@ -51,3 +44,6 @@ collision_shapes = {
 
     "empty_1": []
 }
+
+# models of the first rotation of every tile type, other rotations are the same models turned around
+TILE_MODELS: list[str] = list(collision_shapes.keys())
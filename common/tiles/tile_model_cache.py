@@ -0,0 +1,45 @@
+import panda3d.core as p3d
+from panda3d.core import NodePath
+
+from common.tiles.tile_controller import TILE_MODELS, get_tile_model_path
+
+
+class TileModelCache:
+    """
+    Tile models loaded once for every season and model. A tile is a node of its own, which carries
+    the position, heading and colliders of the tile, with an instance of the shared model below it -
+    a map loads at most len(TILE_MODELS) models however big it is.
+    """
+
+    def __init__(self, loader: p3d.Loader):
+        self.loader = loader
+        self.models: dict[tuple[int, str], NodePath] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_model(self, name: str, season: int) -> NodePath:
+        model = self.models.get((season, name))
+        if model is None:
+            self.misses += 1
+            model = self.models[(season, name)] = self.loader.load_model(get_tile_model_path(name, season))
+        else:
+            self.hits += 1
+        return model
+
+    def add_model(self, name: str, season: int, model: NodePath):
+        """ model loaded elsewhere, e.g. in the background """
+        self.models.setdefault((season, name), model)
+
+    def prefetch(self, season: int):
+        """ loads every tile model of the season, so that building a map does not wait for the disk """
+        for name in TILE_MODELS:
+            if (season, name) not in self.models:
+                self.get_model(name, season)
+
+    def place(self, parent: NodePath, name: str, position: tuple, heading: int, season: int) -> NodePath:
+        """ tile node under parent with the model instanced below it """
+        tile = parent.attach_new_node(name)
+        tile.set_pos(*position)
+        tile.set_h(heading)
+        self.get_model(name, season).instance_to(tile)
+        return tile
@@ -1,9 +1,15 @@
 import panda3d.core as p3d
 
+PLAYERS_COUNT = 4
+
+
+def get_player_model_path(player_id) -> str:
+    return f"../common/assets/models/players/player{player_id}.glb"
+
 
 class TileNodePathFactory:
     def __init__(self, loader: p3d.Loader):
         self.loader = loader
 
     def get_player_model(self, player_id):
-        return self.loader.load_model(f"../common/assets/models/players/player{player_id}.glb")
+        return self.loader.load_model(get_player_model_path(player_id))
@@ -1,74 +0,0 @@
-tiles_map={
-'empty_1': {'weight': 20, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_join3_3', 'wall_slim_tip_2', 'wall_concave_2', 'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'water_extend_3', 'plants_4', 'plants_3'}, 'e': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_tip_2', 'wall_concave_2', 'water_extend_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_straight_2_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_4', 'plants_3', 'wall_straight_1_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_slim_join3_2', 'wall_concave_4', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'wall_straight_1_4', 'wall_straight_2_4', 'empty_3', 'plants_2', 'water_extend_2', 'plants_4', 'wall_slim_join2_1', 'plants_3'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'empty_2': {'weight': 20, 'slots': {'n': ['water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_slim_join3_3', 'wall_concave_1', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'wall_straight_1_1', 'wall_straight_2_1', 'empty_4', 'plants_3', 'water_extend_3', 'plants_1', 'wall_slim_join2_2', 'plants_4'], 'e': ['wall_slim_join2_4', 'wall_slim_join3_4', 'wall_slim_tip_3', 'wall_concave_3', 'water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'water_extend_4', 'plants_1', 'plants_4'], 's': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_tip_3', 'wall_concave_3', 'water_extend_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_straight_2_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_1', 'plants_4', 'wall_straight_1_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'empty_3': {'weight': 20, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_slim_join3_4', 'wall_concave_2', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'wall_straight_1_2', 'wall_straight_2_2', 'empty_1', 'plants_4', 'water_extend_4', 'plants_2', 'wall_slim_join2_3', 'plants_1'], 's': ['wall_slim_join2_1', 'wall_slim_join3_1', 'wall_slim_tip_4', 'wall_concave_4', 'water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'water_extend_1', 'plants_2', 'plants_1'], 'w': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_tip_4', 'wall_concave_4', 'water_extend_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_straight_2_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_2', 'plants_1', 'wall_straight_1_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'empty_4': {'weight': 20, 'slots': {'n': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_tip_1', 'wall_concave_1', 'water_extend_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_straight_2_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_3', 'plants_2', 'wall_straight_1_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_slim_join3_1', 'wall_concave_3', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'wall_straight_1_3', 'wall_straight_2_3', 'empty_2', 'plants_1', 'water_extend_1', 'plants_3', 'wall_slim_join2_4', 'plants_2'], 'w': ['wall_slim_join2_2', 'wall_slim_join3_2', 'wall_slim_tip_1', 'wall_concave_1', 'water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'water_extend_2', 'plants_3', 'plants_2']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'plants_1': {'weight': 5, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_join3_3', 'wall_slim_tip_2', 'wall_concave_2', 'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'water_extend_3', 'plants_4', 'plants_3'}, 'e': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_tip_2', 'wall_concave_2', 'water_extend_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_straight_2_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_4', 'plants_3', 'wall_straight_1_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_slim_join3_2', 'wall_concave_4', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'wall_straight_1_4', 'wall_straight_2_4', 'empty_3', 'plants_2', 'water_extend_2', 'plants_4', 'wall_slim_join2_1', 'plants_3'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'plants_2': {'weight': 5, 'slots': {'n': ['water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_slim_join3_3', 'wall_concave_1', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'wall_straight_1_1', 'wall_straight_2_1', 'empty_4', 'plants_3', 'water_extend_3', 'plants_1', 'wall_slim_join2_2', 'plants_4'], 'e': ['wall_slim_join2_4', 'wall_slim_join3_4', 'wall_slim_tip_3', 'wall_concave_3', 'water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'water_extend_4', 'plants_1', 'plants_4'], 's': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_tip_3', 'wall_concave_3', 'water_extend_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_straight_2_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_1', 'plants_4', 'wall_straight_1_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'plants_3': {'weight': 5, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_slim_join3_4', 'wall_concave_2', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'wall_straight_1_2', 'wall_straight_2_2', 'empty_1', 'plants_4', 'water_extend_4', 'plants_2', 'wall_slim_join2_3', 'plants_1'], 's': ['wall_slim_join2_1', 'wall_slim_join3_1', 'wall_slim_tip_4', 'wall_concave_4', 'water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'water_extend_1', 'plants_2', 'plants_1'], 'w': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_tip_4', 'wall_concave_4', 'water_extend_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_straight_2_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_2', 'plants_1', 'wall_straight_1_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'plants_4': {'weight': 5, 'slots': {'n': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_tip_1', 'wall_concave_1', 'water_extend_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_straight_2_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_3', 'plants_2', 'wall_straight_1_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_slim_join3_1', 'wall_concave_3', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'wall_straight_1_3', 'wall_straight_2_3', 'empty_2', 'plants_1', 'water_extend_1', 'plants_3', 'wall_slim_join2_4', 'plants_2'], 'w': ['wall_slim_join2_2', 'wall_slim_join3_2', 'wall_slim_tip_1', 'wall_concave_1', 'water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'water_extend_2', 'plants_3', 'plants_2']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_concave_1': {'weight': 5, 'slots': {'n': {'wall_straight_2_4', 'wall_concave_4', 'wall_convex_1', 'wall_straight_1_4', 'wall_straight_join1_4'}, 'e': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_tip_2', 'wall_concave_2', 'water_extend_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_4', 'plants_3', 'wall_straight_1_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'wall_straight_1_1', 'wall_concave_2', 'wall_straight_2_1', 'wall_convex_1', 'wall_straight_join1_2'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_concave_2': {'weight': 5, 'slots': {'n': ['wall_straight_1_2', 'wall_concave_3', 'wall_straight_2_2', 'wall_convex_2', 'wall_straight_join1_3'], 'e': ['wall_straight_2_1', 'wall_concave_1', 'wall_convex_2', 'wall_straight_1_1', 'wall_straight_join1_1'], 's': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_tip_3', 'wall_concave_3', 'water_extend_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_1', 'plants_4', 'wall_straight_1_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_concave_3': {'weight': 5, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['wall_straight_1_3', 'wall_concave_4', 'wall_straight_2_3', 'wall_convex_3', 'wall_straight_join1_4'], 's': ['wall_straight_2_2', 'wall_concave_2', 'wall_convex_3', 'wall_straight_1_2', 'wall_straight_join1_2'], 'w': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_tip_4', 'wall_concave_4', 'water_extend_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_2', 'plants_1', 'wall_straight_1_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_concave_4': {'weight': 5, 'slots': {'n': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_tip_1', 'wall_concave_1', 'water_extend_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_3', 'plants_2', 'wall_straight_1_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['wall_straight_1_4', 'wall_concave_1', 'wall_straight_2_4', 'wall_convex_4', 'wall_straight_join1_1'], 'w': ['wall_straight_2_3', 'wall_concave_3', 'wall_convex_4', 'wall_straight_1_3', 'wall_straight_join1_3']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_convex_1': {'weight': 5, 'slots': {'n': {'full_4', 'wall_convex_4', 'wall_convex_3', 'wall_straight_2_3', 'full_1', 'full_2', 'wall_straight_join1_3', 'full_3', 'wall_straight_1_3'}, 'e': {'wall_straight_1_1', 'wall_straight_2_1', 'wall_convex_2', 'wall_concave_1', 'wall_straight_join1_1'}, 's': {'wall_straight_2_4', 'wall_convex_4', 'wall_concave_1', 'wall_straight_1_4', 'wall_straight_join1_4'}, 'w': {'full_4', 'wall_convex_3', 'wall_convex_2', 'full_1', 'full_2', 'wall_straight_2_2', 'wall_straight_join1_2', 'full_3', 'wall_straight_1_2'}}, 'neighbours': ['e', 's']} ,
-'wall_convex_2': {'weight': 5, 'slots': {'n': ['full_1', 'wall_convex_4', 'wall_convex_3', 'full_2', 'full_3', 'wall_straight_2_3', 'wall_straight_join1_3', 'full_4', 'wall_straight_1_3'], 'e': ['full_1', 'wall_convex_1', 'wall_convex_4', 'wall_straight_2_4', 'full_2', 'full_3', 'wall_straight_join1_4', 'full_4', 'wall_straight_1_4'], 's': ['wall_straight_1_2', 'wall_straight_2_2', 'wall_convex_3', 'wall_concave_2', 'wall_straight_join1_2'], 'w': ['wall_straight_2_1', 'wall_convex_1', 'wall_concave_2', 'wall_straight_1_1', 'wall_straight_join1_1']}, 'neighbours': ['s', 'w']} ,
-'wall_convex_3': {'weight': 5, 'slots': {'n': ['wall_straight_2_2', 'wall_convex_2', 'wall_concave_3', 'wall_straight_1_2', 'wall_straight_join1_2'], 'e': ['full_2', 'wall_convex_1', 'wall_convex_4', 'full_3', 'full_4', 'wall_straight_2_4', 'wall_straight_join1_4', 'full_1', 'wall_straight_1_4'], 's': ['full_2', 'wall_convex_2', 'wall_convex_1', 'wall_straight_2_1', 'full_3', 'full_4', 'wall_straight_join1_1', 'full_1', 'wall_straight_1_1'], 'w': ['wall_straight_1_3', 'wall_straight_2_3', 'wall_convex_4', 'wall_concave_3', 'wall_straight_join1_3']}, 'neighbours': ['w', 'n']} ,
-'wall_convex_4': {'weight': 5, 'slots': {'n': ['wall_straight_1_4', 'wall_straight_2_4', 'wall_convex_1', 'wall_concave_4', 'wall_straight_join1_4'], 'e': ['wall_straight_2_3', 'wall_convex_3', 'wall_concave_4', 'wall_straight_1_3', 'wall_straight_join1_3'], 's': ['full_3', 'wall_convex_2', 'wall_convex_1', 'full_4', 'full_1', 'wall_straight_2_1', 'wall_straight_join1_1', 'full_2', 'wall_straight_1_1'], 'w': ['full_3', 'wall_convex_3', 'wall_convex_2', 'wall_straight_2_2', 'full_4', 'full_1', 'wall_straight_join1_2', 'full_2', 'wall_straight_1_2']}, 'neighbours': ['n', 'e']} ,
-'wall_slim_extend_1': {'weight': 3, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_join3_3', 'water_convex_3', 'wall_concave_2', 'wall_concave_1', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'plants_3'}, 'e': {'wall_slim_join3_2', 'wall_slim_join3_3', 'wall_slim_join4_3', 'wall_slim_extend_1', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_join2_2', 'wall_slim_join4_4', 'wall_straight_join1_2', 'wall_slim_join4_2', 'wall_slim_join4_1', 'wall_slim_join3_1', 'wall_slim_extend_3'}, 's': {'wall_straight_2_3', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_join3_3', 'wall_slim_join4_3', 'wall_slim_tip_2', 'wall_slim_extend_1', 'wall_straight_join1_4', 'wall_slim_join2_4', 'wall_slim_join4_4', 'wall_slim_join4_2', 'wall_slim_join4_1', 'wall_slim_join3_1', 'wall_slim_extend_3'}}, 'neighbours': ['e', 's', 'w']} ,
-'wall_slim_extend_2': {'weight': 3, 'slots': {'n': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_join3_4', 'wall_slim_join4_4', 'wall_slim_tip_3', 'wall_slim_extend_2', 'wall_straight_join1_1', 'wall_slim_join2_1', 'wall_slim_join4_1', 'wall_slim_join4_3', 'wall_slim_join4_2', 'wall_slim_join3_2', 'wall_slim_extend_4'], 'e': ['wall_slim_join2_4', 'wall_slim_join3_4', 'water_convex_4', 'wall_concave_3', 'wall_concave_2', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'plants_4'], 's': ['wall_slim_join3_3', 'wall_slim_join3_4', 'wall_slim_join4_4', 'wall_slim_extend_2', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_join2_3', 'wall_slim_join4_1', 'wall_straight_join1_3', 'wall_slim_join4_3', 'wall_slim_join4_2', 'wall_slim_join3_2', 'wall_slim_extend_4'], 'w': ['wall_straight_2_4', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['s', 'w', 'n']} ,
-'wall_slim_extend_3': {'weight': 3, 'slots': {'n': ['wall_straight_2_1', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_join3_1', 'wall_slim_join4_1', 'wall_slim_tip_4', 'wall_slim_extend_3', 'wall_straight_join1_2', 'wall_slim_join2_2', 'wall_slim_join4_2', 'wall_slim_join4_4', 'wall_slim_join4_3', 'wall_slim_join3_3', 'wall_slim_extend_1'], 's': ['wall_slim_join2_1', 'wall_slim_join3_1', 'water_convex_1', 'wall_concave_4', 'wall_concave_3', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'plants_1'], 'w': ['wall_slim_join3_4', 'wall_slim_join3_1', 'wall_slim_join4_1', 'wall_slim_extend_3', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_join2_4', 'wall_slim_join4_2', 'wall_straight_join1_4', 'wall_slim_join4_4', 'wall_slim_join4_3', 'wall_slim_join3_3', 'wall_slim_extend_1']}, 'neighbours': ['w', 'n', 's']} ,
-'wall_slim_extend_4': {'weight': 3, 'slots': {'n': ['wall_slim_join3_1', 'wall_slim_join3_2', 'wall_slim_join4_2', 'wall_slim_extend_4', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_join2_1', 'wall_slim_join4_3', 'wall_straight_join1_1', 'wall_slim_join4_1', 'wall_slim_join4_4', 'wall_slim_join3_4', 'wall_slim_extend_2'], 'e': ['wall_straight_2_2', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_join3_2', 'wall_slim_join4_2', 'wall_slim_tip_1', 'wall_slim_extend_4', 'wall_straight_join1_3', 'wall_slim_join2_3', 'wall_slim_join4_3', 'wall_slim_join4_1', 'wall_slim_join4_4', 'wall_slim_join3_4', 'wall_slim_extend_2'], 'w': ['wall_slim_join2_2', 'wall_slim_join3_2', 'water_convex_2', 'wall_concave_1', 'wall_concave_4', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'plants_2']}, 'neighbours': ['n', 'e', 's']} ,
-'wall_slim_join2_1': {'weight': 3, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_join3_3', 'wall_slim_tip_2', 'wall_concave_2', 'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'water_extend_3', 'plants_4', 'plants_3'}, 'e': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_tip_2', 'wall_concave_2', 'water_extend_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_straight_2_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_4', 'plants_3', 'wall_straight_1_2'}, 's': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_join3_2', 'wall_slim_join3_3', 'wall_slim_join4_3', 'wall_slim_extend_2', 'wall_straight_join1_3', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_join4_4', 'wall_slim_extend_4', 'wall_slim_join4_2', 'wall_slim_join4_1'}, 'w': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_join3_3', 'wall_slim_join4_3', 'wall_slim_tip_2', 'wall_slim_extend_1', 'wall_straight_join1_4', 'wall_slim_join2_4', 'wall_slim_join4_4', 'wall_slim_join4_2', 'wall_slim_join4_1', 'wall_slim_join3_1', 'wall_slim_extend_3'}}, 'neighbours': []} ,
-'wall_slim_join2_2': {'weight': 3, 'slots': {'n': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_join3_4', 'wall_slim_join4_4', 'wall_slim_tip_3', 'wall_slim_extend_2', 'wall_straight_join1_1', 'wall_slim_join2_1', 'wall_slim_join4_1', 'wall_slim_join4_3', 'wall_slim_join4_2', 'wall_slim_join3_2', 'wall_slim_extend_4'], 'e': ['wall_slim_join2_4', 'wall_slim_join3_4', 'wall_slim_tip_3', 'wall_concave_3', 'water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'water_extend_4', 'plants_1', 'plants_4'], 's': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_tip_3', 'wall_concave_3', 'water_extend_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_straight_2_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_1', 'plants_4', 'wall_straight_1_3'], 'w': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_join3_3', 'wall_slim_join3_4', 'wall_slim_join4_4', 'wall_slim_extend_3', 'wall_straight_join1_4', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_join4_1', 'wall_slim_extend_1', 'wall_slim_join4_3', 'wall_slim_join4_2']}, 'neighbours': []} ,
-'wall_slim_join2_3': {'weight': 3, 'slots': {'n': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_join3_4', 'wall_slim_join3_1', 'wall_slim_join4_1', 'wall_slim_extend_4', 'wall_straight_join1_1', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_join4_2', 'wall_slim_extend_2', 'wall_slim_join4_4', 'wall_slim_join4_3'], 'e': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_join3_1', 'wall_slim_join4_1', 'wall_slim_tip_4', 'wall_slim_extend_3', 'wall_straight_join1_2', 'wall_slim_join2_2', 'wall_slim_join4_2', 'wall_slim_join4_4', 'wall_slim_join4_3', 'wall_slim_join3_3', 'wall_slim_extend_1'], 's': ['wall_slim_join2_1', 'wall_slim_join3_1', 'wall_slim_tip_4', 'wall_concave_4', 'water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'water_extend_1', 'plants_2', 'plants_1'], 'w': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_tip_4', 'wall_concave_4', 'water_extend_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_straight_2_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_2', 'plants_1', 'wall_straight_1_4']}, 'neighbours': []} ,
-'wall_slim_join2_4': {'weight': 3, 'slots': {'n': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_tip_1', 'wall_concave_1', 'water_extend_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_straight_2_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_3', 'plants_2', 'wall_straight_1_1'], 'e': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_join3_1', 'wall_slim_join3_2', 'wall_slim_join4_2', 'wall_slim_extend_1', 'wall_straight_join1_2', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_join4_3', 'wall_slim_extend_3', 'wall_slim_join4_1', 'wall_slim_join4_4'], 's': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_join3_2', 'wall_slim_join4_2', 'wall_slim_tip_1', 'wall_slim_extend_4', 'wall_straight_join1_3', 'wall_slim_join2_3', 'wall_slim_join4_3', 'wall_slim_join4_1', 'wall_slim_join4_4', 'wall_slim_join3_4', 'wall_slim_extend_2'], 'w': ['wall_slim_join2_2', 'wall_slim_join3_2', 'wall_slim_tip_1', 'wall_concave_1', 'water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'water_extend_2', 'plants_3', 'plants_2']}, 'neighbours': []} ,
-'wall_slim_join3_1': {'weight': 3, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_tip_2', 'wall_concave_2', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'water_extend_3', 'plants_4', 'plants_3'}, 'e': {'wall_slim_extend_1', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_join2_2', 'wall_straight_join1_2', 'wall_slim_extend_3'}, 's': {'wall_slim_join2_3', 'wall_slim_extend_2', 'wall_straight_join1_3', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_extend_4'}, 'w': {'wall_slim_join2_3', 'wall_slim_tip_2', 'wall_slim_extend_1', 'wall_slim_join2_4', 'wall_straight_join1_4', 'wall_slim_extend_3'}}, 'neighbours': []} ,
-'wall_slim_join3_2': {'weight': 3, 'slots': {'n': ['wall_slim_join2_4', 'wall_slim_tip_3', 'wall_slim_extend_2', 'wall_slim_join2_1', 'wall_straight_join1_1', 'wall_slim_extend_4'], 'e': ['wall_slim_join2_4', 'wall_slim_tip_3', 'wall_concave_3', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'water_extend_4', 'plants_1', 'plants_4'], 's': ['wall_slim_extend_2', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_join2_3', 'wall_straight_join1_3', 'wall_slim_extend_4'], 'w': ['wall_slim_join2_4', 'wall_slim_extend_3', 'wall_straight_join1_4', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_extend_1']}, 'neighbours': []} ,
-'wall_slim_join3_3': {'weight': 3, 'slots': {'n': ['wall_slim_join2_1', 'wall_slim_extend_4', 'wall_straight_join1_1', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_extend_2'], 'e': ['wall_slim_join2_1', 'wall_slim_tip_4', 'wall_slim_extend_3', 'wall_slim_join2_2', 'wall_straight_join1_2', 'wall_slim_extend_1'], 's': ['wall_slim_join2_1', 'wall_slim_tip_4', 'wall_concave_4', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'water_extend_1', 'plants_2', 'plants_1'], 'w': ['wall_slim_extend_3', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_join2_4', 'wall_straight_join1_4', 'wall_slim_extend_1']}, 'neighbours': []} ,
-'wall_slim_join3_4': {'weight': 3, 'slots': {'n': ['wall_slim_extend_4', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_join2_1', 'wall_straight_join1_1', 'wall_slim_extend_2'], 'e': ['wall_slim_join2_2', 'wall_slim_extend_1', 'wall_straight_join1_2', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_extend_3'], 's': ['wall_slim_join2_2', 'wall_slim_tip_1', 'wall_slim_extend_4', 'wall_slim_join2_3', 'wall_straight_join1_3', 'wall_slim_extend_2'], 'w': ['wall_slim_join2_2', 'wall_slim_tip_1', 'wall_concave_1', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'water_extend_2', 'plants_3', 'plants_2']}, 'neighbours': []} ,
-'wall_slim_join4_1': {'weight': 3, 'slots': {'n': {'wall_slim_tip_3', 'wall_slim_extend_2', 'wall_slim_join2_1', 'wall_straight_join1_1', 'wall_slim_join2_4', 'wall_slim_extend_4'}, 'e': {'wall_slim_extend_1', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_join2_2', 'wall_straight_join1_2', 'wall_slim_extend_3'}, 's': {'wall_slim_join2_3', 'wall_slim_extend_2', 'wall_straight_join1_3', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_extend_4'}, 'w': {'wall_slim_join2_3', 'wall_slim_tip_2', 'wall_slim_extend_1', 'wall_slim_join2_4', 'wall_straight_join1_4', 'wall_slim_extend_3'}}, 'neighbours': []} ,
-'wall_slim_join4_2': {'weight': 3, 'slots': {'n': ['wall_slim_join2_4', 'wall_slim_tip_3', 'wall_slim_extend_2', 'wall_slim_join2_1', 'wall_straight_join1_1', 'wall_slim_extend_4'], 'e': ['wall_slim_tip_4', 'wall_slim_extend_3', 'wall_slim_join2_2', 'wall_straight_join1_2', 'wall_slim_join2_1', 'wall_slim_extend_1'], 's': ['wall_slim_extend_2', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_join2_3', 'wall_straight_join1_3', 'wall_slim_extend_4'], 'w': ['wall_slim_join2_4', 'wall_slim_extend_3', 'wall_straight_join1_4', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_extend_1']}, 'neighbours': []} ,
-'wall_slim_join4_3': {'weight': 3, 'slots': {'n': ['wall_slim_join2_1', 'wall_slim_extend_4', 'wall_straight_join1_1', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_extend_2'], 'e': ['wall_slim_join2_1', 'wall_slim_tip_4', 'wall_slim_extend_3', 'wall_slim_join2_2', 'wall_straight_join1_2', 'wall_slim_extend_1'], 's': ['wall_slim_tip_1', 'wall_slim_extend_4', 'wall_slim_join2_3', 'wall_straight_join1_3', 'wall_slim_join2_2', 'wall_slim_extend_2'], 'w': ['wall_slim_extend_3', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_join2_4', 'wall_straight_join1_4', 'wall_slim_extend_1']}, 'neighbours': []} ,
-'wall_slim_join4_4': {'weight': 3, 'slots': {'n': ['wall_slim_extend_4', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_join2_1', 'wall_straight_join1_1', 'wall_slim_extend_2'], 'e': ['wall_slim_join2_2', 'wall_slim_extend_1', 'wall_straight_join1_2', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_extend_3'], 's': ['wall_slim_join2_2', 'wall_slim_tip_1', 'wall_slim_extend_4', 'wall_slim_join2_3', 'wall_straight_join1_3', 'wall_slim_extend_2'], 'w': ['wall_slim_tip_2', 'wall_slim_extend_1', 'wall_slim_join2_4', 'wall_straight_join1_4', 'wall_slim_join2_3', 'wall_slim_extend_3']}, 'neighbours': []} ,
-'wall_slim_single_1': {'weight': 3, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_join3_3', 'wall_slim_tip_2', 'wall_concave_2', 'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'water_extend_3', 'plants_4', 'plants_3'}, 'e': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_tip_2', 'wall_concave_2', 'water_extend_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_straight_2_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_4', 'plants_3', 'wall_straight_1_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_slim_join3_2', 'wall_concave_4', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'wall_straight_1_4', 'wall_straight_2_4', 'empty_3', 'plants_2', 'water_extend_2', 'plants_4', 'wall_slim_join2_1', 'plants_3'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_single_2': {'weight': 3, 'slots': {'n': ['water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_slim_join3_3', 'wall_concave_1', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'wall_straight_1_1', 'wall_straight_2_1', 'empty_4', 'plants_3', 'water_extend_3', 'plants_1', 'wall_slim_join2_2', 'plants_4'], 'e': ['wall_slim_join2_4', 'wall_slim_join3_4', 'wall_slim_tip_3', 'wall_concave_3', 'water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'water_extend_4', 'plants_1', 'plants_4'], 's': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_tip_3', 'wall_concave_3', 'water_extend_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_straight_2_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_1', 'plants_4', 'wall_straight_1_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_single_3': {'weight': 3, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_slim_join3_4', 'wall_concave_2', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'wall_straight_1_2', 'wall_straight_2_2', 'empty_1', 'plants_4', 'water_extend_4', 'plants_2', 'wall_slim_join2_3', 'plants_1'], 's': ['wall_slim_join2_1', 'wall_slim_join3_1', 'wall_slim_tip_4', 'wall_concave_4', 'water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'water_extend_1', 'plants_2', 'plants_1'], 'w': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_tip_4', 'wall_concave_4', 'water_extend_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_straight_2_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_2', 'plants_1', 'wall_straight_1_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_single_4': {'weight': 3, 'slots': {'n': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_tip_1', 'wall_concave_1', 'water_extend_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_straight_2_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_3', 'plants_2', 'wall_straight_1_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_slim_join3_1', 'wall_concave_3', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'wall_straight_1_3', 'wall_straight_2_3', 'empty_2', 'plants_1', 'water_extend_1', 'plants_3', 'wall_slim_join2_4', 'plants_2'], 'w': ['wall_slim_join2_2', 'wall_slim_join3_2', 'wall_slim_tip_1', 'wall_concave_1', 'water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'water_extend_2', 'plants_3', 'plants_2']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_tip_1': {'weight': 3, 'slots': {'n': {'wall_slim_join3_4', 'wall_slim_join3_2', 'wall_slim_join4_3', 'wall_slim_tip_3', 'wall_slim_extend_2', 'wall_slim_join2_1', 'wall_straight_join1_1', 'wall_slim_join2_4', 'wall_slim_extend_4', 'wall_slim_join4_4', 'wall_slim_join4_2', 'wall_slim_join4_1', 'wall_slim_join3_1'}, 'e': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_tip_2', 'wall_concave_2', 'water_extend_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_straight_2_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_1', 'plants_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_4', 'plants_3', 'wall_straight_1_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'water_convex_3', 'wall_slim_tip_4', 'wall_concave_1', 'empty_1', 'empty_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_slim_join3_2', 'wall_concave_4', 'wall_slim_extend_2', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_extend_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'empty_4', 'wall_straight_1_4', 'wall_straight_2_4', 'empty_3', 'plants_2', 'water_extend_2', 'plants_4', 'wall_slim_join2_1', 'plants_3'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_tip_2': {'weight': 3, 'slots': {'n': ['water_convex_4', 'wall_slim_tip_1', 'wall_concave_2', 'empty_2', 'empty_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_slim_join3_3', 'wall_concave_1', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'wall_straight_1_1', 'wall_straight_2_1', 'empty_4', 'plants_3', 'water_extend_3', 'plants_1', 'wall_slim_join2_2', 'plants_4'], 'e': ['wall_slim_join3_1', 'wall_slim_join3_3', 'wall_slim_join4_4', 'wall_slim_tip_4', 'wall_slim_extend_3', 'wall_slim_join2_2', 'wall_straight_join1_2', 'wall_slim_join2_1', 'wall_slim_extend_1', 'wall_slim_join4_1', 'wall_slim_join4_3', 'wall_slim_join4_2', 'wall_slim_join3_2'], 's': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_tip_3', 'wall_concave_3', 'water_extend_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_straight_2_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'water_convex_2', 'plants_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'empty_1', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_1', 'plants_4', 'wall_straight_1_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_tip_3': {'weight': 3, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['water_convex_1', 'wall_slim_tip_2', 'wall_concave_3', 'empty_3', 'empty_4', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_slim_join3_4', 'wall_concave_2', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'wall_straight_1_2', 'wall_straight_2_2', 'empty_1', 'plants_4', 'water_extend_4', 'plants_2', 'wall_slim_join2_3', 'plants_1'], 's': ['wall_slim_join3_2', 'wall_slim_join3_4', 'wall_slim_join4_1', 'wall_slim_tip_1', 'wall_slim_extend_4', 'wall_slim_join2_3', 'wall_straight_join1_3', 'wall_slim_join2_2', 'wall_slim_extend_2', 'wall_slim_join4_2', 'wall_slim_join4_4', 'wall_slim_join4_3', 'wall_slim_join3_3'], 'w': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_tip_4', 'wall_concave_4', 'water_extend_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_straight_2_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'water_convex_3', 'plants_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_slim_single_2', 'wall_slim_tip_1', 'empty_2', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_2', 'plants_1', 'wall_straight_1_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_slim_tip_4': {'weight': 3, 'slots': {'n': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_tip_1', 'wall_concave_1', 'water_extend_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_straight_2_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_4', 'plants_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_3', 'plants_2', 'wall_straight_1_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['water_convex_2', 'wall_slim_tip_3', 'wall_concave_4', 'empty_4', 'empty_1', 'wall_slim_single_1', 'wall_slim_tip_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_slim_join3_1', 'wall_concave_3', 'wall_slim_extend_1', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_extend_3', 'wall_slim_single_3', 'wall_slim_tip_2', 'empty_3', 'wall_straight_1_3', 'wall_straight_2_3', 'empty_2', 'plants_1', 'water_extend_1', 'plants_3', 'wall_slim_join2_4', 'plants_2'], 'w': ['wall_slim_join3_3', 'wall_slim_join3_1', 'wall_slim_join4_2', 'wall_slim_tip_2', 'wall_slim_extend_1', 'wall_slim_join2_4', 'wall_straight_join1_4', 'wall_slim_join2_3', 'wall_slim_extend_3', 'wall_slim_join4_3', 'wall_slim_join4_1', 'wall_slim_join4_4', 'wall_slim_join3_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'wall_straight_1_1': {'weight': 5, 'slots': {'n': {'wall_straight_1_1', 'full_4', 'wall_convex_4', 'wall_convex_3', 'wall_straight_2_3', 'full_1', 'full_2', 'wall_straight_join1_3', 'full_3'}, 'e': {'wall_concave_1', 'wall_convex_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'wall_convex_1', 'wall_concave_2'}}, 'neighbours': ['e', 's', 'w']} ,
-'wall_straight_1_2': {'weight': 5, 'slots': {'n': ['wall_convex_2', 'wall_concave_3'], 'e': ['wall_straight_1_2', 'full_1', 'wall_convex_1', 'wall_convex_4', 'wall_straight_2_4', 'full_2', 'full_3', 'wall_straight_join1_4', 'full_4'], 's': ['wall_concave_2', 'wall_convex_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['s', 'w', 'n']} ,
-'wall_straight_1_3': {'weight': 5, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['wall_convex_3', 'wall_concave_4'], 's': ['wall_straight_1_3', 'full_2', 'wall_convex_2', 'wall_convex_1', 'wall_straight_2_1', 'full_3', 'full_4', 'wall_straight_join1_1', 'full_1'], 'w': ['wall_concave_3', 'wall_convex_4']}, 'neighbours': ['w', 'n', 's']} ,
-'wall_straight_1_4': {'weight': 5, 'slots': {'n': ['wall_concave_4', 'wall_convex_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['wall_convex_4', 'wall_concave_1'], 'w': ['wall_straight_1_4', 'full_3', 'wall_convex_3', 'wall_convex_2', 'wall_straight_2_2', 'full_4', 'full_1', 'wall_straight_join1_2', 'full_2']}, 'neighbours': ['n', 'e', 's']} ,
-'wall_straight_2_1': {'weight': 5, 'slots': {'n': {'wall_straight_1_1', 'full_4', 'wall_convex_4', 'wall_convex_3', 'wall_straight_2_3', 'full_1', 'full_2', 'wall_straight_join1_3', 'full_3', 'wall_straight_1_3'}, 'e': {'wall_concave_1', 'wall_convex_2'}, 's': {'wall_slim_tip_2', 'wall_straight_2_3', 'wall_slim_tip_4', 'wall_concave_3', 'empty_1', 'empty_2', 'wall_slim_single_2', 'water_convex_1', 'water_convex_2', 'plants_1', 'wall_slim_single_3', 'wall_concave_4', 'wall_slim_single_1', 'wall_slim_single_4', 'wall_slim_join3_1', 'wall_slim_extend_3', 'wall_straight_1_3', 'wall_slim_tip_3', 'wall_slim_extend_1', 'empty_4', 'water_extend_1', 'empty_3', 'plants_2', 'plants_4', 'wall_slim_join2_1', 'wall_slim_join2_4', 'plants_3'}, 'w': {'wall_convex_1', 'wall_concave_2'}}, 'neighbours': ['e', 's', 'w']} ,
-'wall_straight_2_2': {'weight': 5, 'slots': {'n': ['wall_convex_2', 'wall_concave_3'], 'e': ['wall_straight_1_2', 'full_1', 'wall_convex_1', 'wall_convex_4', 'wall_straight_2_4', 'full_2', 'full_3', 'wall_straight_join1_4', 'full_4', 'wall_straight_1_4'], 's': ['wall_concave_2', 'wall_convex_3'], 'w': ['wall_slim_tip_3', 'wall_straight_2_4', 'wall_slim_tip_1', 'wall_concave_4', 'empty_2', 'empty_3', 'wall_slim_single_3', 'water_convex_2', 'water_convex_3', 'plants_2', 'wall_slim_single_4', 'wall_concave_1', 'wall_slim_single_2', 'wall_slim_single_1', 'wall_slim_join3_2', 'wall_slim_extend_4', 'wall_straight_1_4', 'wall_slim_tip_4', 'wall_slim_extend_2', 'empty_1', 'water_extend_2', 'empty_4', 'plants_3', 'plants_1', 'wall_slim_join2_2', 'wall_slim_join2_1', 'plants_4']}, 'neighbours': ['s', 'w', 'n']} ,
-'wall_straight_2_3': {'weight': 5, 'slots': {'n': ['wall_slim_tip_4', 'wall_straight_2_1', 'wall_slim_tip_2', 'wall_concave_1', 'empty_3', 'empty_4', 'wall_slim_single_4', 'water_convex_3', 'water_convex_4', 'plants_3', 'wall_slim_single_1', 'wall_concave_2', 'wall_slim_single_3', 'wall_slim_single_2', 'wall_slim_join3_3', 'wall_slim_extend_1', 'wall_straight_1_1', 'wall_slim_tip_1', 'wall_slim_extend_3', 'empty_2', 'water_extend_3', 'empty_1', 'plants_4', 'plants_2', 'wall_slim_join2_3', 'wall_slim_join2_2', 'plants_1'], 'e': ['wall_convex_3', 'wall_concave_4'], 's': ['wall_straight_1_3', 'full_2', 'wall_convex_2', 'wall_convex_1', 'wall_straight_2_1', 'full_3', 'full_4', 'wall_straight_join1_1', 'full_1', 'wall_straight_1_1'], 'w': ['wall_concave_3', 'wall_convex_4']}, 'neighbours': ['w', 'n', 's']} ,
-'wall_straight_2_4': {'weight': 5, 'slots': {'n': ['wall_concave_4', 'wall_convex_1'], 'e': ['wall_slim_tip_1', 'wall_straight_2_2', 'wall_slim_tip_3', 'wall_concave_2', 'empty_4', 'empty_1', 'wall_slim_single_1', 'water_convex_4', 'water_convex_1', 'plants_4', 'wall_slim_single_2', 'wall_concave_3', 'wall_slim_single_4', 'wall_slim_single_3', 'wall_slim_join3_4', 'wall_slim_extend_2', 'wall_straight_1_2', 'wall_slim_tip_2', 'wall_slim_extend_4', 'empty_3', 'water_extend_4', 'empty_2', 'plants_1', 'plants_3', 'wall_slim_join2_4', 'wall_slim_join2_3', 'plants_2'], 's': ['wall_convex_4', 'wall_concave_1'], 'w': ['wall_straight_1_4', 'full_3', 'wall_convex_3', 'wall_convex_2', 'wall_straight_2_2', 'full_4', 'full_1', 'wall_straight_join1_2', 'full_2', 'wall_straight_1_2']}, 'neighbours': ['n', 'e', 's']} ,
-'wall_straight_join1_1': {'weight': 5, 'slots': {'n': {'full_4', 'wall_convex_4', 'wall_convex_3', 'wall_straight_2_3', 'full_1', 'full_2', 'wall_straight_join1_3', 'full_3', 'wall_straight_1_3'}, 'e': {'wall_straight_1_1', 'wall_straight_2_1', 'wall_convex_2', 'wall_concave_1', 'wall_straight_join1_1'}, 's': {'wall_slim_join2_3', 'wall_slim_join3_4', 'wall_slim_join3_2', 'wall_slim_join3_3', 'wall_slim_join4_3', 'wall_slim_extend_2', 'wall_straight_join1_3', 'wall_slim_tip_1', 'wall_slim_join2_2', 'wall_slim_join4_4', 'wall_slim_extend_4', 'wall_slim_join4_2', 'wall_slim_join4_1'}, 'w': {'wall_straight_1_1', 'wall_concave_2', 'wall_straight_2_1', 'wall_convex_1', 'wall_straight_join1_1'}}, 'neighbours': []} ,
-'wall_straight_join1_2': {'weight': 5, 'slots': {'n': ['wall_straight_1_2', 'wall_concave_3', 'wall_straight_2_2', 'wall_convex_2', 'wall_straight_join1_2'], 'e': ['full_1', 'wall_convex_1', 'wall_convex_4', 'wall_straight_2_4', 'full_2', 'full_3', 'wall_straight_join1_4', 'full_4', 'wall_straight_1_4'], 's': ['wall_straight_1_2', 'wall_straight_2_2', 'wall_convex_3', 'wall_concave_2', 'wall_straight_join1_2'], 'w': ['wall_slim_join2_4', 'wall_slim_join3_1', 'wall_slim_join3_3', 'wall_slim_join3_4', 'wall_slim_join4_4', 'wall_slim_extend_3', 'wall_straight_join1_4', 'wall_slim_tip_2', 'wall_slim_join2_3', 'wall_slim_join4_1', 'wall_slim_extend_1', 'wall_slim_join4_3', 'wall_slim_join4_2']}, 'neighbours': []} ,
-'wall_straight_join1_3': {'weight': 5, 'slots': {'n': ['wall_slim_join2_1', 'wall_slim_join3_2', 'wall_slim_join3_4', 'wall_slim_join3_1', 'wall_slim_join4_1', 'wall_slim_extend_4', 'wall_straight_join1_1', 'wall_slim_tip_3', 'wall_slim_join2_4', 'wall_slim_join4_2', 'wall_slim_extend_2', 'wall_slim_join4_4', 'wall_slim_join4_3'], 'e': ['wall_straight_1_3', 'wall_concave_4', 'wall_straight_2_3', 'wall_convex_3', 'wall_straight_join1_3'], 's': ['full_2', 'wall_convex_2', 'wall_convex_1', 'wall_straight_2_1', 'full_3', 'full_4', 'wall_straight_join1_1', 'full_1', 'wall_straight_1_1'], 'w': ['wall_straight_1_3', 'wall_straight_2_3', 'wall_convex_4', 'wall_concave_3', 'wall_straight_join1_3']}, 'neighbours': []} ,
-'wall_straight_join1_4': {'weight': 5, 'slots': {'n': ['wall_straight_1_4', 'wall_straight_2_4', 'wall_convex_1', 'wall_concave_4', 'wall_straight_join1_4'], 'e': ['wall_slim_join2_2', 'wall_slim_join3_3', 'wall_slim_join3_1', 'wall_slim_join3_2', 'wall_slim_join4_2', 'wall_slim_extend_1', 'wall_straight_join1_2', 'wall_slim_tip_4', 'wall_slim_join2_1', 'wall_slim_join4_3', 'wall_slim_extend_3', 'wall_slim_join4_1', 'wall_slim_join4_4'], 's': ['wall_straight_1_4', 'wall_concave_1', 'wall_straight_2_4', 'wall_convex_4', 'wall_straight_join1_4'], 'w': ['full_3', 'wall_convex_3', 'wall_convex_2', 'wall_straight_2_2', 'full_4', 'full_1', 'wall_straight_join1_2', 'full_2', 'wall_straight_1_2']}, 'neighbours': []} ,
-'water_concave_1': {'weight': 10, 'slots': {'n': {'water_extend_4', 'water_concave_4', 'water_convex_1'}, 'e': {'water_concave_2', 'water_extend_2', 'water_concave_3'}, 's': {'water_concave_4', 'water_concave_3', 'water_extend_3'}, 'w': {'water_concave_2', 'water_convex_1', 'water_extend_1'}}, 'neighbours': ['n', 'w']} ,
-'water_concave_2': {'weight': 10, 'slots': {'n': ['water_concave_3', 'water_convex_2', 'water_extend_2'], 'e': ['water_extend_1', 'water_concave_1', 'water_convex_2'], 's': ['water_concave_3', 'water_extend_3', 'water_concave_4'], 'w': ['water_concave_1', 'water_concave_4', 'water_extend_4']}, 'neighbours': ['e', 'n']} ,
-'water_concave_3': {'weight': 10, 'slots': {'n': ['water_concave_2', 'water_concave_1', 'water_extend_1'], 'e': ['water_concave_4', 'water_convex_3', 'water_extend_3'], 's': ['water_extend_2', 'water_concave_2', 'water_convex_3'], 'w': ['water_concave_4', 'water_extend_4', 'water_concave_1']}, 'neighbours': ['s', 'e']} ,
-'water_concave_4': {'weight': 10, 'slots': {'n': ['water_concave_1', 'water_extend_1', 'water_concave_2'], 'e': ['water_concave_3', 'water_concave_2', 'water_extend_2'], 's': ['water_concave_1', 'water_convex_4', 'water_extend_4'], 'w': ['water_extend_3', 'water_concave_3', 'water_convex_4']}, 'neighbours': ['w', 'n']} ,
-'water_convex_1': {'weight': 10, 'slots': {'n': {'wall_slim_join2_3', 'wall_slim_join3_3', 'wall_slim_tip_2', 'water_convex_3', 'wall_slim_tip_4', 'empty_1', 'empty_2', 'water_convex_4', 'wall_slim_single_2', 'wall_slim_tip_1', 'plants_1', 'wall_slim_single_3', 'wall_straight_2_1', 'wall_slim_single_1', 'wall_slim_join2_2', 'wall_slim_single_4', 'wall_slim_extend_3', 'wall_straight_1_1', 'wall_slim_extend_1', 'empty_4', 'empty_3', 'plants_2', 'water_extend_3', 'plants_4', 'plants_3'}, 'e': {'water_concave_1', 'water_extend_1', 'water_convex_2'}, 's': {'water_concave_1', 'water_extend_4', 'water_convex_4'}, 'w': {'water_convex_3', 'empty_3', 'plants_2', 'water_extend_2', 'plants_4', 'empty_4', 'empty_1', 'empty_2', 'water_convex_2', 'plants_3', 'plants_1'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_convex_2': {'weight': 10, 'slots': {'n': ['water_convex_4', 'empty_4', 'plants_3', 'water_extend_3', 'plants_1', 'empty_1', 'empty_2', 'empty_3', 'water_convex_3', 'plants_4', 'plants_2'], 'e': ['wall_slim_join2_4', 'wall_slim_join3_4', 'wall_slim_tip_3', 'water_convex_4', 'wall_slim_tip_1', 'empty_2', 'empty_3', 'water_convex_1', 'wall_slim_single_3', 'wall_slim_tip_2', 'plants_2', 'wall_slim_single_4', 'wall_straight_2_2', 'wall_slim_single_2', 'wall_slim_join2_3', 'wall_slim_single_1', 'wall_slim_extend_4', 'wall_straight_1_2', 'wall_slim_extend_2', 'empty_1', 'empty_4', 'plants_3', 'water_extend_4', 'plants_1', 'plants_4'], 's': ['water_concave_2', 'water_extend_2', 'water_convex_3'], 'w': ['water_concave_2', 'water_extend_1', 'water_convex_1']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_convex_3': {'weight': 10, 'slots': {'n': ['water_concave_3', 'water_extend_2', 'water_convex_2'], 'e': ['water_convex_1', 'empty_1', 'plants_4', 'water_extend_4', 'plants_2', 'empty_2', 'empty_3', 'empty_4', 'water_convex_4', 'plants_1', 'plants_3'], 's': ['wall_slim_join2_1', 'wall_slim_join3_1', 'wall_slim_tip_4', 'water_convex_1', 'wall_slim_tip_2', 'empty_3', 'empty_4', 'water_convex_2', 'wall_slim_single_4', 'wall_slim_tip_3', 'plants_3', 'wall_slim_single_1', 'wall_straight_2_3', 'wall_slim_single_3', 'wall_slim_join2_4', 'wall_slim_single_2', 'wall_slim_extend_1', 'wall_straight_1_3', 'wall_slim_extend_3', 'empty_2', 'empty_1', 'plants_4', 'water_extend_1', 'plants_2', 'plants_1'], 'w': ['water_concave_3', 'water_extend_3', 'water_convex_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_convex_4': {'weight': 10, 'slots': {'n': ['water_concave_4', 'water_extend_4', 'water_convex_1'], 'e': ['water_concave_4', 'water_extend_3', 'water_convex_3'], 's': ['water_convex_2', 'empty_2', 'plants_1', 'water_extend_1', 'plants_3', 'empty_3', 'empty_4', 'empty_1', 'water_convex_1', 'plants_2', 'plants_4'], 'w': ['wall_slim_join2_2', 'wall_slim_join3_2', 'wall_slim_tip_1', 'water_convex_2', 'wall_slim_tip_3', 'empty_4', 'empty_1', 'water_convex_3', 'wall_slim_single_1', 'wall_slim_tip_4', 'plants_4', 'wall_slim_single_2', 'wall_straight_2_4', 'wall_slim_single_4', 'wall_slim_join2_1', 'wall_slim_single_3', 'wall_slim_extend_2', 'wall_straight_1_4', 'wall_slim_extend_4', 'empty_3', 'empty_2', 'plants_1', 'water_extend_2', 'plants_3', 'plants_2']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_extend_1': {'weight': 10, 'slots': {'n': {'water_convex_3', 'water_extend_3', 'water_convex_4'}, 'e': {'water_concave_1', 'water_extend_1', 'water_convex_2'}, 's': {'water_concave_4', 'water_full_1', 'water_concave_3', 'water_extend_3', 'water_full_2', 'water_full_4', 'water_full_3'}, 'w': {'water_concave_2', 'water_convex_1', 'water_extend_1'}}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_extend_2': {'weight': 10, 'slots': {'n': ['water_concave_3', 'water_convex_2', 'water_extend_2'], 'e': ['water_convex_4', 'water_extend_4', 'water_convex_1'], 's': ['water_concave_2', 'water_extend_2', 'water_convex_3'], 'w': ['water_concave_1', 'water_full_2', 'water_concave_4', 'water_extend_4', 'water_full_3', 'water_full_1', 'water_full_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_extend_3': {'weight': 10, 'slots': {'n': ['water_concave_2', 'water_full_3', 'water_concave_1', 'water_extend_1', 'water_full_4', 'water_full_2', 'water_full_1'], 'e': ['water_concave_4', 'water_convex_3', 'water_extend_3'], 's': ['water_convex_1', 'water_extend_1', 'water_convex_2'], 'w': ['water_concave_3', 'water_extend_3', 'water_convex_4']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_extend_4': {'weight': 10, 'slots': {'n': ['water_concave_4', 'water_extend_4', 'water_convex_1'], 'e': ['water_concave_3', 'water_full_4', 'water_concave_2', 'water_extend_2', 'water_full_1', 'water_full_3', 'water_full_2'], 's': ['water_concave_1', 'water_convex_4', 'water_extend_4'], 'w': ['water_convex_2', 'water_extend_2', 'water_convex_3']}, 'neighbours': ['n', 'e', 's', 'w']} ,
-'water_full_1': {'weight': 10, 'slots': {'n': {'water_full_1', 'water_concave_1', 'water_full_2', 'water_extend_1', 'water_full_4', 'water_full_3', 'water_concave_2'}, 'e': {'water_full_1', 'water_concave_3', 'water_extend_2', 'water_full_2', 'water_full_4', 'water_full_3', 'water_concave_2'}, 's': {'water_concave_4', 'water_full_1', 'water_concave_3', 'water_extend_3', 'water_full_2', 'water_full_4', 'water_full_3'}, 'w': {'water_concave_4', 'water_full_1', 'water_concave_1', 'water_extend_4', 'water_full_2', 'water_full_4', 'water_full_3'}}, 'neighbours': []} ,
-'water_full_2': {'weight': 10, 'slots': {'n': ['water_concave_1', 'water_full_2', 'water_concave_2', 'water_extend_1', 'water_full_3', 'water_full_1', 'water_full_4'], 'e': ['water_full_2', 'water_concave_2', 'water_full_3', 'water_extend_2', 'water_full_1', 'water_full_4', 'water_concave_3'], 's': ['water_full_2', 'water_concave_4', 'water_extend_3', 'water_full_3', 'water_full_1', 'water_full_4', 'water_concave_3'], 'w': ['water_concave_1', 'water_full_2', 'water_concave_4', 'water_extend_4', 'water_full_3', 'water_full_1', 'water_full_4']}, 'neighbours': []} ,
-'water_full_3': {'weight': 10, 'slots': {'n': ['water_concave_2', 'water_full_3', 'water_concave_1', 'water_extend_1', 'water_full_4', 'water_full_2', 'water_full_1'], 'e': ['water_concave_2', 'water_full_3', 'water_concave_3', 'water_extend_2', 'water_full_4', 'water_full_2', 'water_full_1'], 's': ['water_full_3', 'water_concave_3', 'water_full_4', 'water_extend_3', 'water_full_2', 'water_full_1', 'water_concave_4'], 'w': ['water_full_3', 'water_concave_1', 'water_extend_4', 'water_full_4', 'water_full_2', 'water_full_1', 'water_concave_4']}, 'neighbours': []} ,
-'water_full_4': {'weight': 10, 'slots': {'n': ['water_full_4', 'water_concave_2', 'water_extend_1', 'water_full_1', 'water_full_3', 'water_full_2', 'water_concave_1'], 'e': ['water_concave_3', 'water_full_4', 'water_concave_2', 'water_extend_2', 'water_full_1', 'water_full_3', 'water_full_2'], 's': ['water_concave_3', 'water_full_4', 'water_concave_4', 'water_extend_3', 'water_full_1', 'water_full_3', 'water_full_2'], 'w': ['water_full_4', 'water_concave_4', 'water_full_1', 'water_extend_4', 'water_full_3', 'water_full_2', 'water_concave_1']}, 'neighbours': []} ,
-'full_1': {'weight': 0.01, 'slots': {'n': {'full_4', 'wall_convex_4', 'wall_convex_3', 'wall_straight_2_3', 'full_1', 'full_2', 'wall_straight_join1_3', 'full_3', 'wall_straight_1_3'}, 'e': {'wall_straight_2_4', 'wall_convex_4', 'full_4', 'full_1', 'full_2', 'wall_convex_1', 'wall_straight_1_4', 'full_3', 'wall_straight_join1_4'}, 's': {'wall_straight_1_1', 'full_4', 'wall_convex_2', 'wall_straight_2_1', 'full_1', 'full_2', 'wall_convex_1', 'wall_straight_join1_1', 'full_3'}, 'w': {'full_4', 'wall_convex_3', 'wall_convex_2', 'full_1', 'full_2', 'wall_straight_2_2', 'wall_straight_join1_2', 'full_3', 'wall_straight_1_2'}}, 'neighbours': []} ,
-'full_2': {'weight': 0.01, 'slots': {'n': ['full_1', 'wall_convex_4', 'wall_convex_3', 'full_2', 'full_3', 'wall_straight_2_3', 'wall_straight_join1_3', 'full_4', 'wall_straight_1_3'], 'e': ['full_1', 'wall_convex_1', 'wall_convex_4', 'wall_straight_2_4', 'full_2', 'full_3', 'wall_straight_join1_4', 'full_4', 'wall_straight_1_4'], 's': ['wall_straight_2_1', 'wall_convex_1', 'full_1', 'full_2', 'full_3', 'wall_convex_2', 'wall_straight_1_1', 'full_4', 'wall_straight_join1_1'], 'w': ['wall_straight_1_2', 'full_1', 'wall_convex_3', 'wall_straight_2_2', 'full_2', 'full_3', 'wall_convex_2', 'wall_straight_join1_2', 'full_4']}, 'neighbours': []} ,
-'full_3': {'weight': 0.01, 'slots': {'n': ['wall_straight_1_3', 'full_2', 'wall_convex_4', 'wall_straight_2_3', 'full_3', 'full_4', 'wall_convex_3', 'wall_straight_join1_3', 'full_1'], 'e': ['full_2', 'wall_convex_1', 'wall_convex_4', 'full_3', 'full_4', 'wall_straight_2_4', 'wall_straight_join1_4', 'full_1', 'wall_straight_1_4'], 's': ['full_2', 'wall_convex_2', 'wall_convex_1', 'wall_straight_2_1', 'full_3', 'full_4', 'wall_straight_join1_1', 'full_1', 'wall_straight_1_1'], 'w': ['wall_straight_2_2', 'wall_convex_2', 'full_2', 'full_3', 'full_4', 'wall_convex_3', 'wall_straight_1_2', 'full_1', 'wall_straight_join1_2']}, 'neighbours': []} ,
-'full_4': {'weight': 0.01, 'slots': {'n': ['wall_straight_2_3', 'wall_convex_3', 'full_3', 'full_4', 'full_1', 'wall_convex_4', 'wall_straight_1_3', 'full_2', 'wall_straight_join1_3'], 'e': ['wall_straight_1_4', 'full_3', 'wall_convex_1', 'wall_straight_2_4', 'full_4', 'full_1', 'wall_convex_4', 'wall_straight_join1_4', 'full_2'], 's': ['full_3', 'wall_convex_2', 'wall_convex_1', 'full_4', 'full_1', 'wall_straight_2_1', 'wall_straight_join1_1', 'full_2', 'wall_straight_1_1'], 'w': ['full_3', 'wall_convex_3', 'wall_convex_2', 'wall_straight_2_2', 'full_4', 'full_1', 'wall_straight_join1_2', 'full_2', 'wall_straight_1_2']}, 'neighbours': []} ,
-}
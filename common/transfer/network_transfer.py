@@ -5,15 +5,18 @@ from common.typings import Address
 
 class NetworkTransfer:
     def __init__(self):
-        self.data: dict[str, Union[str, int]] = {}
+        self.data: dict[str, Union[str, int, bytes]] = {}
         self.payload: bytes = b""
         self.destination: Address = (None, None)
         self.source: Address = (None, None)
         self.retransmission_count: int = 1
 
-    def get(self, key: str) -> Union[str, int]:
+    def get(self, key: str) -> Union[str, int, bytes]:
         return self.data[key]
 
+    def has(self, key: str) -> bool:
+        return key in self.data
+
     def get_payload(self) -> bytes:
         return self.payload
 
@@ -7,7 +7,7 @@ from common.typings import Address, SupportsBuildingNetworkTransfer
 
 class NetworkTransferBuilder(SupportsBuildingNetworkTransfer):
     def __init__(self):
-        self.data: dict[str, Union[str, int]] = {}
+        self.data: dict[str, Union[str, int, bytes]] = {}
         self.destination = ("", 0)  # in form of ("127.0.0.1", 1234)
         self.source = ("", 0)
 
@@ -16,7 +16,7 @@ class NetworkTransferBuilder(SupportsBuildingNetworkTransfer):
         self.destination = ("", 0)
         self.source = ("", 0)
 
-    def add(self, key: str, value: Union[str, int]):
+    def add(self, key: str, value: Union[str, int, bytes]):
         self.data[key] = value
 
     def set_destination(self, address: Address):
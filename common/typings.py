@@ -56,7 +56,7 @@ class TimeStep(NamedTuple):
 
 class SupportsBuildingNetworkTransfer(Protocol):
     @abstractmethod
-    def add(self, key: str, value: Union[str, int]):
+    def add(self, key: str, value: Union[str, int, bytes]):
         raise NotImplementedError()
 
     @abstractmethod
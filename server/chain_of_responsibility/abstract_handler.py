@@ -18,6 +18,11 @@ class AbstractHandler(SupportsServerOperationsChain):
 
         return []
 
+    @staticmethod
+    def get_cached_maps(transfer: NetworkTransfer) -> list[str]:
+        """ hashes of maps the client has cached, sent with FIND_ROOM """
+        return str(transfer.get("map_hashes")).split(",") if transfer.has("map_hashes") else []
+
     def repeat_for_all_addresses(
             self,
             addresses: list[Address],
@@ -19,11 +19,13 @@ class BoltHandler(AbstractHandler):
             return self.pass_to_next(context)
 
         old_bolt_id = context.transfer.get('bolt_id')
-        self.bolt_factory.remove_bolt(old_bolt_id)
+        if not self.bolt_factory.remove_bolt(old_bolt_id):
+            # already picked up by someone else
+            return []
         new_bolt = self.bolt_factory.add_bolt()
         self.network_transfer_builder.add("type", Messages.BOLTS_UPDATE)
         self.network_transfer_builder.add("old_bolt", old_bolt_id)
-        self.network_transfer_builder.add("new_bolt", new_bolt)
+        self.network_transfer_builder.add("new_bolt", self.bolt_factory.dump_bolts([new_bolt]))
 
         return self.repeat_for_all_addresses(
             context.known_addresses,
@@ -32,7 +32,8 @@ class ExistingClientHandler(AbstractHandler):
         self.network_transfer_builder.add("id", player_controller.get_id())
         self.network_transfer_builder.set_destination(address)
         self.network_transfer_builder.add("type", Messages.FIND_ROOM_OK)
-        self.game.get_game_config(player_controller.get_id()) \
-            .transfer(self.network_transfer_builder)
+        game_config = self.game.get_game_config(player_controller.get_id())
+        game_config.transfer(self.network_transfer_builder,
+                             with_tiles=game_config.map_hash not in self.get_cached_maps(transfer))
 
         return [self.network_transfer_builder.encode()]
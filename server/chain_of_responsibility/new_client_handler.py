@@ -45,7 +45,7 @@ class NewClientHandler(AbstractHandler):
         new_player_id = self.adder(address, str(transfer.get("username")))
 
         new_player_transfers = [
-            self.__get_new_player_config_transfer(address, new_player_id)
+            self.__get_new_player_config_transfer(address, new_player_id, self.get_cached_maps(transfer))
         ]
 
         new_player_transfers = self.__add_picked_flag(address, new_player_transfers)
@@ -70,13 +70,14 @@ class NewClientHandler(AbstractHandler):
     def __get_new_player_config_transfer(
             self,
             address: Address,
-            new_player_id: str
+            new_player_id: str,
+            cached_maps: list[str]
     ) -> NetworkTransfer:
         self.network_transfer_builder.add("id", str(new_player_id))
         self.network_transfer_builder.set_destination(address)
         self.network_transfer_builder.add("type", Messages.FIND_ROOM_OK)
-        self.game.get_game_config(new_player_id) \
-            .transfer(self.network_transfer_builder)
+        game_config = self.game.get_game_config(new_player_id)
+        game_config.transfer(self.network_transfer_builder, with_tiles=game_config.map_hash not in cached_maps)
         return self.network_transfer_builder.encode()
 
     def __add_picked_flag(
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from panda3d.core import ModelNode, NodePath
+
+
+class HeadlessLoader:
+    """
+    Stands in for the model loader of a server without a window - every model is an empty node named
+    after its file. The simulation only hangs colliders under models and moves them around, so it
+    works the same, while nothing renderable is ever read from disk or kept in memory.
+    """
+
+    def __init__(self):
+        self.models_skipped = 0
+
+    def load_model(self, model_path: str, **_) -> NodePath:
+        self.models_skipped += 1
+        return NodePath(ModelNode(Path(model_path).stem))
+
+    loadModel = load_model
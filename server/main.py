@@ -2,6 +2,8 @@ import random
 import sys
 import time
 from collections import deque
+from pathlib import Path
+from random import Random
 from typing import Union
 
 import panda3d.core as p3d
@@ -12,8 +14,9 @@ from direct.showbase.ShowBaseGlobal import globalClock
 from direct.task.TaskManagerGlobal import taskMgr
 from panda3d.core import Vec3, ClockObject
 
+from common.bam_loader import BamLoader
 from common.collision.collision_builder import CollisionBuilder
-from common.config import FRAMERATE, MAP_SIZE, SERVER_PORT, INV_TICK_RATE
+from common.config import FRAMERATE, MAP_SIZE, SERVER_PORT, INV_TICK_RATE, MAP_POOL_DEPTH
 from common.objects.bullet import Bullet
 from common.objects.bullet_factory import BulletFactory
 from common.objects.bolt_factory import BoltFactory
@@ -22,6 +25,7 @@ from common.player.player_controller import PlayerController
 from common.state.game_config import GameConfig
 from common.state.game_state_diff import GameStateDiff
 from common.state.player_state_diff import PlayerStateDiff
+from common.tiles.map_codec import encode_map, get_map_hash
 from common.tiles.tile_node_path_factory import TileNodePathFactory
 from common.connection.udp_connection_thread import UDPConnectionThread
 from common.transfer.network_transfer_builder import NetworkTransferBuilder
@@ -34,7 +38,14 @@ from server.chain_of_responsibility.freeze_player_handler import FreezePlayerHan
 from server.chain_of_responsibility.hello_handler import HelloHandler
 from server.chain_of_responsibility.movement_handler import MovementHandler
 from server.chain_of_responsibility.new_client_handler import NewClientHandler
+from server.headless_loader import HeadlessLoader
+from server.wfc.wfc_map_pool import WFCMapPool
+from server.wfc.wfc_map_store import get_map_store
+from server.wfc.wfc_service import WFCServiceClient
+from server.wfc.wfc_ruleset import get_ruleset
 from server.wfc.wfc_starter import start_wfc
+from server.wfc.wfc_trace import load_trace
+from server.wfc.wfc_trace_replay import WFCTraceReplay
 from server.accounts.db_manager import DBManager
 from server.typings import HandlerContext, ServerGame, SupportsServerOperationsChain
 
@@ -42,17 +53,23 @@ sys.path.append("../common")
 
 
 class Server(ShowBase, ServerGame):
-    def __init__(self, port, expected_players, view=False):
+    def __init__(self, port, expected_players, view=False, seed: Union[int, None] = None,
+                 trace: Union[Path, None] = None):
         if view:
             # show window for debug purposes, slows down everything
             super().__init__()
         else:
             super().__init__(windowType="none")
         self.view = view
+        # without the window nothing is drawn, so models are empty nodes which only carry colliders
+        self.models_loader = BamLoader(self.loader) if view else HeadlessLoader()
+        # generation trace replayed in the debug window, see server.wfc.wfc_trace
+        self.trace = trace
+        self.trace_replay: Union[WFCTraceReplay, None] = None
         self.port = port
         self.udp_connection = UDPConnectionThread('0.0.0.0', port, server=True)
         self.db_manager = DBManager()
-        self.node_path_factory = TileNodePathFactory(self.loader)
+        self.node_path_factory = TileNodePathFactory(self.models_loader)
         self.network_transfer_builder = NetworkTransferBuilder()
         self.active_players: dict[Address, PlayerController] = {}
         self.game_state_history: deque[GameStateDiff] = deque()
@@ -60,23 +77,30 @@ class Server(ShowBase, ServerGame):
         self.next_player_id = 0
         self.frames_processed = 0
         self.expected_players = expected_players
-        self.season = random.choices([0, 1], weights=[5, 5], k=1)[0]
         print("[INFO] Starting WFC map generation")
-        self.tiles, self.player_positions = start_wfc(MAP_SIZE, 4)
+        self.__set_map(seed if seed is not None else self.__initial_seed())
+        # maps of next matches are generated out of process, so that the solver does not hold the GIL
+        try:
+            self.map_service: Union[WFCServiceClient, None] = WFCServiceClient.start()
+        except OSError as e:
+            print(f"[WARN] WFC service not available, maps are generated here: {e}")
+            self.map_service = None
+        self.map_pool = WFCMapPool(MAP_SIZE, 4, MAP_POOL_DEPTH, self.map_service)
         self.bullet_factory = BulletFactory(self.render)
-        self.bolt_factory = BoltFactory(self.loader, self.render)
+        self.bolt_factory = BoltFactory(self.models_loader, self.render)
         self.bolt_factory.spawn_bolts()
         self.projectiles_to_process: list[Bullet] = []
         self.bullets: list[Bullet] = []
         self.bullets_since_last_update: list[Bullet] = []
-        self.flag = Flag(self)
+        self.flag = Flag(self.models_loader, self.render)
         self.game_won_by: Union[None, PlayerController] = None
         self.request_handlers_chain = self.__setup_chain_of_responsibility()
-        self.collision_builder = CollisionBuilder(self.render, self.loader)
+        self.collision_builder = CollisionBuilder(self.render, self.models_loader)
         self.build_collisions()
         print("[INFO] Map generated")
         if self.view:
             self.__setup_view()
+            self.__replay_trace()
 
     def reset_server(self):
         print("[INFO] Resetting server...")
@@ -87,12 +111,15 @@ class Server(ShowBase, ServerGame):
         self.game_state_history = deque()
         self.last_game_state_timestamp = 0
         self.frames_processed = 0
-        self.flag = Flag(self)
+        self.flag = Flag(self.models_loader, self.render)
         print("  --   Clearing scene")
+        if self.trace_replay is not None:
+            self.trace_replay.stop()
+            self.trace_replay = None
         self.render.get_children().detach()
-        print("  --   Generating new map")
-        self.season = random.choices([0, 1], weights=[5, 5], k=1)[0]
-        self.tiles, self.player_positions = start_wfc(MAP_SIZE, 4)
+        print("  --   Taking new map from the pool")
+        self.__set_map(*self.map_pool.pop())
+        self.__print_map_pool_stats()
         self.request_handlers_chain = self.__setup_chain_of_responsibility()
         print("  --   Starting")
         self.build_collisions()
@@ -102,6 +129,38 @@ class Server(ShowBase, ServerGame):
             self.__setup_view()
         print("  --   Done. Server ready")
 
+    def __set_map(self, seed: int, tiles: Union[list[dict], None] = None,
+                  player_positions: Union[list[Vec3], None] = None):
+        """ generates the map of given seed, unless it is already generated """
+        # season comes from the seed as well, so the seed stands for the whole map
+        self.map_seed = seed
+        print(f"  --   Map seed: {self.map_seed}")
+        self.season = Random(self.map_seed).choices([0, 1], weights=[5, 5], k=1)[0]
+        if tiles is None:
+            tiles, player_positions = start_wfc(MAP_SIZE, 4, self.map_seed)
+        self.tiles, self.player_positions = tiles, player_positions
+        # encoded and hashed for game configs on the first join, every join and resend of this map reuses them
+        self.encoded_tiles: Union[bytes, None] = None
+        self.map_hash: Union[str, None] = None
+
+    @staticmethod
+    def __initial_seed() -> int:
+        # a map from the store when there is one, so that starting the server does not wait for WFC
+        stored_seeds = get_map_store().stored_seeds(get_ruleset(), MAP_SIZE, 4)
+        return random.choice(stored_seeds) if len(stored_seeds) > 0 else random.getrandbits(32)
+
+    def __print_map_pool_stats(self):
+        stats = self.map_pool.stats
+        print(f"  --   Map pool: {self.map_pool.ready_count()}/{self.map_pool.depth} ready, "
+              f"{stats.hits} hits, {stats.misses} misses, "
+              f"generation time {stats.last_generation_time:.2f}s (mean {stats.mean_generation_time():.2f}s)")
+
+    def finalizeExit(self):
+        self.map_pool.close()
+        if self.map_service is not None:
+            self.map_service.close()
+        super().finalizeExit()
+
     def listen(self):
         self.udp_connection.start()
         taskMgr.add(self.__handle_clients, "handle client messages")
@@ -118,13 +177,18 @@ class Server(ShowBase, ServerGame):
         self.projectiles_to_process.append(bullet)
 
     def get_game_config(self, player_id: str) -> GameConfig:
+        if self.encoded_tiles is None:
+            self.encoded_tiles = encode_map(self.tiles, MAP_SIZE)
+            self.map_hash = get_map_hash(self.encoded_tiles)
         return GameConfig(
             self.tiles,
             self.expected_players,
             player_id,
             [player.get_state() for player in self.active_players.values()],
             MAP_SIZE,
-            self.season
+            self.season,
+            self.encoded_tiles,
+            self.map_hash
         )
 
     def __handle_clients(self, task):
@@ -313,6 +377,12 @@ class Server(ShowBase, ServerGame):
         for c in self.collision_builder.get_tile_colliders():
             c.show()
 
+    def __replay_trace(self):
+        if self.trace is None:
+            return
+        self.trace_replay = WFCTraceReplay(self.render, self.models_loader, load_trace(self.trace), self.season)
+        self.trace_replay.start()
+
     def get_address_by_id(self, player_id):
         for address, player_controller in self.active_players.items():
             if player_controller.get_id() == player_id:
@@ -388,12 +458,14 @@ class Server(ShowBase, ServerGame):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Użycie: python -m server.main <liczba graczy>")
+    if len(sys.argv) not in [2, 3]:
+        print("Użycie: python -m server.main <liczba graczy> [ziarno mapy]")
         sys.exit(1)
     expected_players = int(sys.argv[1])
+    map_seed = int(sys.argv[2]) if len(sys.argv) == 3 else None
     # server = Server(SERVER_PORT, 1, True)  # this slows down the whole simulation, debug only
-    server = Server(SERVER_PORT, expected_players)
+    # server = Server(SERVER_PORT, 1, True, trace=Path("wfc.trace"))  # replays a trace of python -m server.wfc.wfc_trace
+    server = Server(SERVER_PORT, expected_players, seed=map_seed)
     globalClock.setMode(ClockObject.MLimited)
     globalClock.setFrameRate(FRAMERATE)
     server.listen()
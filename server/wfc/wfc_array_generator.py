@@ -0,0 +1,229 @@
+from random import Random
+from typing import Union
+
+import numpy as np
+
+from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_array_propagator import WFCArrayPropagator
+from server.wfc.wfc_connectivity import is_connected
+from server.wfc.wfc_decision_stack import WFCDecisionStack
+from server.wfc.wfc_grid import WFCGrid
+from server.wfc.wfc_ruleset import WFCRuleset
+from server.wfc.wfc_seeds import get_fixed_seeds, get_required_positions, get_safe_spaces_positions, \
+    get_sprinkled_seeds
+from server.wfc.wfc_stats import WFCStats
+
+
+class WFCArrayGridGenerator:
+    """
+    WFCGridGenerator for big maps - domains of all cells live in numpy arrays, every step collapses
+    a batch of cells far enough from each other and propagates them together in array sweeps.
+    Cell objects are only built for the finished grid.
+    """
+
+    # contradictions too old to backtrack are solved again in growing squares around them, up to this radius
+    MAX_REPAIR_RADIUS = 4
+    # a region given to solve() is started over at most this many times
+    REGION_ATTEMPTS = 3
+
+    def __init__(self, tiles_manager: TilesManager, ruleset: WFCRuleset,
+                 max_decisions: int = 64, max_backtracks: int = 256):
+        self.tiles_manager = tiles_manager
+        self.ruleset = ruleset
+        self.grid: Union[WFCGrid, None] = None
+        self.max_decisions = max_decisions
+        self.max_backtracks = max_backtracks
+        self.stats = WFCStats()
+        # the same generator as in tiles_manager, it decides everything about the map
+        self.rng: Random = tiles_manager.rng
+        self.np_rng: Union[np.random.Generator, None] = None
+        # cell where constraints given to solve() contradicted each other
+        self.contradiction: Union[int, None] = None
+
+    def generate(self, size: int, players_count: int) -> WFCGrid:
+        self.stats = WFCStats()
+        # vectorized draws need a numpy generator, it is seeded from the main one
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        possible_positions = get_safe_spaces_positions(size)
+        required = [x * size + y for x, y in get_required_positions(size)]
+        while True:
+            if not self.__generate(size, possible_positions[:players_count]):
+                self.stats.restarts += 1
+                print("  --   [WFC] contradiction, trying again")
+                continue
+            # corridors do not make sure of it, walls may still close them off
+            if is_connected(self.grid, required):
+                break
+            self.stats.restarts += 1
+            print("  --   [WFC] safe spaces cannot reach each other, trying again")
+
+        print(f"  --   [WFC] done after {self.stats.restarts} restarts, {self.stats.backtracks} backtracks"
+              f" and {self.stats.repairs} repairs")
+        return self.grid
+
+    def __generate(self, size: int, players_positions: [tuple[int, int]]) -> bool:
+        propagator = WFCArrayPropagator(self.ruleset, size, self.stats)
+        seeds = get_fixed_seeds(size, players_positions, self.rng)
+        fixed = np.zeros(size * size, dtype=bool)
+        for (x, y), tile in seeds:
+            propagator.set_collapsed(x * size + y, self.ruleset.index[tile])
+            fixed[x * size + y] = True
+        if not propagator.propagate(np.array([x * size + y for (x, y), _ in seeds])):
+            return False
+
+        for (x, y), tile in get_sprinkled_seeds(size, self.rng):
+            propagator.trail = []
+            cell = x * size + y
+            if propagator.set_collapsed(cell, self.ruleset.index[tile]) \
+                    and not propagator.propagate(np.array([cell])):
+                if self.max_decisions == 0:
+                    return False
+                self.stats.backtracks += 1
+                propagator.undo(propagator.trail)
+        propagator.trail = None
+
+        if not self.__solve(propagator, fixed, np.zeros(size * size, dtype=bool)):
+            return False
+        self.grid = WFCGrid.from_tiles(size, propagator.get_tiles(), self.tiles_manager, self.ruleset,
+                                       players_positions)
+        return True
+
+    def solve(self, size: int, constraints: np.ndarray) -> Union[np.ndarray, None]:
+        """
+        tile index of every cell of a size x size region where constraints (tile index or -1, cell id
+        is x * size + y) are kept as they are, None if they contradict or the region could not be solved
+        """
+        self.stats = WFCStats()
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.contradiction = None
+        fixed = constraints >= 0
+        for _ in range(self.REGION_ATTEMPTS):
+            propagator = WFCArrayPropagator(self.ruleset, size, self.stats)
+            for cell in np.flatnonzero(fixed):
+                propagator.set_collapsed(int(cell), int(constraints[cell]))
+            if not propagator.propagate(np.flatnonzero(fixed)):
+                self.contradiction = propagator.contradiction
+                return None
+            # the front grows from all constraints at once instead of meeting some of them head-on at the end
+            neighbours = propagator.neighbours[fixed].ravel()
+            frontier = np.zeros(size * size, dtype=bool)
+            frontier[neighbours[neighbours >= 0]] = True
+            if self.__solve(propagator, fixed, frontier):
+                return propagator.get_tiles()
+            self.stats.restarts += 1
+        return None
+
+    def __solve(self, propagator: WFCArrayPropagator, fixed: np.ndarray, frontier: np.ndarray) -> bool:
+        """
+        collapses all cells of the propagated grid, starting next to the frontier or at the lowest entropy
+        if it is empty, returns False if it cannot be done
+        """
+        size = propagator.size
+        # breaks ties between cells of equal entropy, like noise of WFCCell
+        noise = self.np_rng.random(size * size) * 1e-6
+        # like the priority queue of WFCGridGenerator, only cells next to previous decisions are candidates,
+        # so the map grows from a single front and contradictions are found close to their cause
+        # every decision keeps its cells, the tiles they have chosen and a trail of changes it caused
+        decisions = WFCDecisionStack(self.max_decisions, self.max_backtracks)
+        # repairs coming back to the same place start from a bigger area each time
+        last_repair: Union[int, None] = None
+        repair_radius = 1
+        while not propagator.collapsed.all():
+            entropy = np.where(propagator.collapsed, np.inf, propagator.entropy + noise)
+            if np.isinf(entropy[frontier]).all():
+                frontier[np.argmin(entropy)] = True
+            entropy[~frontier] = np.inf
+
+            cells = self.__local_minima(entropy, size)
+            neighbours = propagator.neighbours[cells].ravel()
+            frontier[neighbours[neighbours >= 0]] = True
+            tiles = self.ruleset.sampler.draw_batch(propagator.domains[cells], self.np_rng)
+            propagated = self.__decide(propagator, decisions, cells, tiles)
+
+            # cell left without any tile, decisions far from it are skipped when backtracking
+            dead_end: Union[int, None] = None
+            while not propagated:
+                # contradiction - roll back the latest decision and forbid its tile
+                decision = decisions.pop()
+                if decision is None:
+                    # the cause fell off the stack, with decisions of the whole front on it
+                    if last_repair is not None \
+                            and self.__distances(np.array([last_repair]), propagator.contradiction, size)[0] \
+                            <= self.MAX_REPAIR_RADIUS:
+                        repair_radius += 1
+                    else:
+                        repair_radius = 1
+                    last_repair = propagator.contradiction
+                    if not self.__repair(propagator, fixed, repair_radius):
+                        return False
+                    decisions = WFCDecisionStack(self.max_decisions, self.max_backtracks)
+                    break
+                self.stats.backtracks += 1
+                cells, tiles, trail = decision
+                propagator.undo(trail)
+                propagator.trail = decisions.top()[-1] if decisions.top() is not None else None
+                if dead_end is not None and self.__distances(cells, dead_end, size).min() > 2:
+                    continue
+                dead_end = None
+                if len(cells) > 1:
+                    # cells of the batch closest to the contradiction are to blame, the rest is collapsed again
+                    distances = self.__distances(cells, propagator.contradiction, size)
+                    keep = distances > max(distances.min(), 2)
+                    propagated = self.__decide(propagator, decisions, cells[keep], tiles[keep])
+                else:
+                    propagated = propagator.forbid(int(cells[0]), int(tiles[0])) and propagator.propagate(cells)
+                    if not propagated:
+                        dead_end = int(cells[0])
+            decisions.advance()
+        return True
+
+    def __repair(self, propagator: WFCArrayPropagator, fixed: np.ndarray, min_radius: int) -> bool:
+        """
+        solves the area around the last contradiction again, along with any cell left without tiles,
+        returns False if that did not help
+        """
+        self.stats.repairs += 1
+        size = propagator.size
+        cells = np.append(np.flatnonzero(~propagator.domains.any(axis=1)), propagator.contradiction)
+        xs, ys = np.divmod(cells, size)
+        for radius in range(min_radius, self.MAX_REPAIR_RADIUS + 1):
+            area = np.zeros((size, size), dtype=bool)
+            for x, y in zip(xs, ys):
+                area[max(x - radius, 0):x + radius + 1, max(y - radius, 0):y + radius + 1] = True
+            area = np.flatnonzero(area.ravel() & ~fixed)
+            propagator.trail = []
+            propagator.reset(area)
+            # the area is narrowed by itself and by its surroundings
+            sources = propagator.neighbours[area].ravel()
+            if propagator.propagate(np.union1d(area, sources[sources >= 0])):
+                propagator.trail = None
+                return True
+            propagator.undo(propagator.trail)
+        return False
+
+    @staticmethod
+    def __decide(propagator: WFCArrayPropagator, decisions: WFCDecisionStack,
+                 cells: np.ndarray, tiles: np.ndarray) -> bool:
+        if len(cells) == 0:
+            return True
+        propagator.trail = []
+        propagator.collapse(cells, tiles)
+        decisions.push((cells, tiles, propagator.trail))
+        return propagator.propagate(cells)
+
+    @staticmethod
+    def __distances(cells: np.ndarray, cell: int, size: int) -> np.ndarray:
+        xs, ys = np.divmod(cells, size)
+        x, y = divmod(cell, size)
+        return np.maximum(np.abs(xs - x), np.abs(ys - y))
+
+    @staticmethod
+    def __local_minima(entropy: np.ndarray, size: int) -> np.ndarray:
+        """
+        cells with the lowest entropy in their 5x5 neighbourhood - they are at least 3 cells apart,
+        so their collapses can be made in one step and barely interfere with each other
+        """
+        padded = np.pad(entropy.reshape(size, size), 2, constant_values=np.inf)
+        rows = np.minimum.reduce([padded[i:i + size] for i in range(5)])
+        window_minimum = np.minimum.reduce([rows[:, j:j + size] for j in range(5)]).ravel()
+        return np.flatnonzero((entropy == window_minimum) & ~np.isinf(entropy))
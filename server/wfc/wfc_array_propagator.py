@@ -0,0 +1,139 @@
+from functools import lru_cache
+from typing import Union
+
+import numpy as np
+
+from server.wfc.wfc_ruleset import WFCRuleset, DIRECTIONS
+from server.wfc.wfc_stats import WFCStats
+
+# indices of changed cells with copies of their domains and collapsed flags from before the change
+ArrayTrailEntry = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+@lru_cache(maxsize=8)
+def get_neighbour_table(size: int) -> np.ndarray:
+    """ (size * size, 4) ids of neighbours in DIRECTIONS order, -1 outside of the grid, cell id is x * size + y """
+    x, y = np.divmod(np.arange(size * size), size)
+    ids = x * size + y
+    table = np.stack([ids + 1, ids + size, ids - 1, ids - size], axis=1)
+    table[y == size - 1, 0] = -1
+    table[x == size - 1, 1] = -1
+    table[y == 0, 2] = -1
+    table[x == 0, 3] = -1
+    table.flags.writeable = False
+    return table
+
+
+class WFCArrayPropagator:
+    """
+    Keeps domains of the whole grid in a (size * size, chunks) uint8 array - the bitmask of a cell
+    split into bytes, see WFCRuleset. Every sweep narrows all neighbours of cells changed in the
+    previous sweep at once, until a fixpoint. Like in WFCGridGenerator, collapsed cells are never
+    narrowed by their neighbours.
+    """
+
+    def __init__(self, ruleset: WFCRuleset, size: int, stats: Union[WFCStats, None] = None):
+        self.ruleset = ruleset
+        self.size = size
+        self.stats = stats
+        self.neighbours = get_neighbour_table(size)
+        self.domains = np.tile(ruleset.to_chunks(ruleset.full_mask), (size * size, 1))
+        self.collapsed = np.zeros(size * size, dtype=bool)
+        self.entropy = np.full(size * size, ruleset.entropy(ruleset.full_mask))
+        # when set, every change is recorded so that it can be undone
+        self.trail: Union[list[ArrayTrailEntry], None] = None
+        # a cell left without tiles by the last failed propagation
+        self.contradiction: Union[int, None] = None
+        self.__chunk_indices = np.arange(ruleset.chunks_count)
+        # a neighbour in direction d constrains the cell with its slots in the opposite direction
+        self.__opposite = [(d + 2) % len(DIRECTIONS) for d in range(len(DIRECTIONS))]
+
+    def record(self, cells: np.ndarray):
+        if self.trail is not None:
+            self.trail.append((cells, self.domains[cells], self.collapsed[cells]))
+
+    def undo(self, trail: list[ArrayTrailEntry]):
+        for cells, domains, collapsed in reversed(trail):
+            self.domains[cells] = domains
+            self.collapsed[cells] = collapsed
+            self.entropy[cells] = self.__entropy(domains)
+
+    def get_domain(self, cell: int) -> int:
+        return self.ruleset.from_chunks(self.domains[cell])
+
+    def get_tiles(self) -> np.ndarray:
+        """ index of the first allowed tile of every cell """
+        return np.unpackbits(self.domains, axis=1, bitorder="little").argmax(axis=1)
+
+    def set_collapsed(self, cell: int, tile: int) -> bool:
+        if not self.get_domain(cell) >> tile & 1:
+            return False
+        self.collapse(np.array([cell]), np.array([tile]))
+        return True
+
+    def collapse(self, cells: np.ndarray, tiles: np.ndarray):
+        """ collapses every cell to its tile, tiles have to be in their domains """
+        self.record(cells)
+        self.domains[cells] = 0
+        self.domains[cells, tiles // self.ruleset.CHUNK_BITS] = 1 << (tiles % self.ruleset.CHUNK_BITS)
+        self.collapsed[cells] = True
+        self.entropy[cells] = 0.0
+
+    def reset(self, cells: np.ndarray):
+        """ makes cells uncollapsed with all tiles allowed, they need to be propagated again """
+        self.record(cells)
+        self.domains[cells] = self.ruleset.to_chunks(self.ruleset.full_mask)
+        self.collapsed[cells] = False
+        self.entropy[cells] = self.ruleset.entropy(self.ruleset.full_mask)
+
+    def forbid(self, cell: int, tile: int) -> bool:
+        """ removes the tile from the cell's domain, returns False if nothing is left """
+        self.record(np.array([cell]))
+        domain = self.get_domain(cell) & ~(1 << tile)
+        self.domains[cell] = self.ruleset.to_chunks(domain)
+        self.entropy[cell] = self.ruleset.entropy(domain)
+        if domain == 0:
+            self.contradiction = cell
+        return domain != 0
+
+    def propagate(self, cells: np.ndarray) -> bool:
+        """ propagates changes of given cells, returns False on contradiction """
+        changed = cells
+        while len(changed) > 0:
+            targets = self.neighbours[changed].ravel()
+            targets = np.unique(targets[targets >= 0])
+            targets = targets[~self.collapsed[targets]]
+
+            allowed = np.full((len(targets), self.ruleset.chunks_count), 0xff, dtype=np.uint8)
+            for d, neighbours in enumerate(self.neighbours[targets].T):
+                inside = neighbours >= 0
+                tables = self.ruleset.support_chunk_tables[self.__opposite[d]]
+                allowed[inside] &= np.bitwise_or.reduce(
+                    tables[self.__chunk_indices, self.domains[neighbours[inside]]], axis=1
+                )
+
+            old = self.domains[targets]
+            new = old & allowed
+            narrowed = (new != old).any(axis=1)
+            changed = targets[narrowed]
+            new = new[narrowed]
+
+            self.record(changed)
+            if self.stats is not None:
+                self.stats.propagations += len(changed)
+            self.domains[changed] = new
+            self.entropy[changed] = self.__entropy(new)
+            empty = ~new.any(axis=1)
+            if empty.any():
+                self.contradiction = int(changed[empty][0])
+                return False
+        return True
+
+    def __entropy(self, domains: np.ndarray) -> np.ndarray:
+        """ the same as TilesManager.get_entropy, from sums of w and w * log(w) of every domain """
+        weight_sums = self.ruleset.weight_chunk_tables[self.__chunk_indices, domains].sum(axis=-1)
+        weight_log_sums = self.ruleset.weight_log_chunk_tables[self.__chunk_indices, domains].sum(axis=-1)
+        nonempty = weight_sums > 0
+        entropy = np.zeros(len(domains))
+        entropy[nonempty] = np.log(weight_sums[nonempty]) - weight_log_sums[nonempty] / weight_sums[nonempty]
+        return entropy
@@ -0,0 +1,153 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from random import Random
+
+import numpy as np
+
+from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_array_generator import WFCArrayGridGenerator
+from server.wfc.wfc_chunked_generator import WFCChunkedGridGenerator
+from server.wfc.wfc_generator import WFCGridGenerator
+from server.wfc.wfc_ruleset import get_ruleset
+from server.wfc.wfc_starter import ARRAY_GENERATOR_MIN_SIZE, CHUNKED_GENERATOR_MIN_SIZE
+from server.wfc.wfc_stats import WFCStats
+
+GENERATORS = {
+    "cell": WFCGridGenerator,
+    "array": WFCArrayGridGenerator,
+    "chunked": WFCChunkedGridGenerator,
+}
+
+
+def get_generator_name(name: str, size: int) -> str:
+    """ "auto" picks the generator start_wfc would use for the size """
+    if name != "auto":
+        return name
+    if size >= CHUNKED_GENERATOR_MIN_SIZE:
+        return "chunked"
+    return "array" if size >= ARRAY_GENERATOR_MIN_SIZE else "cell"
+
+
+def generate(generator_name: str, size: int, players_count: int, seed: int) -> tuple[float, WFCStats]:
+    """ wall time of a single generation with its stats, output of the generator is dropped """
+    tiles_manager = TilesManager(Random(seed))
+    generator = GENERATORS[generator_name](tiles_manager, get_ruleset())
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        generator.generate(size, players_count)
+        generation_time = time.perf_counter() - start
+    return generation_time, generator.stats
+
+
+def measure_peak_memory(generator_name: str, size: int, players_count: int, seed: int) -> int:
+    """ peak of memory allocated while generating, in a separate run since tracing slows generation down """
+    tracemalloc.start()
+    try:
+        generate(generator_name, size, players_count, seed)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(generator_name: str, size: int, players_count: int, seeds: range, memory: bool = True) -> dict:
+    generator_name = get_generator_name(generator_name, size)
+    ruleset = get_ruleset()
+    support_hits, support_misses = ruleset.support_hits, ruleset.support_misses
+    times = []
+    stats = []
+    for seed in seeds:
+        generation_time, generation_stats = generate(generator_name, size, players_count, seed)
+        times.append(generation_time)
+        stats.append(generation_stats)
+
+    support_lookups = ruleset.support_hits + ruleset.support_misses - support_hits - support_misses
+    times = np.array(times)
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "generator": generator_name,
+        "size": size,
+        "players": players_count,
+        "seeds": [seeds.start, seeds.stop],
+        "maps": len(seeds),
+        "time": {
+            "p50": p50, "p95": p95, "p99": p99,
+            "mean": times.mean(), "min": times.min(), "max": times.max(),
+        },
+        "maps_per_second": len(seeds) / times.sum(),
+        # share of maps where any collapse had to be undone
+        "contradiction_rate": sum(1 for s in stats if s.restarts + s.backtracks + s.repairs > 0) / len(stats),
+        "restart_rate": sum(1 for s in stats if s.restarts > 0) / len(stats),
+        "restarts_per_map": sum(s.restarts for s in stats) / len(stats),
+        "backtracks_per_map": sum(s.backtracks for s in stats) / len(stats),
+        "repairs_per_map": sum(s.repairs for s in stats) / len(stats),
+        "propagations_per_map": sum(s.propagations for s in stats) / len(stats),
+        "support_cache_hit_rate": (ruleset.support_hits - support_hits) / support_lookups
+        if support_lookups > 0 else None,
+        "peak_memory_bytes": measure_peak_memory(generator_name, size, players_count, seeds.start)
+        if memory else None,
+    }
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """ configurations whose p50 or p95 time got worse than the baseline by more than the threshold ratio """
+    baseline_results = {(r["generator"], r["size"], r["players"], tuple(r["seeds"])): r for r in baseline}
+    regressions = []
+    for result in results:
+        key = (result["generator"], result["size"], result["players"], tuple(result["seeds"]))
+        if key not in baseline_results:
+            continue
+        for percentile in ["p50", "p95"]:
+            ratio = result["time"][percentile] / baseline_results[key]["time"][percentile]
+            if ratio > threshold:
+                regressions.append(f"{key[0]} {key[1]}x{key[1]}, {key[2]} players: {percentile} {ratio:.2f}x slower")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="measures map generation over sizes, players counts and seeds")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--seeds", type=int, default=10, help="number of maps of every configuration")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--generator", choices=["auto", *GENERATORS.keys()], default="auto")
+    parser.add_argument("--no-memory", action="store_true", help="skips the traced run measuring peak memory")
+    parser.add_argument("--output", type=Path, help="JSON file for results, printed when not given")
+    parser.add_argument("--baseline", type=Path, help="results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    arguments = parser.parse_args()
+
+    seeds = range(arguments.first_seed, arguments.first_seed + arguments.seeds)
+    results = []
+    for size in arguments.sizes:
+        for players_count in arguments.players:
+            result = benchmark(arguments.generator, size, players_count, seeds, not arguments.no_memory)
+            results.append(result)
+            print(f"[INFO] {result['generator']} {size}x{size}, {players_count} players:"
+                  f" p50 {result['time']['p50']:.3f}s, p95 {result['time']['p95']:.3f}s,"
+                  f" {result['maps_per_second']:.2f} maps/s, {result['restarts_per_map']:.2f} restarts per map",
+                  file=sys.stderr)
+
+    report = {
+        "ruleset": get_ruleset().hash,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if arguments.output is not None:
+        arguments.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+    if arguments.baseline is not None:
+        regressions = compare(results, json.loads(arguments.baseline.read_text())["results"], arguments.threshold)
+        for regression in regressions:
+            print(f"[WARN] {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
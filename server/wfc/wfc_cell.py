@@ -1,69 +1,78 @@
-from random import randint
 from typing import Union
 
-from common.tiles.tiles_manager import TilesManager
-from common.tiles.tilesmap import tiles_map
 from common.typings import Direction
 
 
+# domain, sums of w and w * log(w) over its tiles, entropy and index of collapsed tile or -1
+CellSnapshot = tuple[int, float, float, float, int]
+
+
 class WFCCell:
-    def __init__(self, position: tuple[int, int], id: int, tiles_manager: TilesManager):
-        self.allowed_tiles: set[str] = set(tiles_map.keys())
-        self.collapsed_tile: Union[str, None] = None
-        self.position = position
+    """ view of a single cell of WFCGrid, the state itself is kept by the grid """
+    __slots__ = ("grid", "id")
+
+    def __init__(self, grid, id: int):
+        self.grid = grid
         self.id = id
-        self.tiles_manager = tiles_manager
-        self.entropy = self.tiles_manager.get_total_entropy(self.allowed_tiles)
-        self.player = False
 
     def __repr__(self):
         return "{} ({}, {})".format(self.collapsed_tile, *self.position)
 
+    def __eq__(self, other):
+        return isinstance(other, WFCCell) and self.grid is other.grid and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self.grid.position(self.id)
+
+    @property
+    def domain(self) -> int:
+        return self.grid.domains[self.id]
+
+    @property
+    def collapsed_tile(self) -> Union[str, None]:
+        tile = self.grid.tiles[self.id]
+        return self.grid.ruleset.tiles[tile] if tile >= 0 else None
+
+    @property
+    def allowed_tiles(self) -> set[str]:
+        return set(self.grid.ruleset.tiles_of(self.domain))
+
     def has_player(self):
-        return self.player
+        return self.id in self.grid.players
 
     def place_player(self):
-        self.player = True
+        self.grid.place_player(self.id)
 
     def is_collapsed(self) -> bool:
-        return self.collapsed_tile is not None
+        return self.grid.is_collapsed(self.id)
 
     def collapse(self) -> Union[str, None]:
-        choices = list(self.allowed_tiles)
-        if len(choices) == 0:
-            return None
-        self.collapsed_tile = self.tiles_manager.draw_random_tile(self.allowed_tiles)
-        self.allowed_tiles = {self.collapsed_tile}
-        return self.collapsed_tile
+        return self.grid.collapse(self.id)
 
     def set_collapsed(self, tile: str) -> Union[str, None]:
-        if tile not in self.allowed_tiles:
-            return None
-        self.allowed_tiles = {tile}
-        self.collapsed_tile = tile
-        return tile
-
-    def update_allowed_tiles(self, new_allowed_tiles: set[str]) -> bool:
-        intersection = self.allowed_tiles.intersection(new_allowed_tiles)
-        if len(intersection) == len(self.allowed_tiles):
-            return False
-        self.allowed_tiles = intersection
-        self.entropy = self.tiles_manager.get_total_entropy(self.allowed_tiles)
-        return True
-
-    def get_slots(self, direction: Direction) -> set[str]:
-        if self.collapsed_tile is not None:
-            return self.tiles_manager.get_slots(self.collapsed_tile, direction)
-        slots = set()
-        for tile in self.allowed_tiles:
-            for s in self.tiles_manager.get_slots(tile, direction):
-                slots.add(s)
-        return slots
+        return self.grid.set_collapsed(self.id, tile)
+
+    def update_allowed_tiles(self, new_allowed_tiles: int) -> bool:
+        return self.grid.update_allowed_tiles(self.id, new_allowed_tiles)
+
+    def get_slots(self, direction: Direction) -> int:
+        return self.grid.get_slots(self.id, direction)
+
+    def snapshot(self) -> CellSnapshot:
+        return self.grid.snapshot(self.id)
+
+    def restore(self, snapshot: CellSnapshot):
+        self.grid.restore(self.id, snapshot)
 
     def get_entropy(self) -> float:
-        return self.entropy
+        return self.grid.entropies[self.id]
+
+    def get_priority(self) -> tuple[float, float]:
+        return self.grid.get_priority(self.id)
 
     def __gt__(self, other):
-        e1 = self.get_entropy()
-        e2 = other.get_entropy()
-        return e1 > e2 if e1 != e2 else randint(0, 1) == 1
+        return self.get_priority() > other.get_priority()
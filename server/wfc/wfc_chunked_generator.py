@@ -0,0 +1,227 @@
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from random import Random
+from typing import Union
+
+import numpy as np
+
+from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_array_generator import WFCArrayGridGenerator
+from server.wfc.wfc_connectivity import is_connected
+from server.wfc.wfc_grid import WFCGrid
+from server.wfc.wfc_ruleset import WFCRuleset, get_ruleset
+from server.wfc.wfc_seeds import get_fixed_seeds, get_required_positions, get_safe_spaces_positions
+from server.wfc.wfc_stats import WFCStats
+
+# left corner of a square region, its side and which of its cells are written back to the map
+Region = tuple[int, int, int, np.ndarray]
+
+
+def solve_region(size: int, constraints: np.ndarray, seed: int) \
+        -> tuple[Union[np.ndarray, None], WFCStats, Union[int, None]]:
+    """ runs in a worker process, see WFCArrayGridGenerator.solve """
+    generator = WFCArrayGridGenerator(TilesManager(Random(seed)), get_ruleset())
+    return generator.solve(size, constraints), generator.stats, generator.contradiction
+
+
+class WFCChunkedGridGenerator:
+    """
+    WFCArrayGridGenerator for very big maps - the map is split into chunks, every chunk is solved as
+    a region reaching OVERLAP cells into its neighbours, with one more ring of already solved cells
+    around it kept fixed as seam constraints. Regions are solved in four phases by parity of their
+    chunk coordinates, regions of one phase are far apart and solved in parallel by worker processes.
+    Cells of a region inside a neighbour solved in an earlier phase are solved again, so seams are
+    re-solved locally instead of forcing the first tiles on both sides to match.
+    """
+    CHUNK_SIZE = 64
+    OVERLAP = 6
+    # seam cells which contradict each other are released around the contradiction at most this many times
+    SEAM_RETRIES = 8
+    # cells around a clash left by released seam cells, which are solved again to fix it
+    PATCH_MARGIN = 3
+
+    def __init__(self, tiles_manager: TilesManager, ruleset: WFCRuleset, workers: Union[int, None] = None):
+        self.tiles_manager = tiles_manager
+        self.ruleset = ruleset
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.grid: Union[WFCGrid, None] = None
+        self.stats = WFCStats()
+        self.rng: Random = tiles_manager.rng
+        # allowed[d][a, b] - tile b may lie next to tile a in direction d, by the rules of either of them
+        count = len(ruleset.tiles)
+        self.allowed = {
+            direction: np.array([[ruleset.slots[direction][a] >> b & 1 or ruleset.slots[opposite][b] >> a & 1
+                                  for b in range(count)] for a in range(count)], dtype=bool)
+            for direction, opposite in (("n", "s"), ("e", "w"))
+        }
+
+    def generate(self, size: int, players_count: int) -> WFCGrid:
+        chunks = size // self.CHUNK_SIZE
+        if chunks < 2:
+            generator = WFCArrayGridGenerator(self.tiles_manager, self.ruleset)
+            self.grid = generator.generate(size, players_count)
+            self.stats = generator.stats
+            return self.grid
+
+        self.stats = WFCStats()
+        possible_positions = get_safe_spaces_positions(size)
+        players_positions = possible_positions[:players_count]
+        pinned = np.full((size, size), -1, dtype=np.int16)
+        for (x, y), tile in get_fixed_seeds(size, players_positions, self.rng):
+            if pinned[x, y] < 0:
+                pinned[x, y] = self.ruleset.index[tile]
+
+        phases = self.__phases(size, chunks)
+        required = [x * size + y for x, y in get_required_positions(size)]
+        while True:
+            # seeds of all regions are drawn up front, so the map does not depend on the order workers finish in
+            seeds = [[self.rng.getrandbits(64) for _ in phase] for phase in phases]
+            tiles = self.__generate(size, pinned, phases, seeds)
+            if tiles is None:
+                print("  --   [WFC] regions could not be joined, generating the map as a whole")
+                generator = WFCArrayGridGenerator(self.tiles_manager, self.ruleset)
+                self.grid = generator.generate(size, players_count)
+                self.stats = generator.stats
+                return self.grid
+
+            grid = WFCGrid.from_tiles(size, tiles.ravel(), self.tiles_manager, self.ruleset, players_positions)
+            # regions are solved without knowing about each other, walls of some may close the others off
+            if is_connected(grid, required):
+                break
+            self.stats.restarts += 1
+            print("  --   [WFC] safe spaces cannot reach each other, trying again")
+
+        print(f"  --   [WFC] {sum(len(phase) for phase in phases)} regions done after {self.stats.restarts}"
+              f" restarts, {self.stats.backtracks} backtracks and {self.stats.repairs} repairs")
+        self.grid = grid
+        return self.grid
+
+    def __generate(self, size: int, pinned: np.ndarray, phases: list[list[Region]],
+                   seeds: list[list[int]]) -> Union[np.ndarray, None]:
+        tiles = pinned.copy()
+        executor: Union[Executor, None] = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            for phase, phase_seeds in zip(phases, seeds):
+                jobs = []
+                for (x, y, side, written), seed in zip(phase, phase_seeds):
+                    window = tiles[x:x + side, y:y + side]
+                    # the ring around written cells stays as it is, pinned cells are kept everywhere
+                    constraints = np.where(written, pinned[x:x + side, y:y + side], window).ravel()
+                    if executor is None:
+                        job = solve_region(side, constraints, seed)
+                    else:
+                        job = executor.submit(solve_region, side, constraints, seed)
+                    jobs.append((constraints, job))
+
+                for region, seed, (constraints, job) in zip(phase, phase_seeds, jobs):
+                    result = job if executor is None else job.result()
+                    self.__add_stats(result[1])
+                    if not self.__join(tiles, pinned, region, constraints, seed, result):
+                        return None
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return tiles
+
+    def __join(self, tiles: np.ndarray, pinned: np.ndarray, region: Region, constraints: np.ndarray, seed: int,
+               result: tuple[Union[np.ndarray, None], WFCStats, Union[int, None]]) -> bool:
+        """
+        writes the solved region into the map, False if it could not be solved or joined; ring cells
+        released around contradictions are written as well, but they were solved without the cells just
+        outside of the region, so patches around the clashes this leaves are solved again
+        """
+        x, y, side, written = region
+        region_tiles, _, contradiction = result
+        solved = written.copy()
+        retries = 0
+        while region_tiles is None and contradiction is not None and retries < self.SEAM_RETRIES:
+            released = self.__release(constraints, written, pinned[x:x + side, y:y + side], contradiction)
+            if not released.any():
+                break
+            solved |= released.reshape(side, side)
+            retries += 1
+            region_tiles, stats, contradiction = solve_region(side, constraints, seed)
+            self.__add_stats(stats)
+        if region_tiles is None:
+            return False
+
+        window = tiles[x:x + side, y:y + side]
+        window[solved] = region_tiles.reshape(side, side)[solved]
+        size = tiles.shape[0]
+        # checked around the region as far as the biggest patch reaches
+        reach = self.PATCH_MARGIN + self.SEAM_RETRIES + 1
+        area = (slice(max(x - reach, 0), x + side + reach), slice(max(y - reach, 0), y + side + reach))
+        for repair in range(self.SEAM_RETRIES):
+            clashes = self.__clashes(tiles[area])
+            if len(clashes) == 0:
+                return True
+            # the first clash with its neighbour in the middle of a patch, the patch grows with every repair
+            clash_x, clash_y = clashes[0][0] + area[0].start, clashes[0][1] + area[1].start
+            patch_side = min(2 * (self.PATCH_MARGIN + repair) + 2, size)
+            patch_x = min(max(clash_x - patch_side // 2 + 1, 0), size - patch_side)
+            patch_y = min(max(clash_y - patch_side // 2 + 1, 0), size - patch_side)
+            free = np.zeros((patch_side, patch_side), dtype=bool)
+            free[1 if patch_x > 0 else 0:patch_side - 1 if patch_x + patch_side < size else patch_side,
+                 1 if patch_y > 0 else 0:patch_side - 1 if patch_y + patch_side < size else patch_side] = True
+            patch = tiles[patch_x:patch_x + patch_side, patch_y:patch_y + patch_side]
+            patch_pinned = pinned[patch_x:patch_x + patch_side, patch_y:patch_y + patch_side]
+            patch_tiles, stats, _ = solve_region(patch_side, np.where(free, patch_pinned, patch).ravel(),
+                                                 seed + repair + 1)
+            self.__add_stats(stats)
+            self.stats.repairs += 1
+            if patch_tiles is not None:
+                patch[free] = patch_tiles.reshape(patch_side, patch_side)[free]
+        return len(self.__clashes(tiles[area])) == 0
+
+    def __add_stats(self, stats: WFCStats):
+        self.stats.restarts += stats.restarts
+        self.stats.backtracks += stats.backtracks
+        self.stats.repairs += stats.repairs
+        self.stats.propagations += stats.propagations
+
+    def __clashes(self, tiles: np.ndarray) -> np.ndarray:
+        """ positions of solved cells which the ruleset rejects next to their solved n or e neighbour """
+        clashes = []
+        for direction, a, b in (("n", tiles[:, :-1], tiles[:, 1:]), ("e", tiles[:-1, :], tiles[1:, :])):
+            solved = (a >= 0) & (b >= 0)
+            allowed = np.ones(a.shape, dtype=bool)
+            allowed[solved] = self.allowed[direction][a[solved], b[solved]]
+            clashes.append(np.argwhere(~allowed))
+        return np.concatenate(clashes)
+
+    @staticmethod
+    def __release(constraints: np.ndarray, written: np.ndarray, pinned: np.ndarray, contradiction: int) -> np.ndarray:
+        """
+        frees seam cells around the contradiction - generators keep collapsed cells as they are, so a seam
+        may hold neighbours which do not allow each other, returns the mask of freed cells
+        """
+        side = written.shape[0]
+        x, y = divmod(contradiction, side)
+        area = np.zeros((side, side), dtype=bool)
+        area[max(x - 2, 0):x + 3, max(y - 2, 0):y + 3] = True
+        released = (area & ~written & (pinned < 0)).ravel() & (constraints >= 0)
+        constraints[released] = -1
+        return released
+
+    def __phases(self, size: int, chunks: int) -> list[list[Region]]:
+        """
+        regions grouped by parity of their chunk coordinates - two regions of one phase are at least
+        a chunk apart, which leaves more than enough room for the overlap of both
+        """
+        bounds = [(int(part[0]), len(part)) for part in np.array_split(np.arange(size), chunks)]
+        longest = max(length for _, length in bounds)
+        side = longest + 2 * (self.OVERLAP + 1)
+        phases = [[] for _ in range(4)]
+        for i, (x_start, x_length) in enumerate(bounds):
+            for j, (y_start, y_length) in enumerate(bounds):
+                x = min(max(x_start - (side - x_length) // 2, 0), size - side)
+                y = min(max(y_start - (side - y_length) // 2, 0), size - side)
+                written = np.zeros((side, side), dtype=bool)
+                # the outer ring is only written where it lies on the edge of the map
+                written[1 if x > 0 else 0:side - 1 if x + side < size else side,
+                        1 if y > 0 else 0:side - 1 if y + side < size else side] = True
+                phases[(i % 2) * 2 + j % 2].append((x, y, side, written))
+        return phases
@@ -0,0 +1,143 @@
+from collections import deque
+
+from server.wfc.wfc_grid import WFCGrid
+from server.wfc.wfc_ruleset import DIRECTIONS
+
+# child root, its new parent and whether the rank of the parent grew
+UnionEntry = tuple[int, int, bool]
+
+DIRECTION_INDEX = {direction: d for d, direction in enumerate(DIRECTIONS)}
+
+
+def is_connected(grid: WFCGrid, required: [int]) -> bool:
+    """
+    whether the required cells of a collapsed grid reach each other, for generators which do not keep
+    track of it while generating
+    """
+    passable = [grid.ruleset.passable[direction] for direction in DIRECTIONS]
+    tiles = grid.tiles
+    visited = {required[0]}
+    queue = deque([required[0]])
+    while queue:
+        cell = queue.popleft()
+        for direction, neighbour in grid.neighbours[cell]:
+            d = DIRECTION_INDEX[direction]
+            if neighbour not in visited and passable[d] >> tiles[cell] & 1 \
+                    and passable[(d + 2) % 4] >> tiles[neighbour] & 1:
+                visited.add(neighbour)
+                queue.append(neighbour)
+    return all(cell in visited for cell in required)
+
+
+class WFCConnectivity:
+    """
+    Keeps track of whether the required cells (safe spaces and the flag) can still reach each other.
+    Every cell has a signature of directions some tile of its domain lets a player through, a passage
+    between two cells may exist while both of them lead into each other. When a passage disappears,
+    its two cells are searched from at once - if they still reach each other nothing changed, otherwise
+    the side which ran out first is a pocket cut off from the rest and must not hold just some of the
+    required cells. Collapsed cells passable into each other are joined in a union-find, once all
+    required cells are in one set nothing can split them anymore. Unions are logged, so that
+    backtracking can roll them back.
+    """
+
+    def __init__(self, grid: WFCGrid, required: [int]):
+        self.grid = grid
+        self.required = list(dict.fromkeys(required))
+        self.passable = [grid.ruleset.passable[direction] for direction in DIRECTIONS]
+        self.parents = list(range(grid.size * grid.size))
+        self.ranks = [0] * (grid.size * grid.size)
+        self.unions: list[UnionEntry] = []
+        self.signatures = [self.__signature(cell) for cell in range(grid.size * grid.size)]
+        # some of the required cells were cut off from the others since the last check
+        self.split = False
+        self.searches = 0
+
+    def checkpoint(self) -> int:
+        return len(self.unions)
+
+    def rollback(self, checkpoint: int, cells: [int]):
+        """ undoes unions made after the checkpoint, cells are the ones restored by backtracking """
+        while len(self.unions) > checkpoint:
+            child, parent, rank_grew = self.unions.pop()
+            self.parents[child] = child
+            if rank_grew:
+                self.ranks[parent] -= 1
+        for cell in cells:
+            self.signatures[cell] = self.__signature(cell)
+        # the state from before the checkpoint has already been checked
+        self.split = False
+
+    def update(self, cell: int):
+        """ to be called after the domain of the cell changed """
+        old_signature = self.signatures[cell]
+        signature = self.__signature(cell)
+        lost = old_signature & ~signature
+        if not lost and self.grid.tiles[cell] < 0:
+            return
+        # passages are taken away one by one, so that each search sees a single passage missing
+        for direction, neighbour in self.grid.neighbours[cell]:
+            d = DIRECTION_INDEX[direction]
+            if lost >> d & 1 and self.__passage(cell, d, neighbour):
+                self.signatures[cell] &= ~(1 << d)
+                if not self.split and not self.connected():
+                    self.split = self.__splits(cell, neighbour)
+        self.signatures[cell] = signature
+        if self.grid.tiles[cell] < 0:
+            return
+        for direction, neighbour in self.grid.neighbours[cell]:
+            if self.grid.tiles[neighbour] >= 0 and self.__passage(cell, DIRECTION_INDEX[direction], neighbour):
+                self.__union(cell, neighbour)
+
+    def connected(self) -> bool:
+        root = self.__find(self.required[0])
+        return all(self.__find(cell) == root for cell in self.required[1:])
+
+    def check(self) -> bool:
+        """ False when the required cells cannot reach each other anymore """
+        split, self.split = self.split, False
+        return not split
+
+    def __signature(self, cell: int) -> int:
+        domain = self.grid.domains[cell]
+        return sum(1 << d for d, passable in enumerate(self.passable) if domain & passable)
+
+    def __passage(self, cell: int, d: int, neighbour: int) -> bool:
+        return self.signatures[cell] >> d & 1 and self.signatures[neighbour] >> (d + 2) % 4 & 1
+
+    def __splits(self, source: int, target: int) -> bool:
+        """ whether the lost passage between source and target cut some of the required cells off """
+        self.searches += 1
+        sides = [({source}, deque([source])), ({target}, deque([target]))]
+        while True:
+            for side, (visited, queue) in enumerate(sides):
+                if not queue:
+                    # the whole pocket is known, it must have all of the required cells or none
+                    inside = sum(1 for cell in self.required if cell in visited)
+                    return 0 < inside < len(self.required)
+                cell = queue.popleft()
+                for direction, neighbour in self.grid.neighbours[cell]:
+                    if neighbour in visited or not self.__passage(cell, DIRECTION_INDEX[direction], neighbour):
+                        continue
+                    if neighbour in sides[1 - side][0]:
+                        return False
+                    visited.add(neighbour)
+                    queue.append(neighbour)
+
+    def __find(self, cell: int) -> int:
+        # no path compression, so that unions can be rolled back
+        while self.parents[cell] != cell:
+            cell = self.parents[cell]
+        return cell
+
+    def __union(self, a: int, b: int):
+        a, b = self.__find(a), self.__find(b)
+        if a == b:
+            return
+        if self.ranks[a] > self.ranks[b]:
+            a, b = b, a
+        rank_grew = self.ranks[a] == self.ranks[b]
+        self.parents[a] = b
+        if rank_grew:
+            self.ranks[b] += 1
+        self.unions.append((a, b, rank_grew))
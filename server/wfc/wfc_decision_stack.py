@@ -0,0 +1,43 @@
+from collections import deque
+from typing import Union
+
+
+class WFCDecisionStack:
+    """
+    Bounded stack of collapse decisions. Resolving a single contradiction may pop at most
+    max_backtracks decisions - when the cause lies deeper than that, popping fails and
+    the generator should rather start over than try every combination of recent decisions.
+    """
+
+    def __init__(self, max_decisions: int, max_backtracks: int):
+        self.decisions: deque[tuple] = deque(maxlen=max_decisions)
+        self.max_backtracks = max_backtracks
+        # decisions made minus decisions popped, including the ones that fell off the stack
+        self.depth = 0
+        self.__contradiction_depth: Union[int, None] = None
+        self.__contradiction_backtracks = 0
+
+    def push(self, decision: tuple):
+        self.decisions.append(decision)
+        self.depth += 1
+
+    def pop(self) -> Union[tuple, None]:
+        """ returns None when there is nothing left to pop or the contradiction costs too much """
+        if len(self.decisions) == 0:
+            return None
+        if self.__contradiction_depth is None:
+            self.__contradiction_depth = self.depth
+            self.__contradiction_backtracks = 0
+        self.__contradiction_backtracks += 1
+        if self.__contradiction_backtracks > self.max_backtracks:
+            return None
+        self.depth -= 1
+        return self.decisions.pop()
+
+    def top(self) -> Union[tuple, None]:
+        return self.decisions[-1] if len(self.decisions) > 0 else None
+
+    def advance(self):
+        """ to be called after a decision propagated successfully """
+        if self.__contradiction_depth is not None and self.depth > self.__contradiction_depth:
+            self.__contradiction_depth = None
@@ -1,108 +1,220 @@
-import random
-
-from queue import PriorityQueue, Queue
+from collections import deque
+from random import Random
+from time import perf_counter
 from typing import Union
 
 from common.tiles.tiles_manager import TilesManager
-from server.wfc.wfc_cell import WFCCell
+from server.wfc.wfc_cell import CellSnapshot
+from server.wfc.wfc_connectivity import WFCConnectivity
+from server.wfc.wfc_decision_stack import WFCDecisionStack
 from server.wfc.wfc_grid import WFCGrid
+from server.wfc.wfc_observer import WFCObserver
+from server.wfc.wfc_priority_queue import WFCPriorityQueue
+from server.wfc.wfc_ruleset import WFCRuleset
+from server.wfc.wfc_seeds import get_fixed_seeds, get_sprinkled_seeds, get_required_positions, get_safe_spaces_positions
+from server.wfc.wfc_stats import WFCStats
+
+# cell id with its state from before the change, used to undo a decision
+TrailEntry = tuple[int, CellSnapshot]
 
 
 class WFCGridGenerator:
-    def __init__(self, tiles_manager: TilesManager):
+    def __init__(self, tiles_manager: TilesManager, ruleset: WFCRuleset,
+                 max_decisions: int = 64, max_backtracks: int = 256, observer: Union[WFCObserver, None] = None):
         self.tiles_manager = tiles_manager
+        self.ruleset = ruleset
         self.grid: Union[WFCGrid, None] = None
-
-    def generate(self, size: int, players_count: int) -> [[WFCCell]]:
-        possible_positions = [(2, 2), (2, size - 3), (size - 3, 2), (size - 3, size - 3)]
+        # how many collapse decisions can be undone on contradiction, and how many undos it may take
+        # to get past a single contradiction, before giving up and generating the whole grid again;
+        # max_decisions = 0 disables backtracking
+        self.max_decisions = max_decisions
+        self.max_backtracks = max_backtracks
+        self.stats = WFCStats()
+        # the same generator as in tiles_manager, it decides everything about the map
+        self.rng: Random = tiles_manager.rng
+        self.__trail: Union[list[TrailEntry], None] = None
+        self.__connectivity: Union[WFCConnectivity, None] = None
+        # cell which was left without tiles by the last propagation
+        self.__contradiction: Union[int, None] = None
+        # waves of the last propagation
+        self.__depth = 0
+        self.observer = observer
+
+    def generate(self, size: int, players_count: int) -> WFCGrid:
+        self.stats = WFCStats()
+        start = perf_counter()
+        possible_positions = get_safe_spaces_positions(size)
         while not self.__generate(size, possible_positions[:players_count]):
+            self.stats.restarts += 1
             print("  --   [WFC] contradiction, trying again")
             continue
 
+        print(f"  --   [WFC] done after {self.stats.restarts} restarts and {self.stats.backtracks} backtracks")
+        if self.observer is not None:
+            self.observer.on_done(perf_counter() - start)
         return self.grid
 
     def __generate(self, size, players_positions: [tuple[int, int]]):
-        cells = [[] for _ in range(size)]
-        count = 0
-        for x in range(size):
-            for y in range(size):
-                cells[x].append(WFCCell((x, y), count, self.tiles_manager))
-                count += 1
-
-        self.grid = WFCGrid(size, cells)
-
-        pq: PriorityQueue[WFCCell] = PriorityQueue()
+        observer = self.observer
+        if observer is not None:
+            observer.on_attempt(size, players_positions)
+        self.__trail = None
+        grid = WFCGrid(size, self.ruleset, self.tiles_manager)
+        for id in range(size * size):
+            grid.noise[id] = self.rng.random()
+        self.grid = grid
+
+        # safe spaces and the flag have to be reachable from each other, which is checked while
+        # generating instead of seeding corridors between them
+        required = [x * size + y for x, y in get_required_positions(size)]
+        connectivity = self.__connectivity = WFCConnectivity(grid, required)
+
+        pq = WFCPriorityQueue()
         to_fix = []
-        cell = cells[4][4]
-        cell.set_collapsed("empty_1")
-        to_fix.append(cell)
-
-        # add borders
-        for x in range(0, size):
-            cells[x][0].set_collapsed("full_1")
-            cells[0][x].set_collapsed("full_1")
-            cells[size-1][x].set_collapsed("full_1")
-            cells[x][size-1].set_collapsed("full_1")
-            to_fix.extend([cells[x][0], cells[0][x], cells[size-1][x], cells[x][size-1]])
-
-        # make sure players can reach each other
-        for i in range(2, size - 2):
-            for j in range(3, size - 3):
-                if i == j or i + j == size - 1:
-                    cell = cells[i][j]
-                    cell.set_collapsed(random.choices(["empty_1", "plants_1"], weights=[8, 2], k=1)[0])
-                    to_fix.append(cell)
-
-        # sprinkle some empty spaces
-        for i, j in [(random.randint(2, size-3), random.randint(2, size-3)) for _ in range(10)]:
-            cell = cells[i][j]
-            cell.set_collapsed(random.choices(["empty_1", "plants_1"], weights=[8, 2], k=1)[0])
-            to_fix.append(cell)
+        for (x, y), tile in get_fixed_seeds(size, players_positions, self.rng, corridors=False):
+            # a cell keeps the first tile it was seeded with
+            if not grid.is_collapsed(x * size + y) and grid.set_collapsed(x * size + y, tile) is not None \
+                    and observer is not None:
+                observer.on_collapse((x, y), tile, 0.0)
+            connectivity.update(x * size + y)
+            to_fix.append(x * size + y)
 
         for x, y in players_positions:
-            cell = cells[x][y]
-            cell.set_collapsed("empty_1")
-            cell.place_player()
-            self.grid.players_cells.append(cell)
-            to_fix.append(cell)
-
-        self.__fix_cells(to_fix)
-
-        pq.put(list(filter(lambda c: not c.is_collapsed(), sorted([c for cs in cells for c in cs])))[0])
-
+            grid.place_player(x * size + y)
+
+        if self.__propagate(to_fix) is None:
+            return False
+
+        # each sprinkled seed is a choice that can be rolled back on its own
+        for (x, y), tile in get_sprinkled_seeds(size, self.rng):
+            cell = x * size + y
+            self.__trail = []
+            self.__record(cell)
+            checkpoint = connectivity.checkpoint()
+            if grid.set_collapsed(cell, tile) is None:
+                continue
+            if observer is not None:
+                observer.on_collapse((x, y), tile, 0.0)
+            connectivity.update(cell)
+            if self.__propagate([cell]) is None:
+                if self.max_decisions == 0:
+                    return False
+                self.stats.backtracks += 1
+                start = perf_counter() if observer is not None else 0.0
+                undone_cells = self.__undo(self.__trail)
+                connectivity.rollback(checkpoint, undone_cells)
+                if observer is not None:
+                    self.__notify_backtrack(cell, undone_cells, perf_counter() - start)
+        self.__trail = None
+
+        first_cell = min(filter(lambda c: not grid.is_collapsed(c), range(size * size)), key=grid.get_priority)
+        pq.put(first_cell, grid.get_priority(first_cell))
+
+        # every decision keeps the cell, the tile it has chosen, the connectivity checkpoint from
+        # before it and a trail of changes it caused
+        decisions = WFCDecisionStack(self.max_decisions, self.max_backtracks)
         while not pq.empty():
             cell = pq.get()
-            if cell.is_collapsed():
+            if grid.is_collapsed(cell):
                 continue
 
-            collapsed_tile = cell.collapse()
+            self.__trail = []
+            self.__record(cell)
+            checkpoint = connectivity.checkpoint()
+            start = perf_counter() if observer is not None else 0.0
+            collapsed_tile = grid.collapse(cell)
             if collapsed_tile is None:
+                self.__contradict(cell, "domain")
                 return False
-
-            updated = self.__fix_cells([cell])
-            for tile in updated:
-                pq.put(tile)
-
-        for row in cells:
-            for cell in row:
-                if not cell.is_collapsed():
+            if observer is not None:
+                observer.on_collapse(grid.position(cell), collapsed_tile, perf_counter() - start)
+            connectivity.update(cell)
+            decisions.push((cell, self.ruleset.tile_mask(collapsed_tile), checkpoint, self.__trail))
+
+            updated = self.__propagate([cell])
+            while updated is None:
+                # contradiction - roll back the latest decision and forbid its tile
+                decision = decisions.pop()
+                if decision is None:
                     return False
+                self.stats.backtracks += 1
+                start = perf_counter() if observer is not None else 0.0
+                cell, tile_mask, checkpoint, trail = decision
+                undone_cells = self.__undo(trail)
+                connectivity.rollback(checkpoint, undone_cells)
+                if observer is not None:
+                    self.__notify_backtrack(cell, undone_cells, perf_counter() - start)
+                for undone_cell in undone_cells:
+                    pq.put(undone_cell, grid.get_priority(undone_cell))
+                self.__trail = decisions.top()[-1] if decisions.top() is not None else None
+                self.__record(cell)
+                grid.update_allowed_tiles(cell, ~tile_mask)
+                connectivity.update(cell)
+                updated = self.__propagate([cell]) if grid.domains[cell] != 0 else self.__contradict(cell, "domain")
+            decisions.advance()
+
+            for updated_cell in updated:
+                pq.put(updated_cell, grid.get_priority(updated_cell))
+
+        return all(tile >= 0 for tile in grid.tiles)
+
+    def __contradict(self, cell: int, reason: str) -> None:
+        if self.observer is not None:
+            self.observer.on_contradiction(self.grid.position(cell), reason)
+        return None
+
+    def __notify_backtrack(self, cell: int, undone_cells: [int], duration: float):
+        grid = self.grid
+        undone = [(grid.position(undone_cell), grid.ruleset.tiles[grid.tiles[undone_cell]]
+                   if grid.tiles[undone_cell] >= 0 else None) for undone_cell in undone_cells]
+        self.observer.on_backtrack(grid.position(cell), undone, duration)
+
+    def __record(self, cell: int):
+        if self.__trail is not None:
+            self.__trail.append((cell, self.grid.snapshot(cell)))
+
+    def __undo(self, trail: list[TrailEntry]) -> [int]:
+        for cell, snapshot in reversed(trail):
+            self.grid.restore(cell, snapshot)
+        return [cell for cell, _ in trail]
+
+    def __propagate(self, cells: [int]) -> Union[set[int], None]:
+        """ fixes cells around given ones, returns None on contradiction or when the map got split """
+        observer = self.observer
+        start = perf_counter() if observer is not None else 0.0
+        updated = self.__fix_cells(cells)
+        if updated is None:
+            return self.__contradict(self.__contradiction, "domain")
+        if not self.__connectivity.check():
+            return self.__contradict(cells[0], "connectivity")
+        if observer is not None:
+            observer.on_propagate(self.grid.position(cells[0]), [self.grid.position(cell) for cell in updated],
+                                  self.__depth, perf_counter() - start)
+        return updated
 
-        return True
-
-    def __fix_cells(self, cells: [WFCCell]) -> [WFCCell]:
-        pending_fix_queue: Queue[WFCCell] = Queue()
-        updated: [WFCCell] = set()
-        for cell in cells:
-            pending_fix_queue.put(cell)
-        unfinished_cell: WFCCell
-        while not pending_fix_queue.empty():
-            unfinished_cell = pending_fix_queue.get()
-            neighbours = self.grid.cell_neighbours(unfinished_cell).items() if self.grid is not None else []
-            for direction, neighbour in neighbours:
-                if neighbour.is_collapsed():
-                    continue
-                if neighbour.update_allowed_tiles(unfinished_cell.get_slots(direction)):
-                    pending_fix_queue.put(neighbour)
-                updated.add(neighbour)
+    def __fix_cells(self, cells: [int]) -> Union[set[int], None]:
+        """ propagates constraints from given cells, returns None on contradiction """
+        grid = self.grid
+        pending_fix_queue: deque[int] = deque(cells)
+        updated: set[int] = set()
+        # queue is taken a wave at a time, cells fixed in one wave are queued for the next
+        self.__depth = 0
+        while pending_fix_queue:
+            self.__depth += 1
+            for _ in range(len(pending_fix_queue)):
+                unfinished_cell = pending_fix_queue.popleft()
+                for direction, neighbour in grid.neighbours[unfinished_cell]:
+                    if grid.tiles[neighbour] >= 0:
+                        continue
+                    snapshot = grid.snapshot(neighbour)
+                    if grid.update_allowed_tiles(neighbour, grid.get_slots(unfinished_cell, direction)):
+                        self.stats.propagations += 1
+                        if self.__trail is not None:
+                            self.__trail.append((neighbour, snapshot))
+                        if grid.domains[neighbour] == 0:
+                            self.__contradiction = neighbour
+                            return None
+                        self.__connectivity.update(neighbour)
+                        pending_fix_queue.append(neighbour)
+                    updated.add(neighbour)
         return updated
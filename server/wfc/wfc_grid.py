@@ -1,22 +1,146 @@
-from server.wfc.wfc_cell import WFCCell
+from array import array
+from functools import lru_cache
+from typing import Union
+
+import numpy as np
+
+from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_cell import WFCCell, CellSnapshot
+from server.wfc.wfc_ruleset import WFCRuleset
 from common.typings import Direction
 
+# neighbours of a cell with directions they lie in
+CellNeighbours = tuple[tuple[Direction, int], ...]
+
+
+@lru_cache(maxsize=8)
+def get_cell_neighbours(size: int) -> tuple[CellNeighbours, ...]:
+    """ neighbours of every cell id in n, e, s, w order, cells on the edge have fewer of them """
+    neighbours = []
+    for x in range(size):
+        for y in range(size):
+            id = x * size + y
+            cell_neighbours = []
+            if y < size - 1:
+                cell_neighbours.append(("n", id + 1))
+            if x < size - 1:
+                cell_neighbours.append(("e", id + size))
+            if y > 0:
+                cell_neighbours.append(("s", id - 1))
+            if x > 0:
+                cell_neighbours.append(("w", id - size))
+            neighbours.append(tuple(cell_neighbours))
+    return tuple(neighbours)
+
 
 class WFCGrid:
-    def __init__(self, size, cells):
+    """
+    State of all cells in flat arrays indexed by cell id, which is x * size + y - domains are bitmasks
+    of WFCRuleset, tiles hold the index of the collapsed tile or -1. WFCCell is only a view of one id
+    for code that wants cell objects.
+    """
+
+    def __init__(self, size: int, ruleset: WFCRuleset, tiles_manager: TilesManager):
         self.size = size
-        self.cells = cells
-        self.players_cells: [WFCCell] = []
-
-    def cell_neighbours(self, cell: WFCCell) -> dict[Direction, WFCCell]:
-        neighbours: dict[Direction, WFCCell] = {}
-        if cell.position[1] < self.size-1:
-            neighbours["n"] = self.cells[cell.position[0]][cell.position[1]+1]
-        if cell.position[0] < self.size-1:
-            neighbours["e"] = self.cells[cell.position[0]+1][cell.position[1]]
-        if cell.position[1] > 0:
-            neighbours["s"] = self.cells[cell.position[0]][cell.position[1]-1]
-        if cell.position[0] > 0:
-            neighbours["w"] = self.cells[cell.position[0]-1][cell.position[1]]
-
-        return neighbours
+        self.ruleset = ruleset
+        self.tiles_manager = tiles_manager
+        self.neighbours = get_cell_neighbours(size)
+        cells_count = size * size
+        weight_sum, weight_log_sum = ruleset.weight_sums(ruleset.full_mask)
+        self.domains: list[int] = [ruleset.full_mask] * cells_count
+        self.weight_sums = array("d", [weight_sum]) * cells_count
+        self.weight_log_sums = array("d", [weight_log_sum]) * cells_count
+        self.entropies = array("d", [tiles_manager.get_entropy(weight_sum, weight_log_sum)]) * cells_count
+        # breaks ties between cells of equal entropy
+        self.noise = array("d", [0.0]) * cells_count
+        self.tiles = array("h", [-1]) * cells_count
+        self.players: list[int] = []
+
+    @staticmethod
+    def from_tiles(size: int, tiles: np.ndarray, tiles_manager: TilesManager, ruleset: WFCRuleset,
+                   players_positions: [tuple[int, int]]) -> "WFCGrid":
+        """ grid of collapsed cells, tiles holds a tile index for every cell id """
+        grid = WFCGrid(size, ruleset, tiles_manager)
+        grid.tiles = array("h", tiles.astype(np.int16).tobytes())
+        grid.domains = [1 << tile for tile in tiles.tolist()]
+        grid.weight_sums = array("d", [ruleset.weights[tile] for tile in tiles.tolist()])
+        grid.weight_log_sums = array("d", [ruleset.weight_logs[tile] for tile in tiles.tolist()])
+        grid.entropies = array("d", [0.0]) * (size * size)
+        for x, y in players_positions:
+            grid.place_player(x * size + y)
+        return grid
+
+    def cell(self, x: int, y: int) -> WFCCell:
+        return WFCCell(self, x * self.size + y)
+
+    @property
+    def players_cells(self) -> [WFCCell]:
+        return [WFCCell(self, id) for id in self.players]
+
+    def cell_neighbours(self, id: int) -> CellNeighbours:
+        return self.neighbours[id]
+
+    def position(self, id: int) -> tuple[int, int]:
+        return divmod(id, self.size)
+
+    def place_player(self, id: int):
+        self.players.append(id)
+
+    def get_tile_names(self) -> [str]:
+        """ collapsed tiles column by column, None for cells which are not collapsed """
+        return [self.ruleset.tiles[tile] if tile >= 0 else None for tile in self.tiles]
+
+    def get_players_positions(self) -> [tuple[int, int]]:
+        return [self.position(id) for id in self.players]
+
+    def is_collapsed(self, id: int) -> bool:
+        return self.tiles[id] >= 0
+
+    def collapse(self, id: int) -> Union[str, None]:
+        if self.domains[id] == 0:
+            return None
+        self.__set_tile(id, self.ruleset.sampler.draw(self.domains[id], self.tiles_manager.rng))
+        return self.ruleset.tiles[self.tiles[id]]
+
+    def set_collapsed(self, id: int, tile: str) -> Union[str, None]:
+        tile_index = self.ruleset.index[tile]
+        if not self.domains[id] >> tile_index & 1:
+            return None
+        self.__set_tile(id, tile_index)
+        return tile
+
+    def __set_tile(self, id: int, tile: int):
+        self.domains[id] = 1 << tile
+        self.weight_sums[id], self.weight_log_sums[id] = self.ruleset.weights[tile], self.ruleset.weight_logs[tile]
+        self.entropies[id] = 0.0
+        self.tiles[id] = tile
+
+    def update_allowed_tiles(self, id: int, new_allowed_tiles: int) -> bool:
+        domain = self.domains[id]
+        intersection = domain & new_allowed_tiles
+        if intersection == domain:
+            return False
+        # only tiles that were removed are subtracted from the sums
+        removed_weight_sum, removed_weight_log_sum = self.ruleset.weight_sums(domain ^ intersection)
+        weight_sum = self.weight_sums[id] - removed_weight_sum
+        weight_log_sum = self.weight_log_sums[id] - removed_weight_log_sum
+        self.weight_sums[id], self.weight_log_sums[id] = weight_sum, weight_log_sum
+        self.domains[id] = intersection
+        self.entropies[id] = self.tiles_manager.get_entropy(weight_sum, weight_log_sum) if intersection else 0.0
+        return True
+
+    def get_slots(self, id: int, direction: Direction) -> int:
+        tile = self.tiles[id]
+        if tile >= 0:
+            return self.ruleset.slots[direction][tile]
+        return self.ruleset.support(self.domains[id], direction)
+
+    def snapshot(self, id: int) -> CellSnapshot:
+        return self.domains[id], self.weight_sums[id], self.weight_log_sums[id], self.entropies[id], self.tiles[id]
+
+    def restore(self, id: int, snapshot: CellSnapshot):
+        self.domains[id], self.weight_sums[id], self.weight_log_sums[id], self.entropies[id], self.tiles[id] = \
+            snapshot
+
+    def get_priority(self, id: int) -> tuple[float, float]:
+        return self.entropies[id], self.noise[id]
@@ -1,30 +1,45 @@
 from queue import Queue
+from typing import Union
 from panda3d.core import Vec3
 from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_array_generator import WFCArrayGridGenerator
+from server.wfc.wfc_chunked_generator import WFCChunkedGridGenerator
 from server.wfc.wfc_generator import WFCGridGenerator
 from server.wfc.wfc_grid import WFCGrid
 
 
 class WFCMap:
-    def __init__(self, generator: WFCGridGenerator, tiles_manager: TilesManager):
+    def __init__(self, generator: Union[WFCGridGenerator, WFCArrayGridGenerator, WFCChunkedGridGenerator],
+                 tiles_manager: TilesManager):
         self.generator = generator
         self.tiles_manager = tiles_manager
 
     def build_image_grid(self, size: int, players_count) -> (dict[any], [Vec3]):
+        return self.to_image_grid(size, *self.generate(size, players_count))
+
+    def generate(self, size: int, players_count: int) -> ([str], [tuple[int, int]]):
+        """ collapsed tiles of the grid, column by column, and player cells """
         grid = self.generator.generate(size, players_count)
+        return grid.get_tile_names(), grid.get_players_positions()
 
+    @staticmethod
+    def to_image_grid(size: int, tiles: [str], players_positions: [tuple[int, int]]) -> (dict[any], [Vec3]):
         result = []
         for i in range(size):
             for j in range(size):
-                heading = 0
-                match grid.cells[i][j].collapsed_tile[-1]:
-                    case "2":
-                        heading = -90
-                    case "3":
-                        heading = 180
-                    case "4":
-                        heading = 90
-                result.append({"node_path": grid.cells[i][j].collapsed_tile[:-1]+"1",
-                               "pos": (i*2, j*2, 0), "heading": heading})
+                result.append(WFCMap.to_image(tiles[i * size + j], i, j))
+
+        return result, [Vec3(x*2, y*2, 0) for x, y in players_positions]
 
-        return result, [Vec3(pc.position[0]*2, pc.position[1]*2, 0) for pc in grid.players_cells]
+    @staticmethod
+    def to_image(tile: str, x: int, y: int) -> dict[any]:
+        """ model of the first rotation of the tile, turned to the rotation of the tile """
+        heading = 0
+        match tile[-1]:
+            case "2":
+                heading = -90
+            case "3":
+                heading = 180
+            case "4":
+                heading = 90
+        return {"node_path": tile[:-1]+"1", "pos": (x*2, y*2, 0), "heading": heading}
@@ -0,0 +1,100 @@
+import multiprocessing
+import random
+import time
+from collections import deque
+from typing import Union
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from panda3d.core import Vec3
+
+from server.wfc.wfc_map import WFCMap
+from server.wfc.wfc_service import WFCServiceClient
+from server.wfc.wfc_starter import start_wfc
+from server.wfc.wfc_stats import WFCMapPoolStats
+
+# seed of the map, its tiles and player positions, like start_wfc returns them
+PooledMap = tuple[int, list[dict], list[Vec3]]
+
+
+def generate_map(size: int, players_count: int, seed: int) -> tuple[PooledMap, float]:
+    """ runs in a worker process or in the server, returns the map with time it took to generate """
+    start = time.perf_counter()
+    tiles, player_positions = start_wfc(size, players_count, seed)
+    return (seed, tiles, player_positions), time.perf_counter() - start
+
+
+class WFCMapPool:
+    """
+    Requests next maps from the WFC service while the current match runs, so that a server
+    reset only takes a ready map. Threads of the pool just wait on the pipe to the service,
+    the solver itself does not run in the server. When no map is ready, one is requested and
+    waited for, and when the service fails, the map is generated in the server like before.
+    Without a service maps are generated in worker processes of the pool, as the solver would
+    hold the GIL in threads of the server.
+    """
+
+    def __init__(self, size: int, players_count: int, depth: int, service: Union[WFCServiceClient, None]):
+        self.size = size
+        self.players_count = players_count
+        self.depth = depth
+        self.service = service
+        self.stats = WFCMapPoolStats()
+        self.pending: deque[Future] = deque()
+        self.executor: Executor
+        if service is None:
+            # spawned workers do not inherit the window, sockets and threads of the server
+            self.executor = ProcessPoolExecutor(max_workers=max(depth, 1),
+                                                mp_context=multiprocessing.get_context("spawn"))
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=max(depth, 1), thread_name_prefix="map pool")
+        self.fill()
+
+    def fill(self):
+        while len(self.pending) < self.depth:
+            seed = random.getrandbits(32)
+            if self.service is None:
+                self.pending.append(self.executor.submit(generate_map, self.size, self.players_count, seed))
+            else:
+                self.pending.append(self.executor.submit(self.request_map, seed))
+
+    def request_map(self, seed: int) -> tuple[PooledMap, float]:
+        if self.service is None:
+            return generate_map(self.size, self.players_count, seed)
+        stored_map, generation_time = self.service.generate(self.size, self.players_count, seed)
+        tiles, player_positions = WFCMap.to_image_grid(self.size, *stored_map)
+        return (seed, tiles, player_positions), generation_time
+
+    def ready_count(self) -> int:
+        return sum(1 for future in self.pending if future.done())
+
+    def pop(self) -> PooledMap:
+        """ takes the oldest ready map or generates a new one if there is none """
+        pooled_map = None
+        for future in list(self.pending):
+            if not future.done():
+                continue
+            self.pending.remove(future)
+            if future.exception() is not None:
+                print(f"  --   [WFC] map generation in pool failed: {future.exception()}")
+                continue
+            pooled_map, generation_time = future.result()
+            self.stats.add_generation_time(generation_time)
+            break
+
+        if pooled_map is None:
+            self.stats.misses += 1
+            seed = random.getrandbits(32)
+            try:
+                pooled_map, generation_time = self.request_map(seed)
+            except (OSError, EOFError, RuntimeError) as e:
+                print(f"  --   [WFC] map service failed, generating here: {e}")
+                pooled_map, generation_time = generate_map(self.size, self.players_count, seed)
+            self.stats.add_generation_time(generation_time)
+        else:
+            self.stats.hits += 1
+
+        self.fill()
+        return pooled_map
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
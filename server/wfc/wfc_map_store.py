@@ -0,0 +1,145 @@
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+from server.wfc.wfc_ruleset import WFCRuleset
+
+# collapsed tiles of a map, column by column, and player cells
+StoredMap = tuple[list[str], list[tuple[int, int]]]
+
+DEFAULT_STORE_PATH = Path(__file__).parent / "map_store"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class WFCMapStore:
+    """
+    Generated maps on disk, addressed by everything that decides their content - ruleset hash,
+    size, players count and seed. A map takes one byte per cell, the index of its tile in the
+    ruleset. When the store grows over max_bytes, least recently used maps are removed.
+    """
+    MAGIC = b"WFCM"
+    # bumped also when generators give other maps for the same seed
+    VERSION = 4
+    # magic, version, size, players count
+    HEADER = struct.Struct("<4sBHB")
+    POSITION = struct.Struct("<HH")
+
+    def __init__(self, path: Path = DEFAULT_STORE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # only an estimate when other processes write to the same store, it is recounted on eviction
+        self.__total_bytes: Union[int, None] = None
+
+    def load(self, ruleset: WFCRuleset, size: int, players_count: int, seed: int) -> Union[StoredMap, None]:
+        path = self.__map_path(ruleset, size, players_count, seed)
+        try:
+            data = path.read_bytes()
+            # access time is not reliable on most mounts, modification time marks the last use instead
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        stored_map = self.decode(ruleset, data)
+        if stored_map is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return stored_map
+
+    def save(self, ruleset: WFCRuleset, size: int, players_count: int, seed: int, stored_map: StoredMap):
+        path = self.__map_path(ruleset, size, players_count, seed)
+        data = self.encode(ruleset, size, stored_map)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # written under a temporary name first, so that readers never see a partial map
+            temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+            temporary_path.write_bytes(data)
+            os.replace(temporary_path, path)
+        except OSError as e:
+            print(f"  --   [WFC] could not store the map: {e}")
+            return
+
+        if self.__total_bytes is None:
+            self.__total_bytes = self.__count_bytes()
+        else:
+            self.__total_bytes += len(data)
+        if self.__total_bytes > self.max_bytes:
+            self.evict()
+
+    def stored_seeds(self, ruleset: WFCRuleset, size: int, players_count: int) -> list[int]:
+        directory = self.__maps_directory(ruleset, size, players_count)
+        if not directory.is_dir():
+            return []
+        return [int(entry.stem) for entry in directory.iterdir() if entry.suffix == ".map"]
+
+    def evict(self):
+        """ removes least recently used maps until the store takes at most 90% of max_bytes """
+        entries = sorted(self.__entries(), key=lambda entry: entry[1])
+        self.__total_bytes = sum(entry_size for _, _, entry_size in entries)
+        for path, _, entry_size in entries:
+            if self.__total_bytes <= self.max_bytes * 0.9:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self.__total_bytes -= entry_size
+
+    def encode(self, ruleset: WFCRuleset, size: int, stored_map: StoredMap) -> bytes:
+        tiles, players_positions = stored_map
+        data = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, size, len(players_positions)))
+        data += bytes(ruleset.index[tile] for tile in tiles)
+        for position in players_positions:
+            data += self.POSITION.pack(*position)
+        return bytes(data)
+
+    def decode(self, ruleset: WFCRuleset, data: bytes) -> Union[StoredMap, None]:
+        """ returns None for data of another version or a damaged file """
+        if len(data) < self.HEADER.size:
+            return None
+        magic, version, size, players_count = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION \
+                or len(data) != self.HEADER.size + size * size + players_count * self.POSITION.size:
+            return None
+        offset = self.HEADER.size
+        indices = data[offset:offset + size * size]
+        if size > 0 and max(indices) >= len(ruleset.tiles):
+            return None
+        tiles = [ruleset.tiles[index] for index in indices]
+        offset += size * size
+        players_positions = [self.POSITION.unpack_from(data, offset + i * self.POSITION.size)
+                             for i in range(players_count)]
+        return tiles, players_positions
+
+    def __maps_directory(self, ruleset: WFCRuleset, size: int, players_count: int) -> Path:
+        return self.path / ruleset.hash[:16] / f"{size}x{players_count}"
+
+    def __map_path(self, ruleset: WFCRuleset, size: int, players_count: int, seed: int) -> Path:
+        return self.__maps_directory(ruleset, size, players_count) / f"{seed}.map"
+
+    def __entries(self) -> list[tuple[Path, float, int]]:
+        entries = []
+        for directory, _, files in os.walk(self.path):
+            for name in files:
+                if not name.endswith(".map"):
+                    continue
+                path = Path(directory) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def __count_bytes(self) -> int:
+        return sum(entry_size for _, _, entry_size in self.__entries())
+
+
+@lru_cache(maxsize=None)
+def get_map_store() -> WFCMapStore:
+    return WFCMapStore()
@@ -0,0 +1,30 @@
+from typing import Union
+
+
+# cell position with its tile, None for a cell which is not collapsed
+CellState = tuple[tuple[int, int], Union[str, None]]
+
+
+class WFCObserver:
+    """
+    Receives events of WFCGridGenerator, methods do nothing unless overridden. Durations are in
+    seconds and are only measured while an observer is set, a generator without one skips all of it.
+    """
+
+    def on_attempt(self, size: int, players_positions: [tuple[int, int]]):
+        """ generation of the whole grid starts, again after a restart """
+
+    def on_collapse(self, position: tuple[int, int], tile: str, duration: float):
+        """ a cell was collapsed to a tile, by a seed or by a decision of the generator """
+
+    def on_propagate(self, position: tuple[int, int], updated: [tuple[int, int]], depth: int, duration: float):
+        """ constraints spread from a cell, depth is the number of waves it took """
+
+    def on_contradiction(self, position: tuple[int, int], reason: str):
+        """ reason is "domain" when the cell has no tiles left and "connectivity" when the map got split """
+
+    def on_backtrack(self, position: tuple[int, int], undone: [CellState], duration: float):
+        """ a decision was undone, undone cells are shown as they are after it """
+
+    def on_done(self, duration: float):
+        """ the grid is collapsed, duration covers all attempts """
@@ -0,0 +1,31 @@
+import argparse
+import time
+from pathlib import Path
+
+from server.wfc.wfc_map_store import WFCMapStore, DEFAULT_STORE_PATH, DEFAULT_MAX_BYTES
+from server.wfc.wfc_ruleset import get_ruleset
+from server.wfc.wfc_starter import start_wfc
+
+
+def prefill(store: WFCMapStore, size: int, players_count: int, seeds: range):
+    """ generates and stores maps of given seeds which are not stored yet """
+    stored = set(store.stored_seeds(get_ruleset(), size, players_count))
+    missing = [seed for seed in seeds if seed not in stored]
+    print(f"[INFO] {len(seeds) - len(missing)} maps already stored, generating {len(missing)}")
+    start = time.perf_counter()
+    for i, seed in enumerate(missing):
+        start_wfc(size, players_count, seed, store)
+        print(f"[INFO] {i + 1}/{len(missing)} maps generated in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="generates maps into the map store ahead of time")
+    parser.add_argument("size", type=int)
+    parser.add_argument("count", type=int, help="number of maps, their seeds are consecutive from --first-seed")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--path", type=Path, default=DEFAULT_STORE_PATH)
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    arguments = parser.parse_args()
+    prefill(WFCMapStore(arguments.path, arguments.max_bytes), arguments.size, arguments.players,
+            range(arguments.first_seed, arguments.first_seed + arguments.count))
@@ -0,0 +1,79 @@
+class WFCPriorityQueue:
+    """
+    Binary heap of cell ids ordered by their priority, with an index of heap positions - putting
+    a cell which is already queued moves it to its new place (decrease-key) instead of adding
+    a duplicate, so the heap never holds more than one entry per cell
+    """
+
+    def __init__(self):
+        self.cells: list[int] = []
+        self.priorities: list[tuple[float, float]] = []
+        self.positions: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, cell: int) -> bool:
+        return cell in self.positions
+
+    def empty(self) -> bool:
+        return len(self.cells) == 0
+
+    def put(self, cell: int, priority: tuple[float, float]):
+        position = self.positions.get(cell)
+        if position is None:
+            self.cells.append(cell)
+            self.priorities.append(priority)
+            self.positions[cell] = len(self.cells) - 1
+            self.__sift_up(len(self.cells) - 1)
+            return
+
+        old_priority = self.priorities[position]
+        self.priorities[position] = priority
+        if priority < old_priority:
+            self.__sift_up(position)
+        elif priority > old_priority:
+            self.__sift_down(position)
+
+    def get(self) -> int:
+        cell = self.cells[0]
+        last_cell, last_priority = self.cells.pop(), self.priorities.pop()
+        del self.positions[cell]
+        if len(self.cells) > 0:
+            self.cells[0], self.priorities[0] = last_cell, last_priority
+            self.positions[last_cell] = 0
+            self.__sift_down(0)
+        return cell
+
+    def __sift_up(self, position: int):
+        cell, priority = self.cells[position], self.priorities[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if self.priorities[parent] <= priority:
+                break
+            self.__move(parent, position)
+            position = parent
+        self.__place(cell, priority, position)
+
+    def __sift_down(self, position: int):
+        cell, priority = self.cells[position], self.priorities[position]
+        size = len(self.cells)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and self.priorities[child + 1] < self.priorities[child]:
+                child += 1
+            if self.priorities[child] >= priority:
+                break
+            self.__move(child, position)
+            position = child
+        self.__place(cell, priority, position)
+
+    def __move(self, source: int, target: int):
+        self.cells[target], self.priorities[target] = self.cells[source], self.priorities[source]
+        self.positions[self.cells[target]] = target
+
+    def __place(self, cell: int, priority: tuple[float, float], position: int):
+        self.cells[position], self.priorities[position] = cell, priority
+        self.positions[cell] = position
@@ -0,0 +1,152 @@
+import hashlib
+from functools import lru_cache
+from math import log
+
+import numpy as np
+
+from common.tiles.ruleset_compiler import CompiledRuleset, get_compiled_ruleset
+from common.tiles.tiles_manager import TilesManager
+from common.typings import Direction
+from server.wfc.wfc_tile_sampler import WFCTileSampler
+
+DIRECTIONS: tuple[Direction, ...] = ("n", "e", "s", "w")
+
+
+class WFCRuleset:
+    """
+    compiled ruleset prepared for the solver - a domain is an int where bit i stands for tiles[i]
+    and slot masks are precomputed once for every tile and direction
+    """
+    # chunks of a domain are its bytes, numpy tables depend on it
+    CHUNK_BITS = 8
+    # supports remembered per direction, the cache of a direction is dropped when it grows over that
+    SUPPORT_CACHE_SIZE = 1 << 16
+
+    def __init__(self, compiled: CompiledRuleset):
+        self.tiles: list[str] = list(compiled.tiles)
+        self.index: dict[str, int] = {tile: i for i, tile in enumerate(self.tiles)}
+        self.full_mask: int = (1 << len(self.tiles)) - 1
+        self.weights: list[float] = compiled.weights.tolist()
+
+        self.weight_logs: list[float] = [w * log(w) for w in self.weights]
+        # tiles a player can leave through each side
+        self.passable: dict[Direction, int] = {
+            direction: sum(1 << i for i in range(len(self.tiles)) if direction in compiled.neighbour_directions(i))
+            for direction in DIRECTIONS
+        }
+
+        self.slots: dict[Direction, list[int]] = {
+            direction: [compiled.slot_mask(direction, i) for i in range(len(self.tiles))]
+            for direction in DIRECTIONS
+        }
+        # identifies the ruleset in stored maps, tile indices are only valid for the same hash
+        self.hash: str = hashlib.sha256(repr([
+            (tile, self.weights[i], [self.slots[direction][i] for direction in DIRECTIONS])
+            for i, tile in enumerate(self.tiles)
+        ]).encode()).hexdigest()
+
+        # domains are split into CHUNK_BITS wide chunks, every possible chunk value has its
+        # union of slots (and sums of weights) precomputed, so a domain of 72 tiles
+        # needs 9 table lookups instead of a loop over its tiles
+        self.__chunks = (len(self.tiles) + self.CHUNK_BITS - 1) // self.CHUNK_BITS
+        self.__support_tables: dict[Direction, list[list[int]]] = {
+            direction: self.__build_chunk_tables(self.slots[direction], lambda a, b: a | b, 0)
+            for direction in DIRECTIONS
+        }
+        # many cells share their domains, so most supports are only looked up
+        self.__support_cache: dict[Direction, dict[int, int]] = {direction: {} for direction in DIRECTIONS}
+        self.support_hits = 0
+        self.support_misses = 0
+        self.__weight_tables: list[list[float]] = self.__build_chunk_tables(self.weights, lambda a, b: a + b, 0.0)
+        self.__weight_log_tables: list[list[float]] = \
+            self.__build_chunk_tables(self.weight_logs, lambda a, b: a + b, 0.0)
+
+        # the same tables for propagation over numpy arrays, where a domain is stored as a row of its chunks -
+        # support_chunk_tables[direction, chunk, value] is the support of a chunk value as a row of chunks
+        self.chunks_count = self.__chunks
+        self.support_chunk_tables = np.zeros((len(DIRECTIONS), self.__chunks, 1 << self.CHUNK_BITS, self.__chunks),
+                                             dtype=np.uint8)
+        for d, direction in enumerate(DIRECTIONS):
+            for chunk, table in enumerate(self.__support_tables[direction]):
+                for chunk_value, support in enumerate(table):
+                    self.support_chunk_tables[d, chunk, chunk_value] = self.to_chunks(support)
+        self.weight_chunk_tables = np.array(self.__weight_tables, dtype=np.float64)
+        self.weight_log_chunk_tables = np.array(self.__weight_log_tables, dtype=np.float64)
+        self.weights_array = np.array(self.weights, dtype=np.float64)
+        self.sampler = WFCTileSampler(self.weights_array)
+
+    def __build_chunk_tables(self, values: list, combine, zero) -> list[list]:
+        chunk_size = 1 << self.CHUNK_BITS
+        tables = []
+        for chunk in range(self.__chunks):
+            offset = chunk * self.CHUNK_BITS
+            table = [zero] * chunk_size
+            for chunk_value in range(1, chunk_size):
+                low_bit = (chunk_value & -chunk_value).bit_length() - 1
+                tile = offset + low_bit
+                rest = table[chunk_value & (chunk_value - 1)]
+                table[chunk_value] = combine(rest, values[tile]) if tile < len(values) else rest
+            tables.append(table)
+        return tables
+
+    def mask_of(self, tiles) -> int:
+        mask = 0
+        for tile in tiles:
+            mask |= 1 << self.index[tile]
+        return mask
+
+    def tiles_of(self, mask: int) -> list[str]:
+        tiles = []
+        while mask:
+            low_bit = mask & -mask
+            tiles.append(self.tiles[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return tiles
+
+    def to_chunks(self, mask: int) -> np.ndarray:
+        return np.frombuffer(mask.to_bytes(self.__chunks, "little"), dtype=np.uint8)
+
+    def from_chunks(self, chunks: np.ndarray) -> int:
+        return int.from_bytes(chunks.tobytes(), "little")
+
+    def tile_mask(self, tile: str) -> int:
+        return 1 << self.index[tile]
+
+    def support(self, mask: int, direction: Direction) -> int:
+        """ union of slots in given direction of all tiles in the domain """
+        cache = self.__support_cache[direction]
+        support = cache.get(mask)
+        if support is not None:
+            self.support_hits += 1
+            return support
+        self.support_misses += 1
+        if len(cache) >= self.SUPPORT_CACHE_SIZE:
+            cache.clear()
+        support = cache[mask] = self.__build_support(mask, direction)
+        return support
+
+    def __build_support(self, mask: int, direction: Direction) -> int:
+        support = 0
+        chunk_mask = (1 << self.CHUNK_BITS) - 1
+        for table in self.__support_tables[direction]:
+            support |= table[mask & chunk_mask]
+            mask >>= self.CHUNK_BITS
+        return support
+
+    def weight_sums(self, mask: int) -> tuple[float, float]:
+        """ sums of w and w * log(w) over weights of tiles in the domain """
+        weight_sum, weight_log_sum = 0.0, 0.0
+        chunk_mask = (1 << self.CHUNK_BITS) - 1
+        for weights, weight_logs in zip(self.__weight_tables, self.__weight_log_tables):
+            weight_sum += weights[mask & chunk_mask]
+            weight_log_sum += weight_logs[mask & chunk_mask]
+            mask >>= self.CHUNK_BITS
+        return weight_sum, weight_log_sum
+
+    def entropy(self, mask: int) -> float:
+        return TilesManager.get_entropy(*self.weight_sums(mask)) if mask else 0.0
+
+
+@lru_cache(maxsize=None)
+def get_ruleset() -> WFCRuleset:
+    return WFCRuleset(get_compiled_ruleset())
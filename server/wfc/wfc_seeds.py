@@ -0,0 +1,48 @@
+from random import Random
+
+# cell position with the tile it is collapsed to before generation starts
+Seed = tuple[tuple[int, int], str]
+
+
+def get_flag_position(size: int) -> tuple[int, int]:
+    """ cell the flag stands on """
+    return (size - 2) // 2, (size - 2) // 2
+
+
+def get_safe_spaces_positions(size: int) -> [tuple[int, int]]:
+    """ cells of safe spaces, players start on the first ones """
+    return [(2, 2), (2, size - 3), (size - 3, 2), (size - 3, size - 3)]
+
+
+def get_required_positions(size: int) -> [tuple[int, int]]:
+    """ cells which have to be reachable from each other - the flag and safe spaces """
+    return [get_flag_position(size), *get_safe_spaces_positions(size)]
+
+
+def get_fixed_seeds(size: int, players_positions: [tuple[int, int]], rng: Random, corridors: bool = True) -> [Seed]:
+    """
+    seeds in order of priority - a cell keeps the first tile it was seeded with; corridors seed the
+    diagonals so that players can reach each other, generators which check reachability skip them
+    """
+    seeds = [(get_flag_position(size), "empty_1")]
+
+    # add borders
+    for x in range(0, size):
+        seeds.extend([((x, 0), "full_1"), ((0, x), "full_1"), ((size-1, x), "full_1"), ((x, size-1), "full_1")])
+
+    # make sure players can reach each other
+    for i in range(2, size - 2):
+        for j in range(3, size - 3):
+            if corridors and (i == j or i + j == size - 1):
+                seeds.append(((i, j), rng.choices(["empty_1", "plants_1"], weights=[8, 2], k=1)[0]))
+
+    for position in players_positions:
+        seeds.append((position, "empty_1"))
+
+    return seeds
+
+
+def get_sprinkled_seeds(size: int, rng: Random) -> [Seed]:
+    """ some empty spaces, each of them may be dropped if it contradicts the map """
+    positions = [(rng.randint(2, size-3), rng.randint(2, size-3)) for _ in range(10)]
+    return [(position, rng.choices(["empty_1", "plants_1"], weights=[8, 2], k=1)[0]) for position in positions]
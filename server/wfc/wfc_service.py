@@ -0,0 +1,225 @@
+import atexit
+import getpass
+import multiprocessing
+import os
+import secrets
+import stat
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.shared_memory import SharedMemory
+from typing import Union
+
+from server.wfc.wfc_map_store import StoredMap, get_map_store
+from server.wfc.wfc_ruleset import get_ruleset
+from server.wfc.wfc_starter import get_map
+
+# servers of one user on the host find the service under the same address, in a directory only the user can access
+SERVICE_DIRECTORY = os.path.join(tempfile.gettempdir(), f"wfc_map_service-{getpass.getuser()}")
+AUTHKEY_FILE = "authkey"
+
+
+def get_service_directory() -> str:
+    """ creates the directory of the service, refuses one which other users could access or replace """
+    os.makedirs(SERVICE_DIRECTORY, mode=0o700, exist_ok=True)
+    if sys.platform != "win32":
+        info = os.lstat(SERVICE_DIRECTORY)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise PermissionError(f"{SERVICE_DIRECTORY} has to be a directory only its owner can access")
+    return SERVICE_DIRECTORY
+
+
+def get_default_address() -> str:
+    if sys.platform == "win32":
+        return rf"\\.\pipe\wfc_map_service-{getpass.getuser()}"
+    return os.path.join(get_service_directory(), "service.sock")
+
+
+def get_authkey() -> bytes:
+    """
+    random key shared by the service and its clients through a file only the user can read - a
+    connection fails unless both sides know it, so nothing else can answer in place of the service
+    """
+    path = os.path.join(get_service_directory(), AUTHKEY_FILE)
+    try:
+        handle = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(path, "rb") as file:
+            return file.read()
+    authkey = secrets.token_bytes(32)
+    with os.fdopen(handle, "wb") as file:
+        file.write(authkey)
+    return authkey
+
+
+class WFCService:
+    """
+    Generates maps in its own process, so that the solver does not hold the GIL of a server.
+    Requests come over a local pipe, every connection is served by its own thread. A map is
+    encoded like in the map store - one byte per cell - into a shared memory block and only
+    the name of the block goes back. The client reads the map straight from the block, unlinks
+    it and sends "release", then the service closes its handle as well; until then the block
+    is kept open, since on Windows it would disappear with the last handle.
+
+    messages:
+        ("generate", size, players_count, seed) -> ("map", block name, bytes, generation time)
+                                                   or ("error", message)
+        ("release", block name)
+    """
+
+    def __init__(self, address: Union[str, None] = None, authkey: Union[bytes, None] = None):
+        self.address = address if address is not None else get_default_address()
+        self.authkey = authkey if authkey is not None else get_authkey()
+        self.__blocks: dict[str, SharedMemory] = {}
+        self.__lock = threading.Lock()
+
+    def serve_forever(self):
+        try:
+            Client(self.address, authkey=self.authkey).close()
+            # another service started at the same time and was faster
+            print(f"[INFO] WFC service already listening on {self.address}")
+            return
+        except (EOFError, multiprocessing.AuthenticationError):
+            raise ConnectionError(f"something else listens on {self.address}")
+        except OSError:
+            # nothing listens, the socket may be left behind by a service which did not exit cleanly
+            if sys.platform != "win32" and os.path.exists(self.address):
+                os.unlink(self.address)
+        with Listener(self.address, authkey=self.authkey) as listener:
+            print(f"[INFO] WFC service listening on {self.address}")
+            while True:
+                try:
+                    connection = listener.accept()
+                except (OSError, multiprocessing.AuthenticationError):
+                    continue
+                threading.Thread(target=self.__serve, args=(connection,), daemon=True).start()
+
+    def __serve(self, connection: Connection):
+        # blocks handed over through this connection, closed when the client goes away without releasing them
+        names = set()
+        try:
+            while True:
+                message = connection.recv()
+                match message:
+                    case ("generate", size, players_count, seed):
+                        connection.send(self.__generate(size, players_count, seed, names))
+                    case ("release", name):
+                        names.discard(name)
+                        self.__release(name, unlink=False)
+        except (EOFError, OSError):
+            pass
+        finally:
+            connection.close()
+            for name in names:
+                self.__release(name, unlink=True)
+
+    def __generate(self, size: int, players_count: int, seed: int, names: set[str]) -> tuple:
+        try:
+            start = time.perf_counter()
+            stored_map = get_map(size, players_count, seed)
+            generation_time = time.perf_counter() - start
+            data = get_map_store().encode(get_ruleset(), size, stored_map)
+        except Exception as e:
+            return "error", f"{type(e).__name__}: {e}"
+
+        block = SharedMemory(create=True, size=len(data))
+        block.buf[:len(data)] = data
+        with self.__lock:
+            self.__blocks[block.name] = block
+        names.add(block.name)
+        return "map", block.name, len(data), generation_time
+
+    def __release(self, name: str, unlink: bool):
+        with self.__lock:
+            block = self.__blocks.pop(name, None)
+        if block is None:
+            return
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+def run_service(address: Union[str, None] = None, authkey: Union[bytes, None] = None):
+    WFCService(address, authkey).serve_forever()
+
+
+class WFCServiceClient:
+    """
+    Requests maps from WFCService. Every request opens its own connection, so a client can be
+    used from many threads at once.
+    """
+    CONNECT_TIMEOUT = 10.0
+
+    def __init__(self, address: str, authkey: bytes, process: Union[multiprocessing.Process, None] = None):
+        self.address = address
+        self.authkey = authkey
+        # service started by this client, others only connect to it
+        self.process = process
+
+    @staticmethod
+    def start(address: Union[str, None] = None) -> "WFCServiceClient":
+        """ connects to the service at the address, launching it first when nothing listens there """
+        address = address if address is not None else get_default_address()
+        authkey = get_authkey()
+        if WFCServiceClient.listening(address, authkey):
+            print(f"[INFO] Using WFC service on {address}")
+            return WFCServiceClient(address, authkey)
+
+        # spawned, so that the service does not inherit the window, sockets and threads of the server
+        process = multiprocessing.get_context("spawn").Process(target=run_service, args=(address, authkey),
+                                                                name="wfc service")
+        process.start()
+        client = WFCServiceClient(address, authkey, process)
+        atexit.register(client.close)
+        deadline = time.monotonic() + WFCServiceClient.CONNECT_TIMEOUT
+        while not WFCServiceClient.listening(address, authkey):
+            # a service which exits cleanly found another one on the address, which is waited for
+            if process.exitcode not in (None, 0) or time.monotonic() > deadline:
+                client.close()
+                raise ConnectionError(f"WFC service did not start on {address}")
+            time.sleep(0.05)
+        return client
+
+    def generate(self, size: int, players_count: int, seed: int) -> tuple[StoredMap, float]:
+        """ the map with time it took the service to generate it """
+        with Client(self.address, authkey=self.authkey) as connection:
+            connection.send(("generate", size, players_count, seed))
+            reply = connection.recv()
+            if reply[0] == "error":
+                raise RuntimeError(f"WFC service failed to generate map {seed}: {reply[1]}")
+
+            _, name, length, generation_time = reply
+            block = SharedMemory(name=name)
+            try:
+                with block.buf[:length] as data:
+                    stored_map = get_map_store().decode(get_ruleset(), data)
+            finally:
+                block.close()
+                block.unlink()
+            connection.send(("release", name))
+
+        if stored_map is None:
+            raise RuntimeError(f"WFC service sent map {seed} in another format")
+        return stored_map, generation_time
+
+    def close(self):
+        """ stops the service if this client started it """
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+    @staticmethod
+    def listening(address: str, authkey: bytes) -> bool:
+        """ whether a service with the same key answers on the address """
+        try:
+            Client(address, authkey=authkey).close()
+            return True
+        except (OSError, EOFError, multiprocessing.AuthenticationError):
+            return False
+
+
+if __name__ == "__main__":
+    # a service shared by all servers on the host, started by hand
+    run_service(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -1,10 +1,47 @@
+from random import Random
+from typing import Union
+
 from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_array_generator import WFCArrayGridGenerator
+from server.wfc.wfc_chunked_generator import WFCChunkedGridGenerator
 from server.wfc.wfc_generator import WFCGridGenerator
 from server.wfc.wfc_map import WFCMap
+from server.wfc.wfc_map_store import WFCMapStore, StoredMap, get_map_store
+from server.wfc.wfc_ruleset import get_ruleset
+
+# maps at least this big are generated on numpy arrays, for smaller ones the array overhead does not pay off
+ARRAY_GENERATOR_MIN_SIZE = 32
+# maps at least this big are split into regions solved in parallel
+CHUNKED_GENERATOR_MIN_SIZE = 256
+
+
+def start_wfc(size: int, players_count: int, seed: Union[int, None] = None, store: Union[WFCMapStore, None] = None):
+    """ tiles of the map ready to be built and player positions, see get_map """
+    return WFCMap.to_image_grid(size, *get_map(size, players_count, seed, store))
+
+
+def get_map(size: int, players_count: int, seed: Union[int, None] = None,
+            store: Union[WFCMapStore, None] = None) -> StoredMap:
+    """
+    the same seed, size and ruleset always give the same map, no seed gives a random one;
+    maps with a seed are taken from the map store if it has them, and put there otherwise
+    """
+    ruleset = get_ruleset()
+    store = store if store is not None else get_map_store()
+    stored_map = store.load(ruleset, size, players_count, seed) if seed is not None else None
 
+    if stored_map is None:
+        tiles_manager = TilesManager(Random(seed))
+        if size >= CHUNKED_GENERATOR_MIN_SIZE:
+            generator = WFCChunkedGridGenerator(tiles_manager, ruleset)
+        elif size >= ARRAY_GENERATOR_MIN_SIZE:
+            generator = WFCArrayGridGenerator(tiles_manager, ruleset)
+        else:
+            generator = WFCGridGenerator(tiles_manager, ruleset)
+        stored_map = WFCMap(generator, tiles_manager).generate(size, players_count)
+        if seed is not None:
+            store.save(ruleset, size, players_count, seed, stored_map)
+    else:
+        print(f"  --   [WFC] map {seed} loaded from the store")
 
-def start_wfc(size: int, players_count: int):
-    tiles_manager = TilesManager()
-    generator = WFCGridGenerator(tiles_manager)
-    wfc_map = WFCMap(generator, tiles_manager)
-    return wfc_map.build_image_grid(size, players_count)
+    return stored_map
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class WFCStats:
+    restarts: int = 0
+    backtracks: int = 0
+    repairs: int = 0
+    # cells narrowed by propagation
+    propagations: int = 0
+
+
+@dataclass
+class WFCMapPoolStats:
+    # resets that found a ready map and resets that had to generate one
+    hits: int = 0
+    misses: int = 0
+    generated: int = 0
+    total_generation_time: float = 0.0
+    last_generation_time: float = 0.0
+
+    def add_generation_time(self, generation_time: float):
+        self.generated += 1
+        self.total_generation_time += generation_time
+        self.last_generation_time = generation_time
+
+    def mean_generation_time(self) -> float:
+        return self.total_generation_time / self.generated if self.generated > 0 else 0.0
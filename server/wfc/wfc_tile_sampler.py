@@ -0,0 +1,65 @@
+from bisect import bisect
+from collections import OrderedDict
+from itertools import accumulate
+from random import Random
+
+import numpy as np
+
+# tile indices of a domain, their cumulative weights, and cumulative weights over all tiles
+# (flat where a tile is not in the domain) for batched draws
+SamplerTable = tuple[list[int], list[float], np.ndarray]
+
+
+class WFCTileSampler:
+    """
+    Weighted draws of a tile from a domain, with cumulative weights cached for every domain
+    signature (its bitmask) - the same domains come up again and again while collapsing,
+    so most draws are a single bisect. Least recently used tables are evicted over max_tables.
+    A draw takes one random number and picks the same tile as Random.choices with tile weights.
+    """
+
+    def __init__(self, weights: np.ndarray, max_tables: int = 4096):
+        self.weights = weights
+        self.max_tables = max_tables
+        self.tables: OrderedDict[int, SamplerTable] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def draw(self, domain: int, rng: Random) -> int:
+        """ index of a tile from a nonempty domain """
+        indices, cumulative, _ = self.get_table(domain)
+        return indices[bisect(cumulative, rng.random() * cumulative[-1], 0, len(indices) - 1)]
+
+    def draw_batch(self, domains: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """ index of a tile for every row of a (cells, chunks) uint8 array of nonempty domains """
+        signatures, inverse = np.unique(domains, axis=0, return_inverse=True)
+        rows = np.stack([self.get_table(int.from_bytes(signature.tobytes(), "little"))[2]
+                         for signature in signatures])
+        cumulative = rows[inverse.ravel()]
+        thresholds = rng.random(len(domains)) * cumulative[:, -1]
+        return (cumulative <= thresholds[:, None]).sum(axis=1)
+
+    def get_table(self, domain: int) -> SamplerTable:
+        table = self.tables.get(domain)
+        if table is not None:
+            self.hits += 1
+            self.tables.move_to_end(domain)
+            return table
+
+        self.misses += 1
+        indices = []
+        mask = domain
+        while mask:
+            low_bit = mask & -mask
+            indices.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        allowed = np.zeros(len(self.weights))
+        allowed[indices] = 1.0
+        table = (indices, list(accumulate(self.weights[indices].tolist())), np.cumsum(allowed * self.weights))
+        self.tables[domain] = table
+        if len(self.tables) > self.max_tables:
+            self.tables.popitem(last=False)
+        return table
+
+    def clear(self):
+        self.tables.clear()
@@ -0,0 +1,106 @@
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Union
+
+from common.tiles.tiles_manager import TilesManager
+from server.wfc.wfc_generator import WFCGridGenerator
+from server.wfc.wfc_observer import WFCObserver, CellState
+from server.wfc.wfc_ruleset import get_ruleset
+
+# one event of a trace, "event" names it and "time" is seconds since recording started
+TraceEvent = dict[str, any]
+
+
+class WFCTraceRecorder(WFCObserver):
+    """
+    Keeps events of a generation to be saved as JSON lines - one event per line, so that a trace
+    can be read while a long generation is still being written
+    """
+
+    def __init__(self, path: Union[Path, None] = None):
+        self.path = path
+        self.events: list[TraceEvent] = []
+        self.__start = perf_counter()
+        self.__file = path.open("w") if path is not None else None
+
+    def close(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def add(self, event: str, **fields):
+        fields = {"event": event, "time": perf_counter() - self.__start, **fields}
+        self.events.append(fields)
+        if self.__file is not None:
+            self.__file.write(json.dumps(fields) + "\n")
+
+    def on_attempt(self, size: int, players_positions: [tuple[int, int]]):
+        self.add("attempt", size=size, players=players_positions)
+
+    def on_collapse(self, position: tuple[int, int], tile: str, duration: float):
+        self.add("collapse", cell=position, tile=tile, duration=duration)
+
+    def on_propagate(self, position: tuple[int, int], updated: [tuple[int, int]], depth: int, duration: float):
+        self.add("propagate", cell=position, updated=updated, depth=depth, duration=duration)
+
+    def on_contradiction(self, position: tuple[int, int], reason: str):
+        self.add("contradiction", cell=position, reason=reason)
+
+    def on_backtrack(self, position: tuple[int, int], undone: [CellState], duration: float):
+        self.add("backtrack", cell=position, undone=undone, duration=duration)
+
+    def on_done(self, duration: float):
+        self.add("done", duration=duration)
+
+
+def load_trace(path: Path) -> list[TraceEvent]:
+    with path.open() as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def to_folded(events: [TraceEvent]) -> [str]:
+    """
+    stacks in the folded format of flame graph tools with microseconds spent in them - attempts,
+    then kinds of events, propagations are split further by the number of waves they took
+    """
+    samples: dict[str, float] = defaultdict(float)
+    attempt = 0
+    for event in events:
+        if event["event"] == "attempt":
+            attempt += 1
+        if "duration" not in event or event["event"] == "done":
+            continue
+        stack = f"wfc;attempt {attempt};{event['event']}"
+        if event["event"] == "propagate":
+            stack += f";depth {event['depth']}"
+        samples[stack] += event["duration"]
+    return [f"{stack} {round(duration * 1e6)}" for stack, duration in samples.items() if duration > 0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="records and converts traces of map generation")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="generates a map with the cell generator and saves its trace")
+    record.add_argument("trace", type=Path)
+    record.add_argument("--size", type=int, default=10)
+    record.add_argument("--players", type=int, default=4)
+    record.add_argument("--seed", type=int, default=0)
+    folded = commands.add_parser("folded", help="prints a trace as folded stacks for flame graphs")
+    folded.add_argument("trace", type=Path)
+    arguments = parser.parse_args()
+
+    if arguments.command == "record":
+        recorder = WFCTraceRecorder(arguments.trace)
+        try:
+            WFCGridGenerator(TilesManager(Random(arguments.seed)), get_ruleset(), observer=recorder) \
+                .generate(arguments.size, arguments.players)
+        finally:
+            recorder.close()
+        print(f"[INFO] {len(recorder.events)} events written to {arguments.trace}", file=sys.stderr)
+    else:
+        print("\n".join(to_folded(load_trace(arguments.trace))))
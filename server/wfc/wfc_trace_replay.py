@@ -0,0 +1,80 @@
+from direct.task.Task import Task
+from direct.task.TaskManagerGlobal import taskMgr
+from panda3d.core import NodePath
+
+from common.tiles.tile_model_cache import TileModelCache
+from server.wfc.wfc_map import WFCMap
+from server.wfc.wfc_trace import TraceEvent
+
+
+class WFCTraceReplay:
+    """
+    Shows a recorded generation step by step in the debug window - tiles appear as cells collapse and
+    disappear when decisions are undone, collapsed cells a contradiction came from turn red. The map
+    built for the game is hidden while the replay runs.
+    """
+    CONTRADICTION_COLOR = (1, 0.2, 0.2, 1)
+
+    def __init__(self, render: NodePath, loader, events: [TraceEvent], season: int, steps_per_frame: int = 1):
+        self.render = render
+        self.loader = loader
+        self.events = events
+        self.season = season
+        self.steps_per_frame = steps_per_frame
+        self.tile_models = TileModelCache(loader)
+        self.position = 0
+        self.tiles: dict[tuple[int, int], NodePath] = {}
+        self.__root = render.attach_new_node("wfc replay")
+        self.__hidden = render.find("tiles")
+
+    def start(self):
+        if not self.__hidden.is_empty():
+            self.__hidden.hide()
+        taskMgr.add(self.__step, "replay wfc trace")
+
+    def stop(self):
+        taskMgr.remove("replay wfc trace")
+        self.__root.remove_node()
+        if not self.__hidden.is_empty():
+            self.__hidden.show()
+
+    def __step(self, task):
+        steps = 0
+        while self.position < len(self.events) and steps < self.steps_per_frame:
+            # only events that change what is shown take a step
+            steps += self.__apply(self.events[self.position])
+            self.position += 1
+        if self.position >= len(self.events):
+            print(f"[INFO] Replayed {len(self.events)} WFC events")
+            return Task.done
+        return Task.cont
+
+    def __apply(self, event: TraceEvent) -> bool:
+        match event["event"]:
+            case "attempt":
+                for position in list(self.tiles.keys()):
+                    self.__set_tile(position, None)
+                return True
+            case "collapse":
+                self.__set_tile(tuple(event["cell"]), event["tile"])
+                return True
+            case "backtrack":
+                for position, tile in event["undone"]:
+                    self.__set_tile(tuple(position), tile)
+                return True
+            case "contradiction":
+                tile = self.tiles.get(tuple(event["cell"]))
+                if tile is not None:
+                    tile.set_color_scale(*self.CONTRADICTION_COLOR)
+                return True
+        return False
+
+    def __set_tile(self, position: tuple[int, int], tile_name):
+        tile = self.tiles.pop(position, None)
+        if tile is not None:
+            tile.remove_node()
+        if tile_name is None:
+            return
+        image = WFCMap.to_image(tile_name, *position)
+        self.tiles[position] = self.tile_models.place(self.__root, image["node_path"], image["pos"], image["heading"],
+                                                      self.season)